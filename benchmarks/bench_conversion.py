@@ -0,0 +1,68 @@
+"""
+Compare per-row and batch conversion of stats pages into JSON-ready records.
+
+Usage:
+    uv run python benchmarks/bench_conversion.py [--rows 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Type
+
+import pandas as pd
+from pydantic import BaseModel
+
+from mlb_mcp_server.convert import convert_records
+from mlb_mcp_server.fields import field_plan
+from mlb_mcp_server.models import BattingStats
+
+FIXTURE = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "batting_stats_fixture.json"
+)
+
+
+def per_row(model_cls: Type[BaseModel], df: pd.DataFrame) -> List[Dict]:
+    """The previous conversion path: one validate/dump round-trip per row."""
+    models = [model_cls.model_validate(row) for row in df.to_dict("records")]
+    return [m.model_dump(mode="json", exclude_none=True) for m in models]
+
+
+def rows_per_second(
+    convert: Callable[[Type[BaseModel], pd.DataFrame], List[Dict]],
+    model_cls: Type[BaseModel],
+    df: pd.DataFrame,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(model_cls, df)
+        best = min(best, time.perf_counter() - start)
+    return len(df) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(FIXTURE, "r") as f:
+        base = pd.DataFrame(json.load(f))
+    df = pd.concat([base] * (args.rows // len(base) + 1), ignore_index=True)
+    df = df.iloc[: args.rows]
+
+    print(f"{'fields':<10} {'per-row rows/s':>16} {'batch rows/s':>14} {'speedup':>8}")
+    for fields in ("all", "basic", "advanced"):
+        plan = field_plan(BattingStats, fields)
+        model = plan.model
+        page_df = df[plan.columns(df.columns)]
+        old = rows_per_second(per_row, model, page_df, args.repeat)
+        new = rows_per_second(convert_records, model, page_df, args.repeat)
+        print(f"{fields:<10} {old:>16,.0f} {new:>14,.0f} {new / old:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
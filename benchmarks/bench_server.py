@@ -0,0 +1,250 @@
+"""
+Measure throughput of the paginated stats tools against a stored baseline.
+
+Drives batting_stats_by_year (the _fetch_stats_by_year path), field
+projection on its own, and standings_by_year over the JSON fixtures and
+synthetic seasons of 10k and 100k rows. For each case it reports the best,
+median and p95 latency of a warm (cached) call, rows/sec converted, and the
+peak memory allocated during one call as traced by tracemalloc. "cold" cases
+time a first request against an empty season cache instead.
+
+Usage:
+    uv run python benchmarks/bench_server.py [--rows 10000 100000] [--repeat 7]
+    uv run python benchmarks/bench_server.py --save-baseline
+
+A run compares its best latencies with benchmarks/baseline.json (when it
+exists) and exits with status 1 if any case is slower than the baseline by
+more than --tolerance (50% by default). The best of several runs is far
+less sensitive to scheduler noise than the median, but on shared or
+single-core machines run-to-run variance can still approach that; tighten
+the tolerance on quiet hardware. Baselines are machine-specific: regenerate
+one with --save-baseline on the machine the comparison runs on.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+import pandas as pd
+from synthetic import load_fixture, synthetic_batting
+
+from mlb_mcp_server.cache import season_cache
+from mlb_mcp_server.fields import field_plan
+from mlb_mcp_server.models import BattingStats
+from mlb_mcp_server.offload import conversion_pool
+from mlb_mcp_server.server import batting_stats_by_year, standings_by_year
+from mlb_mcp_server.store import season_store
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+PRESETS = ("basic", "advanced", "all")
+PAGE_SIZES = (10, 100, 1000)
+SORTS = (None, "WAR")
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]],
+    rows: int,
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> Dict[str, float]:
+    """
+    Time repeat calls, then trace allocations of one more call.
+
+    Without setup, a first untimed call fills caches and lazily built indexes
+    so the timed calls are warm. setup, when given, runs before every call.
+    """
+    if setup is None:
+        await call()
+
+    # Like timeit, keep collector pauses out of the timings
+    gc.collect()
+    gc.disable()
+    timings = []
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            await call()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    await call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    timings.sort()
+    return {
+        "best_ms": round(timings[0] * 1000, 3),
+        "median_ms": round(median * 1000, 3),
+        "p95_ms": round(
+            timings[min(int(0.95 * len(timings)), len(timings) - 1)] * 1000, 3
+        ),
+        "rows_per_sec": round(rows / median) if median > 0 else 0,
+        "peak_alloc_kib": round(peak / 1024, 1),
+    }
+
+
+async def bench_stats_by_year(
+    df: pd.DataFrame, label: str, repeat: int
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    with patch("mlb_mcp_server.server.batting_stats", return_value=df):
+        for sort_by in SORTS:
+            # Cold call: season wrap, ordering and conversion from scratch
+            results[f"stats_by_year/{label}/cold/sort={sort_by}"] = await measure(
+                lambda: batting_stats_by_year(2023, page_size=10, sort_by=sort_by),
+                len(df),
+                repeat,
+                setup=season_cache.clear,
+            )
+
+            for fields in PRESETS:
+                for page_size in PAGE_SIZES:
+                    key = f"stats_by_year/{label}/{fields}/page={page_size}/sort={sort_by}"
+                    results[key] = await measure(
+                        lambda: batting_stats_by_year(
+                            2023, page_size=page_size, fields=fields, sort_by=sort_by
+                        ),
+                        min(page_size, len(df)),
+                        repeat,
+                    )
+    return results
+
+
+async def bench_projection(
+    df: pd.DataFrame, label: str, repeat: int
+) -> Dict[str, Dict[str, float]]:
+    """The former _filter_fields step: field plan and column selection."""
+    results = {}
+    for fields in PRESETS:
+        page = df.iloc[:100]
+
+        async def project() -> pd.DataFrame:
+            plan = field_plan(BattingStats, fields)
+            return page[plan.columns(page.columns)]
+
+        results[f"projection/{label}/{fields}/page=100"] = await measure(
+            project, len(page), repeat
+        )
+    return results
+
+
+async def bench_standings(repeat: int) -> Dict[str, Dict[str, float]]:
+    divisions = [pd.DataFrame(d) for d in load_fixture("standings_fixture")]
+    with patch("mlb_mcp_server.server.standings", return_value=divisions):
+        return {
+            "standings_by_year/fixture": await measure(
+                lambda: standings_by_year(2023), 30, repeat
+            )
+        }
+
+
+async def run(rows: List[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    fixture = pd.DataFrame(load_fixture("batting_stats_fixture"))
+    results.update(await bench_stats_by_year(fixture, "fixture", repeat))
+    results.update(await bench_standings(repeat))
+
+    for count in rows:
+        df = synthetic_batting(count)
+        label = f"{count // 1000}k"
+        results.update(await bench_stats_by_year(df, label, repeat))
+        results.update(await bench_projection(df, label, repeat))
+        season_cache.clear()
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Return the cases whose best latency regressed beyond tolerance."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None or base["best_ms"] <= 0:
+            continue
+        ratio = result["best_ms"] / base["best_ms"]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{key}: {base['best_ms']:.3f} ms -> {result['best_ms']:.3f} ms "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def print_table(results: Dict[str, Dict[str, float]]) -> None:
+    print(
+        f"{'case':<58} {'best ms':>9} {'median ms':>10} {'p95 ms':>10} "
+        f"{'rows/s':>12} {'peak KiB':>10}"
+    )
+    for key, r in results.items():
+        print(
+            f"{key:<58} {r['best_ms']:>9.3f} {r['median_ms']:>10.3f} "
+            f"{r['p95_ms']:>10.3f} {r['rows_per_sec']:>12,.0f} "
+            f"{r['peak_alloc_kib']:>10,.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="*", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args()
+
+    # Measure in-memory behaviour only
+    season_store.root = None
+
+    try:
+        results = asyncio.run(run(args.rows, args.repeat))
+    finally:
+        conversion_pool.shutdown()
+
+    print_table(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nSaved baseline to {args.baseline}")
+        return
+
+    baseline: Optional[Dict[str, Dict[str, float]]] = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    if baseline is None:
+        print("\nNo baseline to compare against; run with --save-baseline")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
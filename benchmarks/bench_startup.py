@@ -0,0 +1,121 @@
+"""
+Measure how long the server takes to answer the MCP initialize handshake.
+
+Launches the server over stdio several times, sends initialize and times the
+reply from process start. The server runs with MLB_MCP_STARTUP_TIMING=1; its
+report of the last launch (module import, server start, pybaseball import in
+the background) is printed as well. With --tool, the last launch also calls
+that tool once and reports the first-call latency, which fetches from the
+network unless the season is in the on-disk store.
+
+Usage:
+    uv run python benchmarks/bench_startup.py [--repeat 5]
+    uv run python benchmarks/bench_startup.py --tool standings_by_year \\
+        --arguments '{"year": 2023}'
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import IO, Any, Dict, Optional, Tuple
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+def send(stdin: IO[str], message: Dict[str, Any]) -> None:
+    stdin.write(json.dumps({"jsonrpc": "2.0", **message}) + "\n")
+    stdin.flush()
+
+
+def launch(
+    tool: Optional[str], arguments: Dict[str, Any], wait: float = 0.0
+) -> Tuple[float, str]:
+    """
+    Start the server, time the handshake and return it with the stderr report.
+
+    The server is stopped after the tool call, or after wait seconds without
+    one so its background pybaseball import can report.
+    """
+    env = {
+        **os.environ,
+        "MLB_MCP_STARTUP_TIMING": "1",
+        # Keep the background warm-up from competing with the handshake
+        "MLB_MCP_WARMUP_SEASONS": "0",
+    }
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "mlb_mcp_server.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True,
+    )
+    assert server.stdin is not None and server.stdout is not None
+    send(
+        server.stdin,
+        {
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "0"},
+            },
+        },
+    )
+    server.stdout.readline()
+    handshake = time.perf_counter() - start
+
+    send(server.stdin, {"method": "notifications/initialized"})
+    if tool is not None:
+        send(
+            server.stdin,
+            {
+                "id": 2,
+                "method": "tools/call",
+                "params": {"name": tool, "arguments": arguments},
+            },
+        )
+        server.stdout.readline()
+    else:
+        time.sleep(wait)
+
+    # Closing stdin ends the session and shuts the server down
+    _, report = server.communicate(timeout=30)
+    return handshake, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tool", help="tool to call once after the last handshake")
+    parser.add_argument("--arguments", default="{}", help="tool arguments as JSON")
+    args = parser.parse_args()
+
+    timings = []
+    report = ""
+    for attempt in range(args.repeat):
+        last = attempt == args.repeat - 1
+        handshake, report = launch(
+            args.tool if last else None,
+            json.loads(args.arguments),
+            wait=2.0 if last else 0.0,
+        )
+        timings.append(handshake)
+
+    print(
+        f"initialize answered after: best {min(timings) * 1000:.0f} ms, "
+        f"median {statistics.median(timings) * 1000:.0f} ms "
+        f"over {len(timings)} launches"
+    )
+    print("\nServer report of the last launch:")
+    print(report.strip())
+
+
+if __name__ == "__main__":
+    main()
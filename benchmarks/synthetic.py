@@ -0,0 +1,61 @@
+"""
+Synthetic seasons shaped like the pybaseball fixtures, at any size.
+
+Rows are sampled from the fixture and their stats jittered, so every column
+keeps the fixture's dtype and missing-value pattern while sorting, filtering
+and conversion see realistic, varied values.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BOS", "CHC", "CHW", "CIN", "CLE", "COL", "DET",
+    "HOU", "KCR", "LAA", "LAD", "MIA", "MIL", "MIN", "NYM", "NYY", "OAK",
+    "PHI", "PIT", "SDP", "SEA", "SFG", "STL", "TBR", "TEX", "TOR", "WSN",
+]  # fmt: skip
+
+# Columns that identify a row rather than measure anything
+_FIXED_COLUMNS = {"IDfg", "Season"}
+
+
+def load_fixture(name: str) -> list:
+    """Load one of the JSON test fixtures by file stem."""
+    with open(FIXTURES / f"{name}.json", "r") as f:
+        return json.load(f)
+
+
+def synthetic_batting(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Return a batting_stats-shaped season with the given number of rows.
+
+    Args:
+        rows: Number of player rows to generate
+        seed: Random seed, so runs are comparable
+
+    Returns:
+        DataFrame with the fixture's columns and dtypes, unique IDfg values,
+        distinct names and players spread over all 30 teams
+    """
+    base = pd.DataFrame(load_fixture("batting_stats_fixture"))
+    rng = np.random.default_rng(seed)
+
+    df = base.iloc[rng.integers(0, len(base), rows)].reset_index(drop=True)
+    for column in df.columns:
+        if column in _FIXED_COLUMNS or not pd.api.types.is_numeric_dtype(df[column]):
+            continue
+        scaled = df[column].to_numpy(dtype=float) * rng.uniform(0.5, 1.5, rows)
+        if pd.api.types.is_integer_dtype(df[column]):
+            df[column] = np.rint(scaled).astype(df[column].dtype)
+        else:
+            df[column] = scaled
+
+    df["IDfg"] = np.arange(1, rows + 1)
+    df["Name"] = [f"Player {i:06d}" for i in range(rows)]
+    df["Team"] = [TEAMS[i % len(TEAMS)] for i in range(rows)]
+    return df
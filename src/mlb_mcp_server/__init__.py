@@ -0,0 +1,6 @@
+"""MCP server for MLB statistics."""
+
+import time
+
+# When the package was first imported; startup timings are measured from here
+IMPORTED_AT = time.perf_counter()
@@ -0,0 +1,123 @@
+"""Team totals aggregated from player-level season data."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+# Counting stats summed per team
+BATTING_TOTALS = [
+    "PA",
+    "AB",
+    "H",
+    "1B",
+    "2B",
+    "3B",
+    "HR",
+    "R",
+    "RBI",
+    "BB",
+    "IBB",
+    "SO",
+    "HBP",
+    "SF",
+    "SH",
+    "GDP",
+    "SB",
+    "CS",
+    "WAR",
+]
+PITCHING_TOTALS = [
+    "W",
+    "L",
+    "GS",
+    "SV",
+    "TBF",
+    "H",
+    "R",
+    "ER",
+    "HR",
+    "BB",
+    "IBB",
+    "HBP",
+    "SO",
+    "WAR",
+]
+
+_BATTING_RATES = ["AVG", "OBP", "SLG", "OPS", "ISO", "BB%", "K%"]
+_PITCHING_RATES = ["ERA", "WHIP", "K/9", "BB/9", "HR/9"]
+
+# FanGraphs lists players who played for several teams in a season under
+# this team, with no per-team split of their stats
+MULTI_TEAM = "- - -"
+
+
+def innings_to_outs(ip: pd.Series) -> pd.Series:
+    """Convert innings in baseball notation (6.1 = 6 1/3 innings) to outs."""
+    ip = pd.to_numeric(ip, errors="coerce").fillna(0.0)
+    whole = np.floor(ip)
+    return whole * 3 + ((ip - whole) * 10).round()
+
+
+def outs_to_innings(outs: pd.Series) -> pd.Series:
+    """Convert outs back to innings in baseball notation."""
+    return outs // 3 + (outs % 3) / 10
+
+
+def _ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """Divide column-wise, leaving NaN where the denominator is zero."""
+    return (numerator / denominator.where(denominator != 0)).astype(float)
+
+
+def team_totals(df: pd.DataFrame, totals: List[str]) -> pd.DataFrame:
+    """
+    Sum player rows by Team in a single groupby pass.
+
+    Counting columns missing from df are skipped, and missing values count
+    as zero. IP is summed as outs so partial innings add up correctly.
+    Players listed under MULTI_TEAM are left out.
+
+    Returns:
+        One row per team, ordered by Team, with a Players column counting
+        the player rows summed
+    """
+    df = df[df["Team"] != MULTI_TEAM]
+    columns = [c for c in totals if c in df.columns]
+    values = df[columns].apply(pd.to_numeric, errors="coerce")
+    if "IP" in df.columns:
+        values["outs"] = innings_to_outs(df["IP"])
+
+    grouped = values.groupby(df["Team"], sort=True)
+    summed = grouped.sum()
+    summed.insert(0, "Players", grouped.size())
+    return summed.reset_index()
+
+
+def batting_rates(totals: pd.DataFrame) -> pd.DataFrame:
+    """Add AVG, OBP, SLG, OPS, ISO, BB% and K% computed from summed totals."""
+    bases = totals["H"] + totals["2B"] + 2 * totals["3B"] + 3 * totals["HR"]
+    on_base = totals["H"] + totals["BB"] + totals.get("HBP", 0)
+    chances = totals["AB"] + totals["BB"] + totals.get("HBP", 0) + totals.get("SF", 0)
+
+    totals["AVG"] = _ratio(totals["H"], totals["AB"])
+    totals["OBP"] = _ratio(on_base, chances)
+    totals["SLG"] = _ratio(bases, totals["AB"])
+    totals["OPS"] = totals["OBP"] + totals["SLG"]
+    totals["ISO"] = totals["SLG"] - totals["AVG"]
+    totals["BB%"] = _ratio(totals["BB"], totals["PA"])
+    totals["K%"] = _ratio(totals["SO"], totals["PA"])
+    return totals.round({"WAR": 1, **dict.fromkeys(_BATTING_RATES, 3)})
+
+
+def pitching_rates(totals: pd.DataFrame) -> pd.DataFrame:
+    """Add IP, ERA, WHIP, K/9, BB/9 and HR/9 computed from summed totals."""
+    outs = totals.pop("outs")
+    innings = outs / 3
+
+    totals["IP"] = outs_to_innings(outs)
+    totals["ERA"] = 9 * _ratio(totals["ER"], innings)
+    totals["WHIP"] = _ratio(totals["BB"] + totals["H"], innings)
+    totals["K/9"] = 9 * _ratio(totals["SO"], innings)
+    totals["BB/9"] = 9 * _ratio(totals["BB"], innings)
+    totals["HR/9"] = 9 * _ratio(totals["HR"], innings)
+    return totals.round({"IP": 1, "WAR": 1, **dict.fromkeys(_PITCHING_RATES, 2)})
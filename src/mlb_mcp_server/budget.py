@@ -0,0 +1,44 @@
+"""Fit a page of rows into a serialized size budget."""
+
+from typing import Any, Sequence
+
+import pydantic_core
+
+# Tool results reach the client as JSON text indented by two spaces, with each
+# row nested two levels deep ({"data": [row, ...]} or {"rows": [row, ...]})
+INDENT = 2
+ROW_DEPTH = 2
+
+
+def serialized_size(value: Any, depth: int = 0) -> int:
+    """Return the size in bytes of value serialized as indented JSON at depth."""
+    text = pydantic_core.to_json(value, indent=INDENT)
+    return len(text) + text.count(b"\n") * INDENT * depth
+
+
+def row_size(row: Any) -> int:
+    """Return the bytes a row adds to a page: itself, its line break and comma."""
+    return serialized_size(row, ROW_DEPTH) + INDENT * ROW_DEPTH + 2
+
+
+def estimate_rows(sample: Sequence[Any], budget: int, limit: int) -> int:
+    """
+    Estimate how many rows fit in budget bytes from a sample of those rows.
+
+    The estimate is capped at limit and is at least one, so a page always
+    makes progress even when a single row exceeds the budget.
+    """
+    if not sample:
+        return min(1, limit)
+    per_row = sum(row_size(row) for row in sample) / len(sample)
+    return max(1, min(limit, int(budget // per_row)))
+
+
+def rows_within_budget(rows: Sequence[Any], budget: int) -> int:
+    """Return how many leading rows fit in budget bytes (at least one)."""
+    used = 0
+    for count, row in enumerate(rows):
+        used += row_size(row)
+        if used > budget:
+            return max(count, 1)
+    return len(rows)
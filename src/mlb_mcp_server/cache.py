@@ -0,0 +1,141 @@
+"""In-process cache for seasons fetched from pybaseball."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Hashable, Optional
+
+from mlb_mcp_server.constants import (
+    COMPLETED_SEASON_TTL_SECONDS,
+    CURRENT_SEASON_MAX_STALE_SECONDS,
+    CURRENT_SEASON_TTL_SECONDS,
+    SEASON_CACHE_MAX_BYTES,
+    SEASON_CACHE_MAX_ENTRIES,
+)
+from mlb_mcp_server.season import Season
+
+
+def is_current_season(year: int) -> bool:
+    """Return True if the season may still change (this year or later)."""
+    return year >= date.today().year
+
+
+def season_ttl(year: int) -> float:
+    """Return the cache lifetime in seconds for a season's data."""
+    if is_current_season(year):
+        return CURRENT_SEASON_TTL_SECONDS
+    return COMPLETED_SEASON_TTL_SECONDS
+
+
+def season_max_stale(year: int) -> float:
+    """Return how long past its TTL a season may be served while refreshing."""
+    if is_current_season(year):
+        return CURRENT_SEASON_MAX_STALE_SECONDS
+    return 0.0
+
+
+@dataclass
+class _CacheEntry:
+    season: Season
+    fresh_until: float
+    expires_at: float
+    nbytes: int
+
+
+class SeasonCache:
+    """
+    LRU cache of seasons with per-entry TTL and a memory budget.
+
+    Keys are typically (stats function, year) tuples. Once either the entry
+    count or the total in-memory size of the cached seasons exceeds its bound,
+    the least recently used entries are evicted.
+
+    An entry is fresh for its ttl. If it was stored with max_stale, it is kept
+    for that much longer as a stale fallback that only get_stale returns, so a
+    caller can serve it while a refresh runs.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SEASON_CACHE_MAX_ENTRIES,
+        max_bytes: int = SEASON_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Total memory footprint of the cached seasons in bytes."""
+        return self._nbytes
+
+    def get(self, key: Hashable) -> Optional[Season]:
+        """Return the cached season for key, or None if missing or not fresh."""
+        entry = self._lookup(key)
+        if entry is None or entry.fresh_until <= self._clock():
+            return None
+        return entry.season
+
+    def get_stale(self, key: Hashable) -> Optional[Season]:
+        """Return the cached season for key even if stale, or None if expired."""
+        entry = self._lookup(key)
+        return None if entry is None else entry.season
+
+    def put(
+        self, key: Hashable, season: Season, ttl: float, max_stale: float = 0.0
+    ) -> None:
+        """
+        Cache season under key for ttl seconds, evicting LRU entries as needed.
+
+        The season can be served stale through get_stale for max_stale more
+        seconds after it stops being fresh.
+        """
+        nbytes = season.nbytes
+        if key in self._entries:
+            self._remove(key)
+        if nbytes > self.max_bytes:
+            # Never cache a season that alone would blow the memory budget
+            return
+
+        fresh_until = self._clock() + ttl
+        self._entries[key] = _CacheEntry(
+            season, fresh_until, fresh_until + max_stale, nbytes
+        )
+        self._nbytes += nbytes
+
+        while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _lookup(self, key: Hashable) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
+
+
+# Shared cache used by the MCP tools
+season_cache = SeasonCache()
@@ -1,5 +1,8 @@
 """Constants and configuration for MLB MCP Server."""
 
+import os
+from pathlib import Path
+
 DIVISION_NAMES = [
     "AL East",
     "AL Central",
@@ -9,6 +12,53 @@ DIVISION_NAMES = [
     "NL West",
 ]
 
+# Baseball-Reference team names (standings "Tm") to FanGraphs teamIDfg, which
+# stays the same across a franchise's renames and relocations
+BREF_TEAM_IDS = {
+    "Los Angeles Angels": 1,
+    "Los Angeles Angels of Anaheim": 1,
+    "Anaheim Angels": 1,
+    "California Angels": 1,
+    "Baltimore Orioles": 2,
+    "Boston Red Sox": 3,
+    "Chicago White Sox": 4,
+    "Cleveland Guardians": 5,
+    "Cleveland Indians": 5,
+    "Detroit Tigers": 6,
+    "Kansas City Royals": 7,
+    "Minnesota Twins": 8,
+    "New York Yankees": 9,
+    "Athletics": 10,
+    "Oakland Athletics": 10,
+    "Seattle Mariners": 11,
+    "Tampa Bay Rays": 12,
+    "Tampa Bay Devil Rays": 12,
+    "Texas Rangers": 13,
+    "Toronto Blue Jays": 14,
+    "Arizona Diamondbacks": 15,
+    "Atlanta Braves": 16,
+    "Chicago Cubs": 17,
+    "Cincinnati Reds": 18,
+    "Colorado Rockies": 19,
+    "Miami Marlins": 20,
+    "Florida Marlins": 20,
+    "Houston Astros": 21,
+    "Los Angeles Dodgers": 22,
+    "Milwaukee Brewers": 23,
+    "Washington Nationals": 24,
+    "Montreal Expos": 24,
+    "New York Mets": 25,
+    "Philadelphia Phillies": 26,
+    "Pittsburgh Pirates": 27,
+    "St. Louis Cardinals": 28,
+    "San Diego Padres": 29,
+    "San Francisco Giants": 30,
+}
+
+# Default team_report field lists
+TEAM_REPORT_BATTING_FIELDS = "R,HR,AVG,OBP,SLG,wRC+,WAR"
+TEAM_REPORT_PITCHING_FIELDS = "ERA,FIP,WHIP,K/9,BB/9,WAR"
+
 # Identity fields always included in filtered results
 PLAYER_IDENTITY_FIELDS = ["IDfg", "Season"]
 TEAM_IDENTITY_FIELDS = ["teamIDfg", "Season"]
@@ -219,3 +269,75 @@ IDENTITY_FIELD_MAP = {
     "TeamBattingStats": TEAM_IDENTITY_FIELDS,
     "TeamPitchingStats": TEAM_IDENTITY_FIELDS,
 }
+
+# In-process season cache bounds
+SEASON_CACHE_MAX_ENTRIES = 64
+SEASON_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Cache lifetimes: completed seasons never change, the current one changes daily
+COMPLETED_SEASON_TTL_SECONDS = 7 * 24 * 60 * 60
+CURRENT_SEASON_TTL_SECONDS = 15 * 60
+
+# How long a current season past its TTL may still be served while a single
+# background refresh replaces it (stale-while-revalidate)
+CURRENT_SEASON_MAX_STALE_SECONDS = 24 * 60 * 60
+
+# Cursor pagination: how long an idle snapshot stays pinned, how many are kept,
+# and the memory the seasons they pin may hold on top of the season cache
+CURSOR_TTL_SECONDS = 30 * 60
+CURSOR_MAX_SNAPSHOTS = 128
+CURSOR_MAX_BYTES = 256 * 1024 * 1024
+
+# Byte-budgeted pages (max_bytes): rows sampled to estimate the serialized size
+# of a row, and the bytes reserved for the page counters and next_cursor.
+BUDGET_SAMPLE_ROWS = 16
+PAGE_ENVELOPE_BYTES = 192
+
+# Upstream sites scraped by pybaseball, with how many calls may run against each
+# at once. Calls beyond the limit wait in a priority queue of at most
+# UPSTREAM_MAX_QUEUE entries per site; further calls are rejected.
+FANGRAPHS = "fangraphs"
+BASEBALL_REFERENCE = "baseball-reference"
+UPSTREAM_CONCURRENCY = {FANGRAPHS: 4, BASEBALL_REFERENCE: 2}
+UPSTREAM_MAX_QUEUE = 32
+
+# batch_query: most sub-queries accepted in one call, and how many run at once
+BATCH_MAX_QUERIES = 50
+BATCH_CONCURRENCY = 8
+
+# Pages with at least this many cells (rows x columns) are converted to records
+# in a worker process so validation does not hold the event loop's GIL. Set
+# MLB_MCP_CONVERT_PROCESSES=0 to always convert in-process.
+CONVERT_PROCESSES = int(os.environ.get("MLB_MCP_CONVERT_PROCESSES", "2"))
+CONVERT_OFFLOAD_MIN_CELLS = 50_000
+
+# Startup warm-up: number of seasons (the current one and those before it) loaded
+# in the background for every data source. Set MLB_MCP_WARMUP_SEASONS=0 to disable.
+WARMUP_SEASONS = int(os.environ.get("MLB_MCP_WARMUP_SEASONS", "2"))
+
+# Seconds between scheduled prefetches of the warm seasons. Kept below
+# CURRENT_SEASON_TTL_SECONDS so the current season is refreshed before it
+# expires. Set MLB_MCP_PREFETCH_INTERVAL=0 to only warm up once at startup.
+PREFETCH_INTERVAL_SECONDS = float(os.environ.get("MLB_MCP_PREFETCH_INTERVAL", "600"))
+
+# Metrics: latency percentiles are computed over this many recent observations
+# per series. Set MLB_MCP_METRICS_FILE to also write them in Prometheus text
+# format every METRICS_DUMP_INTERVAL_SECONDS.
+METRICS_WINDOW = 1024
+METRICS_FILE = os.environ.get("MLB_MCP_METRICS_FILE", "")
+METRICS_DUMP_INTERVAL_SECONDS = 15.0
+
+# Set MLB_MCP_STARTUP_TIMING=1 to report import, startup and first-call latency
+# on stderr.
+STARTUP_TIMING = os.environ.get("MLB_MCP_STARTUP_TIMING", "0") == "1"
+
+# On-disk store for completed seasons. Set MLB_MCP_STORE_DIR to an empty string
+# to disable persistence.
+SEASON_STORE_DIR = os.environ.get(
+    "MLB_MCP_STORE_DIR",
+    str(
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / "mlb-mcp-server"
+        / "seasons"
+    ),
+)
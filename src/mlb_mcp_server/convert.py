@@ -0,0 +1,111 @@
+"""Batch conversion of DataFrame slices into JSON-ready records."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, get_args
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+
+@lru_cache(maxsize=256)
+def records_adapter(model_cls: Type[BaseModel]) -> TypeAdapter[List[Any]]:
+    """Return a cached TypeAdapter validating a whole list of model_cls rows."""
+    return TypeAdapter(List[model_cls])  # type: ignore[valid-type]
+
+
+def column_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Build row dicts from a DataFrame column by column.
+
+    Each column is converted to native Python values in a single tolist()
+    call, which is considerably cheaper than DataFrame.to_dict("records")
+    boxing every cell individually.
+    """
+    names = [str(name) for name in df.columns]
+    columns = [df[name].tolist() for name in df.columns]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def convert_records(model_cls: Type[BaseModel], df: pd.DataFrame) -> List[Dict]:
+    """
+    Validate a DataFrame slice against model_cls and dump it in one pass.
+
+    Values are extracted column-wise and the whole slice goes through a single
+    list-level validator and serializer instead of one model_validate and
+    model_dump round-trip per row, which keeps the per-row work inside
+    pydantic-core.
+
+    Args:
+        model_cls: Pydantic model class (full or projected) to validate against
+        df: DataFrame whose columns match the model's aliases or field names
+
+    Returns:
+        List of JSON-compatible dicts keyed by model attribute name
+    """
+    adapter = records_adapter(model_cls)
+    models = adapter.validate_python(column_records(df))
+    return adapter.dump_python(models, mode="json", exclude_none=True)
+
+
+def _field_type(info: FieldInfo) -> Optional[type]:
+    """Return int or float for (optional) numeric fields, None otherwise."""
+    annotation = info.annotation
+    if annotation in (int, float):
+        return annotation
+    args = set(get_args(annotation)) - {type(None)}
+    if len(args) == 1 and args <= {int, float}:
+        return args.pop()
+    return None
+
+
+def _column_values(series: pd.Series, info: FieldInfo) -> List[Any]:
+    """Convert one column to native values, with None for missing values."""
+    field_type = _field_type(info)
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.to_numpy(dtype=float)
+        missing = ~np.isfinite(values)
+        if field_type is int:
+            # Integer stats arrive as floats when the column has gaps
+            cells: List[Any] = np.where(missing, 0, values).astype(np.int64).tolist()
+        else:
+            cells = values.tolist()
+        if missing.any():
+            for position in np.flatnonzero(missing).tolist():
+                cells[position] = None
+        return cells
+    if field_type is float and pd.api.types.is_integer_dtype(series.dtype):
+        # Match validation, which turns integral values of float fields into floats
+        return series.to_numpy(dtype=float).tolist()
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+
+def columnar_records(model_cls: Type[BaseModel], df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Convert a DataFrame slice to a compact column-oriented payload.
+
+    Values are taken straight from each column with one tolist() call rather
+    than validated row by row, and every field name appears once instead of
+    once per record. Columns are the model's attribute names in field order,
+    matching the keys of convert_records; missing values become None.
+
+    Args:
+        model_cls: Pydantic model class (full or projected) naming the fields
+        df: DataFrame whose columns match the model's aliases or field names
+
+    Returns:
+        {"columns": [field names], "rows": [[values], ...]}
+    """
+    available = set(df.columns)
+    names = []
+    columns = []
+    for name, info in model_cls.model_fields.items():
+        column = info.alias if info.alias in available else name
+        if column not in available:
+            continue
+        names.append(name)
+        columns.append(_column_values(df[column], info))
+    return {"columns": names, "rows": [list(row) for row in zip(*columns)]}
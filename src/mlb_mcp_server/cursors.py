@@ -0,0 +1,190 @@
+"""Opaque cursor tokens over pinned snapshots of paginated views."""
+
+import base64
+import binascii
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from mlb_mcp_server.constants import (
+    CURSOR_MAX_BYTES,
+    CURSOR_MAX_SNAPSHOTS,
+    CURSOR_TTL_SECONDS,
+)
+from mlb_mcp_server.season import Season
+
+
+@dataclass
+class PageView:
+    """
+    A filtered and sorted view of a season, paged with fixed settings.
+
+    With max_bytes set, page_size is an upper bound and each page holds as
+    many rows as fit in the byte budget.
+
+    The view holds the Season it was computed from, so pages served from it
+    never drift even if the season is refetched in the meantime. key
+    identifies the request the view was computed for, so a repeat of that
+    request reuses the pinned view instead of pinning another.
+    """
+
+    season: Season
+    positions: Optional[np.ndarray]
+    model_cls: Type[BaseModel]
+    fields: str
+    page_size: int
+    header: Dict[str, Any]
+    format: str = "records"
+    precision: Optional[int] = None
+    max_bytes: Optional[int] = None
+    key: Optional[Hashable] = field(default=None, compare=False)
+    snapshot_id: Optional[str] = field(default=None, compare=False)
+
+    @property
+    def total_rows(self) -> int:
+        if self.positions is None:
+            return len(self.season.frame)
+        return len(self.positions)
+
+    def rows(self, start: int, end: int) -> pd.DataFrame:
+        """Return the view's rows from start to end (exclusive)."""
+        if self.positions is None:
+            return self.season.frame.iloc[start:end]
+        return self.season.frame.iloc[self.positions[start:end]]
+
+
+class CursorRegistry:
+    """
+    Bounded registry of pinned page views addressed by opaque cursor tokens.
+
+    A token encodes a snapshot id, a row offset and the number of the page
+    starting there, since pages sized by max_bytes hold varying numbers of
+    rows and the number cannot be derived from the offset. Snapshots expire after
+    ttl seconds without use. The least recently used snapshots are dropped
+    once more than max_snapshots are pinned, or once the memory they keep
+    alive exceeds max_bytes; the snapshot just issued is always kept.
+
+    Pinned seasons may have left the season cache already, so max_bytes
+    bounds the memory held on top of it. A season shared by several
+    snapshots counts once.
+    """
+
+    def __init__(
+        self,
+        max_snapshots: int = CURSOR_MAX_SNAPSHOTS,
+        max_bytes: int = CURSOR_MAX_BYTES,
+        ttl: float = CURSOR_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_snapshots = max_snapshots
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._snapshots: OrderedDict[str, Tuple[PageView, float]] = OrderedDict()
+        self._keys: Dict[Hashable, str] = {}
+        # Pinned seasons (by id) with the number of snapshots pinning them
+        self._seasons: Dict[int, int] = {}
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory kept alive by the pinned snapshots in bytes."""
+        return self._nbytes
+
+    def find(self, key: Hashable) -> Optional[PageView]:
+        """Return the pinned view computed for key, or None if there is none."""
+        snapshot_id = self._keys.get(key)
+        if snapshot_id is None:
+            return None
+        view, expires_at = self._snapshots[snapshot_id]
+        if expires_at <= self._clock():
+            self._drop(snapshot_id)
+            return None
+        return view
+
+    def issue(self, view: PageView, offset: int, page: Optional[int] = None) -> str:
+        """
+        Return a cursor token for page of view starting at offset, pinning the view.
+
+        page defaults to the page number offset has with fixed-size pages.
+        """
+        if page is None:
+            page = offset // view.page_size + 1
+        if view.snapshot_id is None or view.snapshot_id not in self._snapshots:
+            view.snapshot_id = secrets.token_urlsafe(9)
+            self._pin(view.snapshot_id, view)
+        self._touch(view.snapshot_id, view)
+        raw = f"{view.snapshot_id}:{offset}:{page}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def resolve(self, token: str) -> Optional[Tuple[PageView, int, int]]:
+        """Return the pinned view, offset and page for token, or None if unknown."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            snapshot_id, offset, number = (
+                base64.urlsafe_b64decode(padded).decode().rsplit(":", 2)
+            )
+            start = int(offset)
+            page = int(number)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+
+        entry = self._snapshots.get(snapshot_id)
+        if entry is None or start < 0 or page < 1:
+            return None
+        view, expires_at = entry
+        if expires_at <= self._clock():
+            self._drop(snapshot_id)
+            return None
+        self._touch(snapshot_id, view)
+        return view, start, page
+
+    def clear(self) -> None:
+        """Drop every pinned snapshot."""
+        self._snapshots.clear()
+        self._keys.clear()
+        self._seasons.clear()
+        self._nbytes = 0
+
+    def _pin(self, snapshot_id: str, view: PageView) -> None:
+        if view.key is not None:
+            self._keys[view.key] = snapshot_id
+        if view.positions is not None:
+            self._nbytes += view.positions.nbytes
+        pins = self._seasons.get(id(view.season), 0)
+        if pins == 0:
+            self._nbytes += view.season.nbytes
+        self._seasons[id(view.season)] = pins + 1
+
+    def _drop(self, snapshot_id: str) -> None:
+        view, _ = self._snapshots.pop(snapshot_id)
+        if view.key is not None and self._keys.get(view.key) == snapshot_id:
+            del self._keys[view.key]
+        if view.positions is not None:
+            self._nbytes -= view.positions.nbytes
+        pins = self._seasons.pop(id(view.season)) - 1
+        if pins:
+            self._seasons[id(view.season)] = pins
+        else:
+            self._nbytes -= view.season.nbytes
+
+    def _touch(self, snapshot_id: str, view: PageView) -> None:
+        self._snapshots[snapshot_id] = (view, self._clock() + self.ttl)
+        self._snapshots.move_to_end(snapshot_id)
+        while len(self._snapshots) > 1 and (
+            len(self._snapshots) > self.max_snapshots or self._nbytes > self.max_bytes
+        ):
+            self._drop(next(iter(self._snapshots)))
+
+
+# Shared registry used by the MCP tools
+page_cursors = CursorRegistry()
@@ -0,0 +1,141 @@
+"""Field selection and column projection for stats models."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Type
+
+import pandas as pd
+from pydantic import BaseModel, create_model
+
+from mlb_mcp_server.constants import (
+    BATTING_PRESETS,
+    IDENTITY_FIELD_MAP,
+    PLAYER_IDENTITY_FIELDS,
+    PRESET_MAP,
+)
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """
+    Compiled field selection for one (model, fields) pair.
+
+    Attributes:
+        model: Model that validates and serializes only the selected fields
+        sources: For each selected field in model order, the DataFrame
+            columns that may hold it (alias first, then attribute name)
+        unknown: Requested names that are neither an alias nor an attribute
+            name of the model
+    """
+
+    model: Type[BaseModel]
+    sources: Tuple[Tuple[str, ...], ...]
+    unknown: Tuple[str, ...]
+
+    def columns(self, columns: pd.Index) -> List[str]:
+        """Return the DataFrame columns that feed the plan's fields, in order."""
+        available = set(columns)
+        selected = []
+        for candidates in self.sources:
+            for candidate in candidates:
+                if candidate in available:
+                    selected.append(candidate)
+                    break
+        return selected
+
+
+@lru_cache(maxsize=32)
+def _field_names(model_cls: Type[BaseModel]) -> Dict[str, str]:
+    """Map every alias and attribute name of a model's fields to the attribute."""
+    names = {}
+    for attr, info in model_cls.model_fields.items():
+        names[attr] = attr
+        if info.alias is not None:
+            names[info.alias] = attr
+    return names
+
+
+@lru_cache(maxsize=256)
+def field_plan(model_cls: Type[BaseModel], fields: str) -> FieldPlan:
+    """
+    Resolve a field specification into a cached plan for the model.
+
+    Requested names may be aliases (e.g. "wRC+", as in pybaseball) or
+    attribute names (e.g. "wRC_plus"). The model's identity fields are always
+    selected. Names in a comma-separated list that match no field are
+    reported in unknown; presets are trusted as configured.
+
+    Args:
+        model_cls: Full Pydantic model class (e.g. BattingStats)
+        fields: Field specification ("all", a preset or comma-separated list)
+
+    Returns:
+        The plan; its model is model_cls itself for "all", otherwise a reduced
+        copy keeping the original field definitions, order and config
+    """
+    names = _field_names(model_cls)
+    sources = tuple(
+        tuple(c for c in (info.alias, attr) if c is not None)
+        for attr, info in model_cls.model_fields.items()
+    )
+    if fields == "all":
+        return FieldPlan(model_cls, sources, ())
+
+    model_name = model_cls.__name__
+    presets = PRESET_MAP.get(model_name, BATTING_PRESETS)
+    identity_fields = IDENTITY_FIELD_MAP.get(model_name, PLAYER_IDENTITY_FIELDS)
+
+    unknown: List[str] = []
+    if fields in presets:
+        requested = presets[fields]
+    else:
+        # Treat as comma-separated list of field names
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [name for name in requested if name not in names]
+
+    keep = {names[name] for name in [*identity_fields, *requested] if name in names}
+    definitions: Dict[str, Any] = {}
+    kept_sources = []
+    for (attr, info), candidates in zip(model_cls.model_fields.items(), sources):
+        if attr in keep:
+            definitions[attr] = (info.annotation, info)
+            kept_sources.append(candidates)
+
+    model = create_model(
+        f"{model_name}Projection", __config__=model_cls.model_config, **definitions
+    )
+    return FieldPlan(model, tuple(kept_sources), tuple(dict.fromkeys(unknown)))
+
+
+def field_attribute(model_cls: Type[BaseModel], name: str) -> str:
+    """
+    Return the attribute name of a model field given by alias or attribute name.
+
+    Raises:
+        ValueError: If name is not a field of the model
+    """
+    attr = _field_names(model_cls).get(name)
+    if attr is None:
+        raise ValueError(f"Unknown field for {model_cls.__name__}: {name}")
+    return attr
+
+
+def field_column(model_cls: Type[BaseModel], name: str, columns: pd.Index) -> str:
+    """
+    Return the DataFrame column holding a model field.
+
+    Args:
+        model_cls: Pydantic model class describing the DataFrame
+        name: Field alias (e.g. "wRC+") or attribute name (e.g. "wRC_plus")
+        columns: Columns of the DataFrame
+
+    Raises:
+        ValueError: If name is not a field of the model or is missing from
+            the DataFrame
+    """
+    attr = field_attribute(model_cls, name)
+    alias = model_cls.model_fields[attr].alias
+    for candidate in (alias, attr):
+        if candidate is not None and candidate in columns:
+            return candidate
+    raise ValueError(f"Unknown field for {model_cls.__name__}: {name}")
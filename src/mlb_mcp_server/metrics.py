@@ -0,0 +1,279 @@
+"""Latency, error and payload-size metrics for the MCP tools."""
+
+import asyncio
+import functools
+import os
+import tempfile
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import pydantic_core
+
+from mlb_mcp_server.constants import METRICS_WINDOW
+from mlb_mcp_server.startup import startup_timer
+
+F = TypeVar("F", bound=Callable[..., Awaitable[dict]])
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Tool whose call the current code runs for; background work has none
+_current_tool: ContextVar[str] = ContextVar("metrics_tool", default="background")
+
+
+class Summary:
+    """
+    Count and sum of all observations plus a window of the most recent ones.
+
+    Recording is an append to a bounded deque; quantiles are only computed
+    when a snapshot is taken.
+    """
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self.count = 0
+        self.total = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self._recent.append(value)
+
+    def quantiles(self, qs: Sequence[float] = QUANTILES) -> List[float]:
+        """Return nearest-rank quantiles over the recent window (0 when empty)."""
+        recent = sorted(self._recent)
+        if not recent:
+            return [0.0 for _ in qs]
+        return [recent[min(int(q * len(recent)), len(recent) - 1)] for q in qs]
+
+
+class Metrics:
+    """
+    Registry of per-tool, per-stage timings, upstream counters and payload sizes.
+
+    Stages are attributed to the tool call they run under through a context
+    variable, so shared helpers (loading, filtering, conversion, upstream
+    fetches) need no extra arguments.
+    """
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self.window = window
+        self.started = time.time()
+        self.stage_seconds: Dict[Tuple[str, str], Summary] = {}
+        self.payload_bytes: Dict[str, Summary] = {}
+        self.tool_errors: DefaultDict[str, int] = defaultdict(int)
+        self.upstream_calls: DefaultDict[str, int] = defaultdict(int)
+        self.upstream_errors: DefaultDict[str, int] = defaultdict(int)
+
+    def reset(self) -> None:
+        """Drop every recorded observation."""
+        self.started = time.time()
+        self.stage_seconds.clear()
+        self.payload_bytes.clear()
+        self.tool_errors.clear()
+        self.upstream_calls.clear()
+        self.upstream_errors.clear()
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Record how long a stage took for the current tool."""
+        key = (_current_tool.get(), stage)
+        summary = self.stage_seconds.get(key)
+        if summary is None:
+            summary = self.stage_seconds[key] = Summary(self.window)
+        summary.observe(seconds)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as a stage of the current tool."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.perf_counter() - start)
+
+    def record_upstream(self, source: str, failed: bool) -> None:
+        """Count a finished call to an upstream site."""
+        self.upstream_calls[source] += 1
+        if failed:
+            self.upstream_errors[source] += 1
+
+    def tool(self, func: F) -> F:
+        """
+        Decorate an MCP tool to time it and record its response size.
+
+        The wrapper keeps the tool's signature, so FastMCP still derives the
+        same input schema from it. Calls that return {"error": ...} or raise
+        both count as errors.
+
+        The response size is measured by serializing the response to compact
+        JSON once more, on the event loop. That is the wrapper's main cost and
+        grows with the page: about as much again as FastMCP's own
+        serialization of the result.
+        """
+        name = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict:
+            start = time.perf_counter()
+            token = _current_tool.set(name)
+            try:
+                with self.stage("total"):
+                    result = await func(*args, **kwargs)
+            except Exception:
+                self.tool_errors[name] += 1
+                raise
+            finally:
+                _current_tool.reset(token)
+            startup_timer.tool_call(name, time.perf_counter() - start)
+
+            if "error" in result:
+                self.tool_errors[name] += 1
+            summary = self.payload_bytes.get(name)
+            if summary is None:
+                summary = self.payload_bytes[name] = Summary(self.window)
+            summary.observe(len(pydantic_core.to_json(result)))
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    def snapshot(self) -> dict:
+        """Return every metric as a JSON-ready dictionary."""
+        stages = []
+        for (tool, stage), summary in sorted(self.stage_seconds.items()):
+            p50, p95, p99 = summary.quantiles()
+            stages.append(
+                {
+                    "tool": tool,
+                    "stage": stage,
+                    "count": summary.count,
+                    "p50_ms": round(p50 * 1000, 3),
+                    "p95_ms": round(p95 * 1000, 3),
+                    "p99_ms": round(p99 * 1000, 3),
+                    "total_ms": round(summary.total * 1000, 3),
+                }
+            )
+
+        payloads = []
+        for tool, summary in sorted(self.payload_bytes.items()):
+            p50, p95, p99 = summary.quantiles()
+            payloads.append(
+                {
+                    "tool": tool,
+                    "count": summary.count,
+                    "p50": int(p50),
+                    "p95": int(p95),
+                    "p99": int(p99),
+                    "total": int(summary.total),
+                }
+            )
+
+        sources = sorted(set(self.upstream_calls) | set(self.upstream_errors))
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "stages": stages,
+            "payload_bytes": payloads,
+            "tool_errors": dict(sorted(self.tool_errors.items())),
+            "upstream": [
+                {
+                    "source": source,
+                    "calls": self.upstream_calls[source],
+                    "errors": self.upstream_errors[source],
+                }
+                for source in sources
+            ],
+        }
+
+    def prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def summary(name: str, help_text: str, series: Dict[str, Summary]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            for labels, s in sorted(series.items()):
+                for q, value in zip(QUANTILES, s.quantiles()):
+                    lines.append(f'{name}{{{labels},quantile="{q}"}} {value:g}')
+                lines.append(f"{name}_sum{{{labels}}} {s.total:g}")
+                lines.append(f"{name}_count{{{labels}}} {s.count}")
+
+        def counter(
+            name: str, help_text: str, label: str, values: Dict[str, int]
+        ) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(values.items()):
+                lines.append(f'{name}{{{label}="{key}"}} {value}')
+
+        summary(
+            "mlb_mcp_stage_seconds",
+            "Time spent per tool and stage.",
+            {
+                f'tool="{tool}",stage="{stage}"': s
+                for (tool, stage), s in self.stage_seconds.items()
+            },
+        )
+        summary(
+            "mlb_mcp_payload_bytes",
+            "JSON size of tool responses.",
+            {f'tool="{tool}"': s for tool, s in self.payload_bytes.items()},
+        )
+        counter(
+            "mlb_mcp_tool_errors_total",
+            "Tool calls that returned an error.",
+            "tool",
+            self.tool_errors,
+        )
+        counter(
+            "mlb_mcp_upstream_calls_total",
+            "Finished pybaseball calls per upstream site.",
+            "source",
+            self.upstream_calls,
+        )
+        counter(
+            "mlb_mcp_upstream_errors_total",
+            "Failed pybaseball calls per upstream site.",
+            "source",
+            self.upstream_errors,
+        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        """Atomically replace path with the current Prometheus text dump."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.prometheus())
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    async def dump_periodically(self, path: Path, interval: float) -> None:
+        """Write the Prometheus dump to path every interval seconds until cancelled."""
+        try:
+            while True:
+                await asyncio.to_thread(self.write_prometheus, path)
+                await asyncio.sleep(interval)
+        finally:
+            # Leave a final dump behind on shutdown
+            self.write_prometheus(path)
+
+
+# Shared registry used by the MCP tools
+metrics = Metrics()
@@ -643,3 +643,85 @@ class TeamBattingStats(BaseModel):
     Spd: Optional[float] = Field(None, description="Speed Score")
 
     model_config = ConfigDict(populate_by_name=True)
+
+
+class TeamBattingAggregate(BaseModel):
+    """
+    Team batting totals summed from player-level rows.
+    Rate stats are recomputed from the summed components, not averaged.
+    """
+
+    Team: str
+    Players: int = Field(..., description="Player rows summed")
+
+    # ========== COUNTING STATS ==========
+    PA: int = Field(..., description="Plate Appearances")
+    AB: int = Field(..., description="At Bats")
+    H: int = Field(..., description="Hits")
+    single: Optional[int] = Field(None, alias="1B", description="Singles")
+    double: Optional[int] = Field(None, alias="2B", description="Doubles")
+    triple: Optional[int] = Field(None, alias="3B", description="Triples")
+    HR: int = Field(..., description="Home Runs")
+    R: int = Field(..., description="Runs")
+    RBI: int = Field(..., description="Runs Batted In")
+    BB: int = Field(..., description="Walks")
+    IBB: Optional[int] = Field(None, description="Intentional Walks")
+    SO: int = Field(..., description="Strikeouts")
+    HBP: Optional[int] = Field(None, description="Hit By Pitch")
+    SF: Optional[int] = Field(None, description="Sacrifice Flies")
+    SH: Optional[int] = Field(None, description="Sacrifice Hits/Bunts")
+    GDP: Optional[int] = Field(None, description="Grounded into Double Play")
+    SB: Optional[int] = Field(None, description="Stolen Bases")
+    CS: Optional[int] = Field(None, description="Caught Stealing")
+
+    # ========== RATE STATS ==========
+    AVG: Optional[float] = Field(None, description="Batting Average")
+    OBP: Optional[float] = Field(None, description="On Base Percentage")
+    SLG: Optional[float] = Field(None, description="Slugging Percentage")
+    OPS: Optional[float] = Field(None, description="On Base Plus Slugging")
+    ISO: Optional[float] = Field(None, description="Isolated Power")
+    BB_pct: Optional[float] = Field(None, alias="BB%", description="Walk Percentage")
+    K_pct: Optional[float] = Field(None, alias="K%", description="Strikeout Percentage")
+
+    # ========== VALUE ==========
+    WAR: Optional[float] = Field(None, description="Wins Above Replacement")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class TeamPitchingAggregate(BaseModel):
+    """
+    Team pitching totals summed from player-level rows.
+    Rate stats are recomputed from the summed components, not averaged.
+    """
+
+    Team: str
+    Players: int = Field(..., description="Player rows summed")
+
+    # ========== COUNTING STATS ==========
+    W: int = Field(..., description="Wins")
+    L: int = Field(..., description="Losses")
+    GS: Optional[int] = Field(None, description="Games Started")
+    SV: Optional[int] = Field(None, description="Saves")
+    IP: float = Field(..., description="Innings Pitched")
+    TBF: Optional[int] = Field(None, description="Total Batters Faced")
+    H: int = Field(..., description="Hits Allowed")
+    R: int = Field(..., description="Runs Allowed")
+    ER: int = Field(..., description="Earned Runs")
+    HR: int = Field(..., description="Home Runs Allowed")
+    BB: int = Field(..., description="Walks")
+    IBB: Optional[int] = Field(None, description="Intentional Walks")
+    HBP: Optional[int] = Field(None, description="Hit By Pitch")
+    SO: int = Field(..., description="Strikeouts")
+
+    # ========== RATE STATS ==========
+    ERA: Optional[float] = Field(None, description="Earned Run Average")
+    WHIP: Optional[float] = Field(None, description="Walks + Hits per Inning Pitched")
+    K_9: Optional[float] = Field(None, alias="K/9", description="Strikeouts per 9")
+    BB_9: Optional[float] = Field(None, alias="BB/9", description="Walks per 9")
+    HR_9: Optional[float] = Field(None, alias="HR/9", description="Home Runs per 9")
+
+    # ========== VALUE ==========
+    WAR: Optional[float] = Field(None, description="Wins Above Replacement")
+
+    model_config = ConfigDict(populate_by_name=True)
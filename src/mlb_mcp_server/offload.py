@@ -0,0 +1,103 @@
+"""Process-pool offload of large DataFrame-to-record conversions."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Type
+
+import pandas as pd
+from pydantic import BaseModel
+
+from mlb_mcp_server.constants import CONVERT_OFFLOAD_MIN_CELLS, CONVERT_PROCESSES
+from mlb_mcp_server.convert import convert_records
+from mlb_mcp_server.fields import field_plan
+
+logger = logging.getLogger(__name__)
+
+
+def convert_projection(
+    model_cls: Type[BaseModel], fields: str, df: pd.DataFrame
+) -> List[Dict]:
+    """
+    Project df onto the requested fields of model_cls and convert it to records.
+
+    This is the unit of work sent to worker processes. Projected models are
+    built dynamically and cannot be pickled, so the worker compiles (and
+    caches) its own field plan from the importable model class and field
+    specification.
+    """
+    plan = field_plan(model_cls, fields)
+    return convert_records(plan.model, df[plan.columns(df.columns)])
+
+
+class ConversionPool:
+    """
+    Converts large pages in a process pool and small ones inline.
+
+    Conversion is CPU-bound pydantic work that holds the GIL, so a page with
+    fields="all" and a large page_size would stall every other request on
+    the event loop. Pages of at least min_cells cells are pickled to a worker
+    instead. The pool is started on first use with the spawn method, so
+    workers never inherit the server's threads.
+    """
+
+    def __init__(
+        self,
+        processes: int = CONVERT_PROCESSES,
+        min_cells: int = CONVERT_OFFLOAD_MIN_CELLS,
+    ) -> None:
+        self.processes = processes
+        self.min_cells = min_cells
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def should_offload(self, df: pd.DataFrame) -> bool:
+        """Return True if df is large enough to convert in a worker process."""
+        return self.processes > 0 and df.size >= self.min_cells
+
+    async def convert(
+        self, model_cls: Type[BaseModel], fields: str, df: pd.DataFrame
+    ) -> List[Dict]:
+        """
+        Convert df to records, in a worker process when it is large.
+
+        Args:
+            model_cls: Importable model class the fields are selected from
+            fields: Field specification passed to field_plan
+            df: Page slice, already reduced to the projected columns
+
+        Returns:
+            List of JSON-compatible dicts keyed by model attribute name
+        """
+        if not self.should_offload(df):
+            return convert_projection(model_cls, fields, df)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor(), convert_projection, model_cls, fields, df
+            )
+        except BrokenProcessPool:
+            # A crashed worker poisons the pool: start a fresh one next time
+            logger.warning("Conversion worker died; converting in-process")
+            self.shutdown()
+            return convert_projection(model_cls, fields, df)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; a later convert() starts a fresh pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+
+# Shared pool used by the paginated MCP tools
+conversion_pool = ConversionPool()
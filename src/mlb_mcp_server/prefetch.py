@@ -0,0 +1,64 @@
+"""Background warm-up and scheduled prefetch of frequently requested seasons."""
+
+import asyncio
+import logging
+from datetime import date
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def warm_years(count: int, today: Optional[date] = None) -> List[int]:
+    """Return the current season and the count - 1 seasons before it, newest first."""
+    current = (today or date.today()).year
+    return [current - offset for offset in range(max(count, 0))]
+
+
+class Prefetcher:
+    """
+    Background task that warms seasons at startup and then on a schedule.
+
+    warm is called with refresh=False once when the task starts, then with
+    refresh=True every interval seconds. An interval of 0 or less only runs
+    the startup warm-up. The task never blocks its caller, and a failing
+    warm-up is logged rather than stopping the schedule.
+    """
+
+    def __init__(
+        self, warm: Callable[[bool], Awaitable[object]], interval: float
+    ) -> None:
+        self._warm = warm
+        self.interval = interval
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background task; a no-op if it is already running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        await self._warm_safely(refresh=False)
+        while self.interval > 0:
+            await asyncio.sleep(self.interval)
+            await self._warm_safely(refresh=True)
+
+    async def _warm_safely(self, refresh: bool) -> None:
+        try:
+            await self._warm(refresh)
+        except Exception:
+            logger.exception("Season prefetch failed")
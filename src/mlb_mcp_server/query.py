@@ -0,0 +1,97 @@
+"""Vectorized filtering and sorting of season DataFrames."""
+
+from typing import Mapping, Optional, Type
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from mlb_mcp_server.fields import field_column
+from mlb_mcp_server.season import Season
+
+
+def filter_mask(
+    df: pd.DataFrame,
+    model_cls: Type[BaseModel],
+    equals: Optional[Mapping[str, Optional[str]]] = None,
+    minimums: Optional[Mapping[str, Optional[float]]] = None,
+    maximums: Optional[Mapping[str, Optional[float]]] = None,
+) -> Optional[np.ndarray]:
+    """
+    Build a boolean row mask matching every given predicate.
+
+    Args:
+        df: Season DataFrame to filter
+        model_cls: Pydantic model class describing the DataFrame
+        equals: Field name to value; rows must match case-insensitively
+        minimums: Field name to threshold; rows must be >= the threshold
+        maximums: Field name to threshold; rows must be <= the threshold
+
+    Returns:
+        Boolean array over the rows of df, or None when no predicate is set
+
+    Raises:
+        ValueError: If a predicate references an unknown field
+    """
+    mask: Optional[np.ndarray] = None
+
+    for name, value in (equals or {}).items():
+        if value is None:
+            continue
+        column = df[field_column(model_cls, name, df.columns)]
+        matches = (column.astype(str).str.casefold() == value.casefold()).to_numpy()
+        mask = matches if mask is None else mask & matches
+
+    for name, threshold in (minimums or {}).items():
+        if threshold is None:
+            continue
+        column = df[field_column(model_cls, name, df.columns)]
+        matches = (pd.to_numeric(column, errors="coerce") >= threshold).to_numpy()
+        mask = matches if mask is None else mask & matches
+
+    for name, threshold in (maximums or {}).items():
+        if threshold is None:
+            continue
+        column = df[field_column(model_cls, name, df.columns)]
+        matches = (pd.to_numeric(column, errors="coerce") <= threshold).to_numpy()
+        mask = matches if mask is None else mask & matches
+
+    return mask
+
+
+def view_positions(
+    season: Season,
+    model_cls: Type[BaseModel],
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    equals: Optional[Mapping[str, Optional[str]]] = None,
+    minimums: Optional[Mapping[str, Optional[float]]] = None,
+) -> Optional[np.ndarray]:
+    """
+    Return the row positions of a filtered and sorted view of a season.
+
+    Sorting reads the season's cached permutation for sort_by, so no sort
+    runs per request; filters are applied to the permutation in one pass,
+    which preserves its order.
+
+    Returns:
+        Row positions in view order, or None when the view is the whole
+        season in upstream order
+
+    Raises:
+        ValueError: If sort_by or a predicate references an unknown field
+    """
+    df = season.frame
+    mask = filter_mask(df, model_cls, equals, minimums)
+
+    if sort_by is not None:
+        positions = season.ordering(
+            field_column(model_cls, sort_by, df.columns), ascending
+        )
+        if mask is not None:
+            positions = positions[mask[positions]]
+        return positions
+
+    if mask is not None:
+        return np.flatnonzero(mask)
+    return None
@@ -0,0 +1,95 @@
+"""Accent- and case-insensitive player name search."""
+
+import heapq
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+# Minimum share of the query's trigrams a name must contain to be a match
+MIN_QUERY_COVERAGE = 0.5
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for matching: strip accents, casefold and drop punctuation.
+
+    "Ronald Acuña Jr." becomes "ronald acuna jr".
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def name_trigrams(normalized: str) -> FrozenSet[str]:
+    """Return the trigrams of each word, padded so word starts weigh more."""
+    grams: Set[str] = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class NameIndex:
+    """
+    Trigram index over a column of names.
+
+    Built once per season; a search touches only the posting lists of the
+    query's trigrams rather than every name.
+    """
+
+    def __init__(self, names: Iterable[object]) -> None:
+        self._names: List[str] = []
+        self._grams: List[FrozenSet[str]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for position, name in enumerate(names):
+            normalized = normalize_name(name) if isinstance(name, str) else ""
+            grams = name_trigrams(normalized)
+            self._names.append(normalized)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings[gram].append(position)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        Rank names against a query.
+
+        Names score by the share of the query's trigrams they contain, with
+        bonuses for an exact match and for words starting with a query word.
+        Ties are broken by overall trigram similarity, then row order.
+
+        Returns:
+            Up to limit (row position, score) pairs, best match first
+        """
+        normalized = normalize_name(query)
+        query_grams = name_trigrams(normalized)
+        if not query_grams:
+            return []
+
+        shared: Counter[int] = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+
+        query_words = normalized.split()
+        ranked = []
+        for position, count in shared.items():
+            coverage = count / len(query_grams)
+            if coverage < MIN_QUERY_COVERAGE:
+                continue
+
+            name = self._names[position]
+            words = name.split()
+            score = coverage
+            if name == normalized:
+                score += 1.0
+            elif all(any(w.startswith(q) for w in words) for q in query_words):
+                score += 0.5
+
+            similarity = count / len(query_grams | self._grams[position])
+            ranked.append((-score, -similarity, position))
+
+        best = heapq.nsmallest(limit, ranked)
+        return [(position, round(-neg_score, 3)) for neg_score, _, position in best]
@@ -0,0 +1,75 @@
+"""A fetched season DataFrame together with the lookup structures built on it."""
+
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mlb_mcp_server.search import NameIndex
+
+_NO_ROWS = np.array([], dtype=np.intp)
+
+
+class Season:
+    """
+    Season DataFrame as returned by pybaseball, plus lazily built indexes.
+
+    Seasons are cached as a whole, so anything derived from the frame here is
+    built at most once per fetch and dropped together with the frame. as_of
+    records when the data was fetched (UTC) and defaults to now.
+    """
+
+    def __init__(self, frame: pd.DataFrame, as_of: Optional[datetime] = None) -> None:
+        self.frame = frame
+        self.as_of = as_of or datetime.now(timezone.utc)
+        self._orderings: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._row_indexes: Dict[str, Dict[Hashable, np.ndarray]] = {}
+        self._name_indexes: Dict[str, NameIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @cached_property
+    def nbytes(self) -> int:
+        """Memory footprint of the frame in bytes, measured once."""
+        return int(self.frame.memory_usage(index=True, deep=True).sum())
+
+    def ordering(self, column: str, ascending: bool = False) -> np.ndarray:
+        """
+        Return the row positions of the frame sorted by column.
+
+        The permutation is stable (ties keep upstream order), puts missing
+        values last in both directions, and is computed once per column and
+        direction. A sorted page is then a slice of the permutation.
+        """
+        key = (column, ascending)
+        positions = self._orderings.get(key)
+        if positions is None:
+            values = self.frame[column].reset_index(drop=True)
+            positions = values.sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            ).index.to_numpy()
+            self._orderings[key] = positions
+        return positions
+
+    def rows_for(self, column: str, value: Hashable) -> np.ndarray:
+        """
+        Return the row positions where column equals value.
+
+        Backed by a hash index from value to row positions that is built once
+        per column, so repeated lookups (e.g. by IDfg) avoid scanning the frame.
+        """
+        if column not in self._row_indexes:
+            groups = self.frame.groupby(column, sort=False).indices
+            self._row_indexes[column] = {
+                key: np.asarray(positions) for key, positions in groups.items()
+            }
+        return self._row_indexes[column].get(value, _NO_ROWS)
+
+    def name_index(self, column: str = "Name") -> NameIndex:
+        """Return the trigram name index over column, building it on first use."""
+        if column not in self._name_indexes:
+            self._name_indexes[column] = NameIndex(self.frame[column])
+        return self._name_indexes[column]
@@ -1,44 +1,409 @@
 import asyncio
-from typing import Callable, List, Type, TypeVar
+import json
+import logging
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import pandas as pd
 from mcp.server.fastmcp import FastMCP
-from pybaseball import (
-    batting_stats,
-    pitching_stats,
-    standings,
-    team_batting,
-    team_pitching,
+from pydantic import BaseModel, ValidationError
+
+from mlb_mcp_server.aggregate import (
+    BATTING_TOTALS,
+    PITCHING_TOTALS,
+    batting_rates,
+    pitching_rates,
+    team_totals,
+)
+from mlb_mcp_server.budget import estimate_rows, rows_within_budget, serialized_size
+from mlb_mcp_server.cache import (
+    is_current_season,
+    season_cache,
+    season_max_stale,
+    season_ttl,
 )
-from pydantic import BaseModel
-
 from mlb_mcp_server.constants import (
-    BATTING_PRESETS,
+    BASEBALL_REFERENCE,
+    BATCH_CONCURRENCY,
+    BATCH_MAX_QUERIES,
+    BREF_TEAM_IDS,
+    BUDGET_SAMPLE_ROWS,
     DIVISION_NAMES,
-    IDENTITY_FIELD_MAP,
-    PLAYER_IDENTITY_FIELDS,
-    PRESET_MAP,
+    FANGRAPHS,
+    METRICS_DUMP_INTERVAL_SECONDS,
+    METRICS_FILE,
+    PAGE_ENVELOPE_BYTES,
+    PREFETCH_INTERVAL_SECONDS,
+    TEAM_REPORT_BATTING_FIELDS,
+    TEAM_REPORT_PITCHING_FIELDS,
+    WARMUP_SEASONS,
 )
+from mlb_mcp_server.convert import columnar_records, convert_records
+from mlb_mcp_server.cursors import PageView, page_cursors
+from mlb_mcp_server.fields import (
+    FieldPlan,
+    field_attribute,
+    field_column,
+    field_plan,
+)
+from mlb_mcp_server.metrics import metrics
 from mlb_mcp_server.models import (
     BattingStats,
     PitchingStats,
     StandingsRecord,
+    TeamBattingAggregate,
     TeamBattingStats,
+    TeamPitchingAggregate,
     TeamPitchingStats,
 )
+from mlb_mcp_server.offload import conversion_pool
+from mlb_mcp_server.prefetch import Prefetcher, warm_years
+from mlb_mcp_server.query import filter_mask, view_positions
+from mlb_mcp_server.season import Season
+from mlb_mcp_server.singleflight import SingleFlight
+from mlb_mcp_server.sources import (
+    batting_stats,
+    pitching_stats,
+    preload,
+    standings,
+    team_batting,
+    team_pitching,
+)
+from mlb_mcp_server.startup import startup_timer
+from mlb_mcp_server.store import season_store
+from mlb_mcp_server.upstream import background_priority, upstream
 
-mcp = FastMCP("Statcast")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm hot seasons in the background while the server is running."""
+    startup_timer.mark("server started")
+    # Import pybaseball off the event loop so the handshake does not wait for it
+    threading.Thread(target=preload, name="pybaseball-import", daemon=True).start()
+
+    prefetcher = Prefetcher(
+        lambda refresh: _warm_seasons(warm_years(WARMUP_SEASONS), refresh),
+        PREFETCH_INTERVAL_SECONDS,
+    )
+    if WARMUP_SEASONS > 0:
+        prefetcher.start()
+    dump = None
+    if METRICS_FILE:
+        dump = asyncio.create_task(
+            metrics.dump_periodically(Path(METRICS_FILE), METRICS_DUMP_INTERVAL_SECONDS)
+        )
+    try:
+        yield
+    finally:
+        await prefetcher.stop()
+        if dump is not None:
+            dump.cancel()
+            await asyncio.gather(dump, return_exceptions=True)
+        upstream.shutdown()
+        conversion_pool.shutdown()
+
+
+mcp = FastMCP("Statcast", lifespan=_lifespan)
+
+# In-flight season fetches keyed by (stats function, year)
+season_fetches: SingleFlight[Season] = SingleFlight()
+
+# In-flight multi-season fetches keyed by (stats function, start year, end year)
+season_spans: SingleFlight[Dict[int, Season]] = SingleFlight()
 
 T = TypeVar("T", bound=BaseModel)
 
 
+async def _load_season(
+    stats_func: Callable[..., pd.DataFrame],
+    year: int,
+    dataset: Optional[str] = None,
+) -> Season:
+    """
+    Return the full season for stats_func.
+
+    Lookups go to the in-process season cache first, then (for completed
+    seasons) the on-disk season store, and only then to pybaseball.
+    Concurrent cache misses for the same season are coalesced into one fetch.
+    A current season past its TTL is returned immediately while a single
+    background refresh replaces it; its as_of tells callers how old it is.
+
+    Args:
+        stats_func: Function to fetch stats (e.g., batting_stats, pitching_stats).
+        year: Season year to retrieve data for.
+        dataset: Stable name used to persist the season on disk. Seasons without
+            a dataset name are only cached in memory.
+
+    Returns:
+        Season wrapping the DataFrame returned by stats_func.
+    """
+    key = (stats_func, year)
+    season = season_cache.get(key)
+    if season is not None:
+        return season
+
+    stale = season_cache.get_stale(key)
+    if stale is not None:
+        if key not in season_fetches:
+            with background_priority():
+                refresh = season_fetches.start(
+                    key, lambda: _fetch_season(stats_func, year, dataset)
+                )
+            refresh.add_done_callback(_log_failed_refresh)
+        return stale
+
+    # Concurrent requests for the same season share a single fetch
+    return await season_fetches.run(
+        key, lambda: _fetch_season(stats_func, year, dataset)
+    )
+
+
+def _log_failed_refresh(refresh: "asyncio.Future[Season]") -> None:
+    """Log a background refresh that failed; the stale season stays cached."""
+    if not refresh.cancelled() and refresh.exception() is not None:
+        logger.warning("Background season refresh failed", exc_info=refresh.exception())
+
+
+async def _fetch_season(
+    stats_func: Callable[..., pd.DataFrame],
+    year: int,
+    dataset: Optional[str],
+) -> Season:
+    """Load a season from the on-disk store or pybaseball and cache it."""
+    df = await _read_store(year, dataset)
+    if df is None:
+        df = await upstream.run(_upstream_source(stats_func), stats_func, year)
+        await _write_store(year, dataset, df)
+    return _cache_season(stats_func, year, df)
+
+
+async def _load_seasons(
+    stats_func: Callable[..., pd.DataFrame],
+    start_year: int,
+    end_year: int,
+    dataset: Optional[str] = None,
+) -> List[Season]:
+    """
+    Return every season from start_year to end_year (inclusive) for stats_func.
+
+    Cached and stored seasons are reused. When more than one season is still
+    missing, the whole missing span is requested from pybaseball in a single
+    multi-season call and split back into per-year seasons.
+
+    Returns:
+        Seasons in year order.
+    """
+    years = list(range(start_year, end_year + 1))
+    seasons: Dict[int, Season] = {}
+    for year in years:
+        cached = season_cache.get((stats_func, year))
+        if cached is not None:
+            seasons[year] = cached
+
+    missing = [year for year in years if year not in seasons]
+    stored = await asyncio.gather(*(_read_store(year, dataset) for year in missing))
+    for year, df in zip(missing, stored):
+        if df is not None:
+            seasons[year] = _cache_season(stats_func, year, df)
+
+    missing = [year for year in years if year not in seasons]
+    if len(missing) == 1:
+        seasons[missing[0]] = await _load_season(stats_func, missing[0], dataset)
+    elif missing:
+        first, last = missing[0], missing[-1]
+        fetched = await season_spans.run(
+            (stats_func, first, last),
+            lambda: _fetch_season_span(stats_func, first, last, dataset),
+        )
+        seasons.update(fetched)
+
+    return [seasons[year] for year in years]
+
+
+async def _load_season_range(
+    stats_func: Callable[..., pd.DataFrame],
+    start_year: int,
+    end_year: int,
+    dataset: Optional[str] = None,
+) -> Season:
+    """
+    Return a span of seasons combined into one Season, in year order.
+
+    The combined Season is cached, so its orderings and indexes are reused by
+    later requests for the same range.
+    """
+    key = (stats_func, start_year, end_year)
+    season = season_cache.get(key)
+    if season is not None:
+        return season
+
+    seasons = await _load_seasons(stats_func, start_year, end_year, dataset)
+    frames = [s.frame for s in seasons if not s.frame.empty]
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    # A range is only as fresh as its oldest season
+    season = Season(combined, as_of=min(s.as_of for s in seasons))
+    season_cache.put(key, season, season_ttl(end_year))
+    return season
+
+
+async def _fetch_season_span(
+    stats_func: Callable[..., pd.DataFrame],
+    start_year: int,
+    end_year: int,
+    dataset: Optional[str],
+) -> Dict[int, Season]:
+    """Fetch several seasons in one upstream call and cache each year."""
+    df = await upstream.run(
+        _upstream_source(stats_func), stats_func, start_year, end_year
+    )
+
+    seasons = {}
+    by_year = dict(iter(df.groupby("Season", sort=False))) if not df.empty else {}
+    for year in range(start_year, end_year + 1):
+        year_df = by_year.get(year, df.iloc[0:0]).reset_index(drop=True)
+        await _write_store(year, dataset, year_df)
+        seasons[year] = _cache_season(stats_func, year, year_df)
+    return seasons
+
+
+async def _read_store(year: int, dataset: Optional[str]) -> Optional[pd.DataFrame]:
+    """Return a completed season from the on-disk store, if present."""
+    # Only completed seasons are persisted; the current one changes daily
+    if dataset is None or is_current_season(year):
+        return None
+    return await asyncio.to_thread(season_store.load, dataset, year)
+
+
+async def _write_store(year: int, dataset: Optional[str], df: pd.DataFrame) -> None:
+    """Persist a completed, non-empty season to the on-disk store."""
+    if dataset is None or is_current_season(year) or df.empty:
+        return
+    await asyncio.to_thread(season_store.save, dataset, year, df)
+
+
+def _cache_season(
+    stats_func: Callable[..., pd.DataFrame], year: int, df: pd.DataFrame
+) -> Season:
+    """Wrap a fetched DataFrame in a Season and add it to the season cache."""
+    season = Season(df)
+    season_cache.put(
+        (stats_func, year), season, season_ttl(year), season_max_stale(year)
+    )
+    return season
+
+
+def _as_of(*seasons: Season) -> str:
+    """Return when the oldest of the seasons was fetched, as an ISO 8601 string."""
+    return min(season.as_of for season in seasons).isoformat(timespec="seconds")
+
+
+def _stats_source(
+    stat_type: str,
+) -> Tuple[Callable[..., pd.DataFrame], Type[BaseModel]]:
+    """Resolve a stat type to its pybaseball function and model."""
+    if stat_type == "batting":
+        return batting_stats, BattingStats
+    if stat_type == "pitching":
+        return pitching_stats, PitchingStats
+    if stat_type == "team_batting":
+        return team_batting, TeamBattingStats
+    if stat_type == "team_pitching":
+        return team_pitching, TeamPitchingStats
+    raise ValueError(f"Invalid stat_type: {stat_type!r}")
+
+
+def _warm_sources() -> List[Tuple[Callable[..., pd.DataFrame], str]]:
+    """Return every (stats function, dataset) pair the tools load seasons from."""
+    sources = [
+        _stats_source(stat_type)
+        for stat_type in ("batting", "pitching", "team_batting", "team_pitching")
+    ]
+    return [(func, model_cls.__name__) for func, model_cls in sources] + [
+        (_standings_frame, "StandingsRecord")
+    ]
+
+
+async def _warm_seasons(years: List[int], refresh: bool = False) -> int:
+    """
+    Load the given seasons of every data source into the season cache.
+
+    Seasons are loaded one at a time and at background priority, so tool
+    calls waiting for the same upstream site go first. With refresh=True the current
+    season is refetched even if cached, so it is replaced before it expires;
+    completed seasons are only reloaded once they have been evicted.
+
+    Returns:
+        Number of seasons loaded successfully. Failures are logged and skipped.
+    """
+    loaded = 0
+    with background_priority():
+        for year in years:
+            for stats_func, dataset in _warm_sources():
+                try:
+                    if refresh and is_current_season(year):
+                        await season_fetches.run(
+                            (stats_func, year),
+                            lambda: _fetch_season(stats_func, year, dataset),
+                        )
+                    else:
+                        await _load_season(stats_func, year, dataset)
+                    loaded += 1
+                except Exception:
+                    logger.warning("Could not warm %s %s", dataset, year, exc_info=True)
+    return loaded
+
+
+def _upstream_source(stats_func: Callable[..., pd.DataFrame]) -> str:
+    """Return the site stats_func scrapes; standings come from Baseball-Reference."""
+    if stats_func is _standings_frame:
+        return BASEBALL_REFERENCE
+    return FANGRAPHS
+
+
+def _standings_frame(year: int) -> pd.DataFrame:
+    """Fetch standings and combine the per-division tables into one DataFrame."""
+    division_dfs = standings(year)
+
+    all_teams = []
+    for division_name, df in zip(DIVISION_NAMES, division_dfs):
+        df = df.copy()
+        df["Division"] = division_name
+        all_teams.append(df)
+
+    return pd.concat(all_teams, ignore_index=True)
+
+
 async def _fetch_stats_by_year(
     year: int,
-    stats_func: Callable[[int], pd.DataFrame],
+    stats_func: Callable[..., pd.DataFrame],
     model_cls: Type[T],
     page: int = 1,
     page_size: int = 10,
     fields: str = "all",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    equals: Optional[Dict[str, Optional[str]]] = None,
+    minimums: Optional[Dict[str, Optional[float]]] = None,
+    response_format: str = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> dict:
     """
     Generic function to fetch stats by year and convert to Pydantic models.
@@ -54,101 +419,343 @@ async def _fetch_stats_by_year(
             - "advanced": Advanced metrics (wOBA, wRC+, WAR, etc.)
             - "statcast": Statcast data (EV, LA, Barrels, xwOBA, etc.)
             - Comma-separated field names for custom selection
+        sort_by: Field to sort by before paginating (alias or attribute name).
+        ascending: Sort direction for sort_by.
+        equals: Field name to value filters (case-insensitive match).
+        minimums: Field name to minimum value filters.
+        response_format: "records" for one dict per row, or "columnar" for
+            {"columns": [...], "rows": [[...], ...]}.
+        precision: Round float values to this many decimal places.
+        max_bytes: Serialized size budget for the page. page_size becomes an
+            upper bound, the page holds as many rows as fit (at least one),
+            and the response reports the page_size actually used and no
+            total_pages; next_cursor is the way to continue.
+        cursor: next_cursor token from a previous response. When given, the
+            page is served from that response's snapshot and every other
+            argument is ignored.
     Returns:
         Dictionary containing stats for the specified year.
     """
-    # Get data from pybaseball
+    if cursor is not None:
+        return await _resume_cursor(cursor)
+
+    # Get data from the season cache, falling back to pybaseball
     try:
-        df = await asyncio.to_thread(stats_func, year)
+        with metrics.stage("load"):
+            season = await _load_season(stats_func, year, model_cls.__name__)
     except Exception as e:
         return {"error": str(e)}
 
+    return await _page_response(
+        season,
+        model_cls,
+        {"year": year},
+        page,
+        page_size,
+        fields,
+        sort_by,
+        ascending,
+        equals,
+        minimums,
+        response_format,
+        precision,
+        max_bytes,
+    )
+
+
+async def _fetch_stats_by_range(
+    start_year: int,
+    end_year: int,
+    stats_func: Callable[..., pd.DataFrame],
+    model_cls: Type[T],
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "all",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    equals: Optional[Dict[str, Optional[str]]] = None,
+    minimums: Optional[Dict[str, Optional[float]]] = None,
+    response_format: str = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Generic function to fetch stats for a span of seasons as one paginated view.
+
+    Seasons missing from the cache and store are fetched with a single
+    multi-season upstream call. The combined view is cached so further pages
+    are served from memory.
+
+    Args:
+        start_year: First season year (inclusive).
+        end_year: Last season year (inclusive).
+        See _fetch_stats_by_year for the remaining arguments.
+    Returns:
+        Dictionary containing stats for every season in the range, one record
+        per player (or team) season.
+    """
+    if cursor is not None:
+        return await _resume_cursor(cursor)
+
+    if end_year < start_year:
+        return {"error": "end_year must be greater than or equal to start_year"}
+
+    try:
+        with metrics.stage("load"):
+            season = await _load_season_range(
+                stats_func, start_year, end_year, model_cls.__name__
+            )
+    except Exception as e:
+        return {"error": str(e)}
+
+    return await _page_response(
+        season,
+        model_cls,
+        {"start_year": start_year, "end_year": end_year},
+        page,
+        page_size,
+        fields,
+        sort_by,
+        ascending,
+        equals,
+        minimums,
+        response_format,
+        precision,
+        max_bytes,
+    )
+
+
+async def _page_response(
+    season: Season,
+    model_cls: Type[T],
+    header: Dict[str, Any],
+    page: int,
+    page_size: int,
+    fields: str,
+    sort_by: Optional[str],
+    ascending: bool,
+    equals: Optional[Dict[str, Optional[str]]],
+    minimums: Optional[Dict[str, Optional[float]]],
+    response_format: str = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> dict:
+    """
+    Filter, sort and paginate a season, converting one page to records.
+
+    Args:
+        season: Season (or combined range of seasons) to page through.
+        model_cls: Pydantic model class to convert data into.
+        header: Keys identifying the request (e.g. {"year": 2023}) that lead
+            the response.
+        See _fetch_stats_by_year for the remaining arguments.
+    Returns:
+        The paginated response dictionary.
+    """
+    if page < 1:
+        return {"error": "page must be >= 1"}
+    if page_size < 1:
+        return {"error": "page_size must be >= 1"}
+    if max_bytes is not None and max_bytes <= 0:
+        return {"error": "max_bytes must be positive"}
+    if precision is not None and precision < 0:
+        return {"error": "precision must be non-negative"}
+
+    header = {**header, "as_of": _as_of(season)}
+    df = season.frame
+
     if df.empty:
         return {
-            "year": year,
+            **header,
             "total_rows": 0,
             "page": page,
             "page_size": page_size,
-            "data": [],
+            **_empty_page(response_format),
+            **_unknown_fields(model_cls, fields),
         }
 
-    total_rows = len(df)
+    # Repeats of a request share one pinned view, so plain page requests do
+    # not pin a snapshot each and crowd out the ones live cursors point at
+    key = (
+        season,
+        model_cls,
+        json.dumps(
+            [header, fields, sort_by, ascending, equals, minimums],
+            sort_keys=True,
+            default=str,
+        ),
+        page_size,
+        response_format,
+        precision,
+        max_bytes,
+    )
+    view = page_cursors.find(key)
+    if view is None:
+        # Filter and sort the whole season before paginating
+        try:
+            with metrics.stage("filter_sort"):
+                positions = view_positions(
+                    season, model_cls, sort_by, ascending, equals, minimums
+                )
+        except ValueError as e:
+            return {"error": str(e)}
+
+        view = PageView(
+            season,
+            positions,
+            model_cls,
+            fields,
+            page_size,
+            header,
+            response_format,
+            precision,
+            max_bytes,
+            key=key,
+        )
+    return await _slice_response(view, (page - 1) * page_size, page)
+
+
+def _unknown_fields(model_cls: Type[BaseModel], fields: str) -> Dict[str, List[str]]:
+    """Return the requested field names model_cls does not have, keyed for a response."""
+    unknown = field_plan(model_cls, fields).unknown
+    return {"unknown_fields": list(unknown)} if unknown else {}
+
+
+def _empty_page(response_format: str) -> Dict[str, list]:
+    """Return the data keys of a page without rows in the requested format."""
+    if response_format == "columnar":
+        return {"columns": [], "rows": []}
+    return {"data": []}
+
+
+async def _resume_cursor(cursor: str) -> dict:
+    """Serve the page a cursor token points at from its pinned snapshot."""
+    resolved = page_cursors.resolve(cursor)
+    if resolved is None:
+        return {"error": "Cursor is invalid or expired; request the first page again"}
+    view, start, page = resolved
+    return await _slice_response(view, start, page)
+
+
+async def _slice_response(view: PageView, start: int, page: int) -> dict:
+    """
+    Convert page number page of a view, starting at row offset start.
 
-    # Pagination math
-    start = (page - 1) * page_size
-    end = start + page_size
+    Returns:
+        The paginated response dictionary, with a next_cursor token pinning
+        the view when more rows follow. Pages sized by max_bytes hold varying
+        numbers of rows, so their responses leave out total_pages.
+    """
+    total_rows = view.total_rows
+    page_size = view.page_size
 
     if start >= total_rows:
         return {
-            "year": year,
+            **view.header,
             "total_rows": total_rows,
             "page": page,
             "page_size": page_size,
-            "data": [],
+            **_empty_page(view.format),
+            **_unknown_fields(view.model_cls, view.fields),
         }
 
-    # Slice BEFORE converting to Pydantic
-    page_df = df.iloc[start:end]
-
-    records = page_df.to_dict("records")
-
-    # Only validate page subset
-    models: List[T] = [model_cls.model_validate(row) for row in records]
-
-    # Convert to dicts
-    data = [m.model_dump(mode="json", exclude_none=True) for m in models]
-
-    # Apply field filtering if requested
-    if fields != "all":
-        data = _filter_fields(data, fields, model_cls.__name__)
+    end = min(start + page_size, total_rows)
+    if view.max_bytes is None:
+        data = await _convert_rows(view, start, end)
+    else:
+        data = await _budgeted_rows(view, start, end, view.max_bytes)
+        # Report the page size the budget allowed
+        page_size = len(_page_rows(data))
+        end = start + page_size
 
-    return {
-        "year": year,
+    response = {
+        **view.header,
         "total_rows": total_rows,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total_rows + page_size - 1) // page_size,
-        "data": data,
     }
+    if view.max_bytes is None:
+        response["total_pages"] = (total_rows + page_size - 1) // page_size
+    response.update(data)
+    response.update(_unknown_fields(view.model_cls, view.fields))
+    if end < total_rows:
+        response["next_cursor"] = page_cursors.issue(view, end, page + 1)
+    return response
+
+
+async def _convert_rows(view: PageView, start: int, end: int) -> Dict[str, Any]:
+    """Convert rows start to end (exclusive) of a view to its response format."""
+    # Slice BEFORE converting to Pydantic, and only keep the selected columns
+    with metrics.stage("project"):
+        plan = field_plan(view.model_cls, view.fields)
+        page_df = view.rows(start, end)
+        page_df = page_df[plan.columns(page_df.columns)]
+        if view.precision is not None:
+            # Only decimal stats; integer counts and IDs are never rounded
+            decimals = page_df.select_dtypes(include="float").columns
+            page_df = page_df.round(dict.fromkeys(decimals, view.precision))
+
+    with metrics.stage("convert"):
+        if view.format == "columnar":
+            # Compact payload taken straight from the slice's columns
+            return columnar_records(plan.model, page_df)
+        # Validate and serialize the page in one batch against the reduced
+        # model, in a worker process when the page is large
+        return {
+            "data": await conversion_pool.convert(view.model_cls, view.fields, page_df)
+        }
 
 
-def _filter_fields(data: List[dict], fields: str, model_name: str) -> List[dict]:
+async def _budgeted_rows(
+    view: PageView, start: int, end: int, max_bytes: int
+) -> Dict[str, Any]:
     """
-    Filter data to only include specified fields.
-
-    Args:
-        data: List of dictionaries to filter
-        fields: Field specification (preset or comma-separated list)
-        model_name: Name of the model (e.g. "BattingStats", "TeamPitchingStats")
+    Convert as many rows from start (up to end) as fit in max_bytes.
 
-    Returns:
-        Filtered list of dictionaries
+    The serialized size of a row is estimated from a converted sample, the
+    estimated number of rows is converted, and the page is then trimmed to
+    the rows that actually fit. At least one row is always returned.
     """
-    presets = PRESET_MAP.get(model_name, BATTING_PRESETS)
-    identity_fields = IDENTITY_FIELD_MAP.get(model_name, PLAYER_IDENTITY_FIELDS)
-
-    # Determine which fields to keep
-    if fields in presets:
-        keep_fields = set(presets[fields])
-    else:
-        # Treat as comma-separated list of field names
-        keep_fields = set(f.strip() for f in fields.split(","))
+    data = await _convert_rows(view, start, min(end, start + BUDGET_SAMPLE_ROWS))
+    rows = _page_rows(data)
+
+    # Measure every key the response carries besides the rows and the page
+    # counters and cursor covered by PAGE_ENVELOPE_BYTES
+    envelope = {key: value for key, value in data.items() if value is not rows}
+    envelope.update(_unknown_fields(view.model_cls, view.fields))
+    budget = (
+        max_bytes - serialized_size({**view.header, **envelope}) - PAGE_ENVELOPE_BYTES
+    )
+    count = estimate_rows(rows, budget, end - start)
+    if count > len(rows):
+        data = await _convert_rows(view, start, start + count)
+        rows = _page_rows(data)
 
-    # Always include identity fields
-    keep_fields.update(identity_fields)
+    del rows[rows_within_budget(rows, budget) :]
+    return data
 
-    # Filter each record
-    filtered_data = []
-    for record in data:
-        filtered_record = {k: v for k, v in record.items() if k in keep_fields}
-        filtered_data.append(filtered_record)
 
-    return filtered_data
+def _page_rows(data: Dict[str, Any]) -> List[Any]:
+    """Return the list of rows in a converted page of either format."""
+    return data["rows"] if "rows" in data else data["data"]
 
 
 @mcp.tool()
+@metrics.tool
 async def batting_stats_by_year(
-    year: int, page: int = 1, page_size: int = 10, fields: str = "basic"
+    year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    team: Optional[str] = None,
+    min_pa: Optional[int] = None,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> dict:
     """
     Retrieve MLB batting statistics for a specific regular season year.
@@ -174,18 +781,56 @@ async def batting_stats_by_year(
             - "advanced": Advanced metrics (wOBA, wRC+, WAR, ISO, BABIP, etc.)
             - "statcast": Statcast data (EV, LA, Barrels, xwOBA, etc.)
             - "all": All available fields (WARNING: large payload, use small page_size)
-            - Custom: Comma-separated field names (e.g., "Name,Team,HR,AVG,WAR")
+            - Custom: Comma-separated field names (e.g., "Name,Team,HR,AVG,WAR").
+              Stat names (e.g., "wRC+") and their attribute names (e.g., "wRC_plus")
+              both work; names that match no field are listed in "unknown_fields".
+
+        sort_by (str, optional):
+            Field to sort players by before paginating (e.g., "WAR", "HR", "wRC+").
+            Missing values are always sorted last.
+
+        ascending (bool, default=False):
+            Sort direction for sort_by. The default puts the highest values first.
+
+        team (str, optional):
+            Only include players on this team (e.g., "NYY"). Case-insensitive.
+
+        min_pa (int, optional):
+            Only include players with at least this many plate appearances.
+
+        format (str, default="records"):
+            "records" returns "data" as one dict per row. "columnar" replaces
+            "data" with "columns" (field names, once) and "rows" (one list of
+            values per row), which is far smaller for wide field sets.
+
+        precision (int, optional):
+            Round decimal stats to this many places (e.g. 3) to shrink the payload.
+
+        max_bytes (int, optional):
+            Size budget for the serialized response, in bytes (about 4 bytes per
+            token). The server fits as many rows as the budget allows, up to
+            page_size, and reports the number it used as page_size. Pages then
+            hold varying numbers of rows, so total_pages is left out: continue
+            with next_cursor rather than page.
+
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
 
     Returns:
         dict with the following structure:
 
         {
             "year": int,
-            "total_rows": int,        # total number of players in dataset
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_rows": int,        # number of players matching the filters
             "page": int,
-            "page_size": int,
-            "total_pages": int,
-            "data": List[dict]         # list of player batting stat records
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # list of player batting stat records
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
         }
 
     Notes:
@@ -195,13 +840,38 @@ async def batting_stats_by_year(
         - IDfg and Season are always included for player identification.
     """
     return await _fetch_stats_by_year(
-        year, batting_stats, BattingStats, page, page_size, fields
+        year,
+        batting_stats,
+        BattingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        equals={"Team": team},
+        minimums={"PA": min_pa},
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
     )
 
 
 @mcp.tool()
+@metrics.tool
 async def pitching_stats_by_year(
-    year: int, page: int = 1, page_size: int = 10, fields: str = "basic"
+    year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    team: Optional[str] = None,
+    min_ip: Optional[float] = None,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> dict:
     """
     Retrieve MLB pitching statistics for a specific regular season year.
@@ -227,18 +897,57 @@ async def pitching_stats_by_year(
             - "advanced": Advanced metrics (FIP, xFIP, SIERA, K%, WAR, etc.)
             - "statcast": Statcast data (EV, LA, Barrel%, xwOBA, xERA, etc.)
             - "all": All available fields (WARNING: large payload, use small page_size)
-            - Custom: Comma-separated field names (e.g., "Name,Team,ERA,WHIP,WAR")
+            - Custom: Comma-separated field names (e.g., "Name,Team,ERA,WHIP,WAR").
+              Stat names (e.g., "K/9") and their attribute names (e.g., "K_9")
+              both work; names that match no field are listed in "unknown_fields".
+
+        sort_by (str, optional):
+            Field to sort players by before paginating (e.g., "WAR", "ERA", "SO").
+            Missing values are always sorted last.
+
+        ascending (bool, default=False):
+            Sort direction for sort_by. The default puts the highest values first;
+            use True for stats where lower is better (e.g., ERA, WHIP).
+
+        team (str, optional):
+            Only include players on this team (e.g., "NYY"). Case-insensitive.
+
+        min_ip (float, optional):
+            Only include pitchers with at least this many innings pitched.
+
+        format (str, default="records"):
+            "records" returns "data" as one dict per row. "columnar" replaces
+            "data" with "columns" (field names, once) and "rows" (one list of
+            values per row), which is far smaller for wide field sets.
+
+        precision (int, optional):
+            Round decimal stats to this many places (e.g. 3) to shrink the payload.
+
+        max_bytes (int, optional):
+            Size budget for the serialized response, in bytes (about 4 bytes per
+            token). The server fits as many rows as the budget allows, up to
+            page_size, and reports the number it used as page_size. Pages then
+            hold varying numbers of rows, so total_pages is left out: continue
+            with next_cursor rather than page.
+
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
 
     Returns:
         dict with the following structure:
 
         {
             "year": int,
-            "total_rows": int,        # total number of players in dataset
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_rows": int,        # number of players matching the filters
             "page": int,
-            "page_size": int,
-            "total_pages": int,
-            "data": List[dict]         # list of player pitching stat records
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # list of player pitching stat records
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
         }
 
     Notes:
@@ -248,13 +957,36 @@ async def pitching_stats_by_year(
         - IDfg and Season are always included for player identification.
     """
     return await _fetch_stats_by_year(
-        year, pitching_stats, PitchingStats, page, page_size, fields
+        year,
+        pitching_stats,
+        PitchingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        equals={"Team": team},
+        minimums={"IP": min_ip},
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
     )
 
 
 @mcp.tool()
+@metrics.tool
 async def team_pitching_stats_by_year(
-    year: int, page: int = 1, page_size: int = 10, fields: str = "basic"
+    year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> dict:
     """
     Retrieve MLB team-level pitching statistics for a specific regular season year.
@@ -276,27 +1008,74 @@ async def team_pitching_stats_by_year(
             - "basic": Core stats (Team, W, L, ERA, G, IP, SO, WHIP, K/9, etc.)
             - "advanced": Advanced metrics (FIP, xFIP, SIERA, K%, WAR, etc.)
             - "all": All available fields (WARNING: large payload, use small page_size)
-            - Custom: Comma-separated field names (e.g., "Team,ERA,WHIP,WAR")
+            - Custom: Comma-separated field names (e.g., "Team,ERA,WHIP,WAR").
+              Stat names (e.g., "LOB%") and their attribute names (e.g., "LOB_pct")
+              both work; names that match no field are listed in "unknown_fields".
+        sort_by (str, optional):
+            Field to sort teams by before paginating (e.g., "ERA", "WAR").
+        ascending (bool, default=False):
+            Sort direction for sort_by. Use True for stats where lower is better.
+        format (str, default="records"):
+            "records" returns "data" as one dict per row. "columnar" replaces
+            "data" with "columns" (field names, once) and "rows" (one list of
+            values per row), which is far smaller for wide field sets.
+        precision (int, optional):
+            Round decimal stats to this many places (e.g. 3) to shrink the payload.
+
+        max_bytes (int, optional):
+            Size budget for the serialized response, in bytes (about 4 bytes per
+            token). The server fits as many rows as the budget allows, up to
+            page_size, and reports the number it used as page_size. Pages then
+            hold varying numbers of rows, so total_pages is left out: continue
+            with next_cursor rather than page.
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
     Returns:
         dict with the following structure:
 
         {
             "year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
             "total_rows": int,        # total number of teams in dataset (should be 30)
             "page": int,
-            "page_size": int,
-            "total_pages": int,
-            "data": List[dict]         # list of team pitching stat records
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # list of team pitching stat records
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
         }
     """
     return await _fetch_stats_by_year(
-        year, team_pitching, TeamPitchingStats, page, page_size, fields
+        year,
+        team_pitching,
+        TeamPitchingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
     )
 
 
 @mcp.tool()
+@metrics.tool
 async def team_batting_stats_by_year(
-    year: int, page: int = 1, page_size: int = 10, fields: str = "basic"
+    year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> dict:
     """
     Retrieve MLB team-level batting statistics for a specific regular season year.
@@ -318,25 +1097,743 @@ async def team_batting_stats_by_year(
             - "basic": Core stats (Team, G, AB, H, HR, RBI, AVG, OPS, etc.)
             - "advanced": Advanced metrics (wOBA, wRC+, WAR, ISO, BABIP, etc.)
             - "all": All available fields (WARNING: large payload, use small page_size)
-            - Custom: Comma-separated field names (e.g., "Team,AVG,OPS,HR")
+            - Custom: Comma-separated field names (e.g., "Team,AVG,OPS,HR").
+              Stat names (e.g., "wRC+") and their attribute names (e.g., "wRC_plus")
+              both work; names that match no field are listed in "unknown_fields".
+        sort_by (str, optional):
+            Field to sort teams by before paginating (e.g., "HR", "wRC+").
+        ascending (bool, default=False):
+            Sort direction for sort_by. The default puts the highest values first.
+        format (str, default="records"):
+            "records" returns "data" as one dict per row. "columnar" replaces
+            "data" with "columns" (field names, once) and "rows" (one list of
+            values per row), which is far smaller for wide field sets.
+        precision (int, optional):
+            Round decimal stats to this many places (e.g. 3) to shrink the payload.
+
+        max_bytes (int, optional):
+            Size budget for the serialized response, in bytes (about 4 bytes per
+            token). The server fits as many rows as the budget allows, up to
+            page_size, and reports the number it used as page_size. Pages then
+            hold varying numbers of rows, so total_pages is left out: continue
+            with next_cursor rather than page.
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
     Returns:
         dict with the following structure:
 
         {
             "year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
             "total_rows": int,        # total number of teams in dataset (should be 30)
             "page": int,
-            "page_size": int,
-            "total_pages": int,
-            "data": List[dict]         # list of team batting stat records
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # list of team batting stat records
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
         }
     """
     return await _fetch_stats_by_year(
-        year, team_batting, TeamBattingStats, page, page_size, fields
+        year,
+        team_batting,
+        TeamBattingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+@metrics.tool
+async def batting_stats_by_range(
+    start_year: int,
+    end_year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    team: Optional[str] = None,
+    min_pa: Optional[int] = None,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Retrieve MLB batting statistics for a range of regular seasons in one call.
+
+    Returns one record per player season, paginated across the whole range.
+    Use this instead of calling batting_stats_by_year once per season.
+
+    Parameters:
+        start_year (int):
+            First season of the range (e.g., 2015).
+
+        end_year (int):
+            Last season of the range, inclusive (e.g., 2024).
+
+        page, page_size, fields, sort_by, ascending, team, min_pa, format,
+        precision, max_bytes:
+            Same as batting_stats_by_year. Sorting and filtering apply to the
+            whole range (e.g., sort_by="HR" returns the best single seasons).
+
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "start_year": int,
+            "end_year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_rows": int,        # number of player seasons matching the filters
+            "page": int,
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # player season records; Season identifies the year
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
+        }
+    """
+    return await _fetch_stats_by_range(
+        start_year,
+        end_year,
+        batting_stats,
+        BattingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        equals={"Team": team},
+        minimums={"PA": min_pa},
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
     )
 
 
 @mcp.tool()
+@metrics.tool
+async def pitching_stats_by_range(
+    start_year: int,
+    end_year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    team: Optional[str] = None,
+    min_ip: Optional[float] = None,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Retrieve MLB pitching statistics for a range of regular seasons in one call.
+
+    Returns one record per player season, paginated across the whole range.
+    Use this instead of calling pitching_stats_by_year once per season.
+
+    Parameters:
+        start_year (int):
+            First season of the range (e.g., 2015).
+
+        end_year (int):
+            Last season of the range, inclusive (e.g., 2024).
+
+        page, page_size, fields, sort_by, ascending, team, min_ip, format,
+        precision, max_bytes:
+            Same as pitching_stats_by_year. Sorting and filtering apply to the
+            whole range (e.g., sort_by="SO" returns the best single seasons).
+
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "start_year": int,
+            "end_year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_rows": int,        # number of player seasons matching the filters
+            "page": int,
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # player season records; Season identifies the year
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
+        }
+    """
+    return await _fetch_stats_by_range(
+        start_year,
+        end_year,
+        pitching_stats,
+        PitchingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        equals={"Team": team},
+        minimums={"IP": min_ip},
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+@metrics.tool
+async def team_pitching_stats_by_range(
+    start_year: int,
+    end_year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Retrieve MLB team-level pitching statistics for a range of regular seasons.
+
+    Returns one record per team season (30 per season), paginated across the
+    whole range.
+
+    Parameters:
+        start_year (int):
+            First season of the range (e.g., 2015).
+        end_year (int):
+            Last season of the range, inclusive (e.g., 2024).
+        page, page_size, fields, sort_by, ascending, format,
+        precision, max_bytes:
+            Same as team_pitching_stats_by_year.
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
+    Returns:
+        dict with the following structure:
+
+        {
+            "start_year": int,
+            "end_year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_rows": int,        # number of team seasons in the range
+            "page": int,
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # team season records; Season identifies the year
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
+        }
+    """
+    return await _fetch_stats_by_range(
+        start_year,
+        end_year,
+        team_pitching,
+        TeamPitchingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+@metrics.tool
+async def team_batting_stats_by_range(
+    start_year: int,
+    end_year: int,
+    page: int = 1,
+    page_size: int = 10,
+    fields: str = "basic",
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    format: Literal["records", "columnar"] = "records",
+    precision: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Retrieve MLB team-level batting statistics for a range of regular seasons.
+
+    Returns one record per team season (30 per season), paginated across the
+    whole range.
+
+    Parameters:
+        start_year (int):
+            First season of the range (e.g., 2015).
+        end_year (int):
+            Last season of the range, inclusive (e.g., 2024).
+        page, page_size, fields, sort_by, ascending, format,
+        precision, max_bytes:
+            Same as team_batting_stats_by_year.
+        cursor (str, optional):
+            next_cursor value from a previous response. Returns the following
+            page of that exact result set (same season snapshot, filters, sort,
+            fields, page_size and max_bytes); the other parameters are ignored.
+    Returns:
+        dict with the following structure:
+
+        {
+            "start_year": int,
+            "end_year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_rows": int,        # number of team seasons in the range
+            "page": int,
+            "page_size": int,         # rows in this page when max_bytes is set
+            "total_pages": int,       # left out when max_bytes is set
+            "data": List[dict],        # team season records; Season identifies the year
+            "next_cursor": str,        # present when more pages follow
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
+        }
+    """
+    return await _fetch_stats_by_range(
+        start_year,
+        end_year,
+        team_batting,
+        TeamBattingStats,
+        page,
+        page_size,
+        fields,
+        sort_by=sort_by,
+        ascending=ascending,
+        response_format=format,
+        precision=precision,
+        max_bytes=max_bytes,
+        cursor=cursor,
+    )
+
+
+@mcp.tool()
+@metrics.tool
+async def player_career(
+    player_id: int,
+    start_year: int,
+    end_year: int,
+    stat_type: Literal["batting", "pitching"] = "batting",
+    fields: str = "basic",
+) -> dict:
+    """
+    Retrieve one player's season-by-season statistics across a range of years.
+
+    Looks the player up by FanGraphs ID in each season instead of paging through
+    whole seasons. Seasons the player did not appear in are simply omitted.
+
+    Parameters:
+        player_id (int):
+            FanGraphs player ID (the IDfg field of the stats tools, e.g., 18401).
+
+        start_year (int):
+            First season to search (e.g., the player's debut year).
+
+        end_year (int):
+            Last season to search, inclusive.
+
+        stat_type (str, default="batting"):
+            "batting" or "pitching".
+
+        fields (str, default="basic"):
+            Same presets and custom field lists as batting_stats_by_year or
+            pitching_stats_by_year.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "player_id": int,
+            "stat_type": str,
+            "start_year": int,
+            "end_year": int,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_seasons": int,     # number of season lines found
+            "data": List[dict],        # season lines in chronological order
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
+        }
+    """
+    if end_year < start_year:
+        return {"error": "end_year must be greater than or equal to start_year"}
+
+    try:
+        stats_func, model_cls = _stats_source(stat_type)
+        with metrics.stage("load"):
+            seasons = await _load_seasons(
+                stats_func, start_year, end_year, model_cls.__name__
+            )
+    except Exception as e:
+        return {"error": str(e)}
+
+    plan = field_plan(model_cls, fields)
+    data = []
+    for season in seasons:
+        if season.frame.empty:
+            continue
+        positions = season.rows_for("IDfg", player_id)
+        if len(positions) == 0:
+            continue
+        rows = season.frame.iloc[positions]
+        data.extend(convert_records(plan.model, rows[plan.columns(rows.columns)]))
+
+    return {
+        "player_id": player_id,
+        "stat_type": stat_type,
+        "start_year": start_year,
+        "end_year": end_year,
+        "as_of": _as_of(*seasons),
+        "total_seasons": len(data),
+        "data": data,
+        **_unknown_fields(model_cls, fields),
+    }
+
+
+@mcp.tool()
+@metrics.tool
+async def search_players(
+    name: str,
+    year: int,
+    stat_type: Literal["batting", "pitching"] = "batting",
+    limit: int = 10,
+) -> dict:
+    """
+    Find players by name in a season and return their FanGraphs IDs.
+
+    Matching ignores accents, case and punctuation and tolerates partial names
+    and small typos (e.g., "acuna" finds "Ronald Acuña Jr."). Use the returned
+    IDfg with player_career or to locate the player in the stats tools.
+
+    Parameters:
+        name (str):
+            Full or partial player name.
+
+        year (int):
+            Four-digit MLB season year to search (e.g., 2023).
+
+        stat_type (str, default="batting"):
+            "batting" to search hitters, "pitching" to search pitchers.
+
+        limit (int, default=10):
+            Maximum number of matches to return.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "query": str,
+            "year": int,
+            "stat_type": str,
+            "as_of": str,       # when the data was fetched (ISO 8601, UTC)
+            "data": List[dict]  # each dict has: IDfg, Name, Team, Season, score
+        }
+
+    Notes:
+        - Matches are ordered best first; an exact name match scores highest.
+    """
+    try:
+        stats_func, model_cls = _stats_source(stat_type)
+        with metrics.stage("load"):
+            season = await _load_season(stats_func, year, model_cls.__name__)
+    except Exception as e:
+        return {"error": str(e)}
+
+    data = []
+    if not season.frame.empty:
+        rows = season.frame
+        for position, score in season.name_index("Name").search(name, limit):
+            row = rows.iloc[position]
+            data.append(
+                {
+                    "IDfg": int(row["IDfg"]),
+                    "Name": row["Name"],
+                    "Team": row["Team"],
+                    "Season": int(row["Season"]),
+                    "score": score,
+                }
+            )
+
+    return {
+        "query": name,
+        "year": year,
+        "stat_type": stat_type,
+        "as_of": _as_of(season),
+        "data": data,
+    }
+
+
+@mcp.tool()
+@metrics.tool
+async def leaderboard(
+    stat: str,
+    year: int,
+    end_year: Optional[int] = None,
+    stat_type: Literal[
+        "batting", "pitching", "team_batting", "team_pitching"
+    ] = "batting",
+    k: int = 10,
+    ascending: bool = False,
+    min_pa: Optional[int] = None,
+    min_ip: Optional[float] = None,
+    fields: Optional[str] = None,
+) -> dict:
+    """
+    Retrieve the top players or teams in one statistic.
+
+    Answers "who led the league in X" in a single call, returning only the top
+    k rows instead of paging through the whole season.
+
+    Parameters:
+        stat (str):
+            Numeric field to rank by (e.g., "HR", "WAR", "wRC+", "ERA", "SO").
+
+        year (int):
+            Four-digit MLB season year (e.g., 2023).
+
+        end_year (int, optional):
+            If set, rank every player (or team) season from year to end_year,
+            e.g., the best single-season HR totals of the decade.
+
+        stat_type (str, default="batting"):
+            "batting", "pitching", "team_batting" or "team_pitching".
+
+        k (int, default=10):
+            Number of leaders to return.
+
+        ascending (bool, default=False):
+            Rank lowest values first. Use True for stats where lower is better
+            (e.g., ERA, WHIP, FIP).
+
+        min_pa (int, optional):
+            Qualification threshold: minimum plate appearances (batting types).
+
+        min_ip (float, optional):
+            Qualification threshold: minimum innings pitched (pitching types).
+
+        fields (str, optional):
+            Extra comma-separated fields to include with each leader
+            (e.g., "G,PA").
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "stat": str,
+            "stat_type": str,
+            "year": int,
+            "end_year": int,            # only present for multi-season rankings
+            "as_of": str,               # when the data was fetched (ISO 8601, UTC)
+            "total_qualified": int,     # rows that met the thresholds
+            "data": List[dict],         # leaders with identity fields, Name/Team and stat
+            "unknown_fields": List[str],  # extra fields that do not exist, if any
+        }
+
+    Notes:
+        - Rows with no value for the stat are never ranked.
+    """
+    if end_year is not None and end_year < year:
+        return {"error": "end_year must be greater than or equal to year"}
+
+    try:
+        stats_func, model_cls = _stats_source(stat_type)
+        with metrics.stage("load"):
+            if end_year is None:
+                season = await _load_season(stats_func, year, model_cls.__name__)
+            else:
+                season = await _load_season_range(
+                    stats_func, year, end_year, model_cls.__name__
+                )
+    except Exception as e:
+        return {"error": str(e)}
+
+    header: Dict[str, Any] = {"stat": stat, "stat_type": stat_type, "year": year}
+    if end_year is not None:
+        header["end_year"] = end_year
+    header["as_of"] = _as_of(season)
+
+    df = season.frame
+    if df.empty:
+        return {**header, "total_qualified": 0, "data": []}
+
+    try:
+        column = field_column(model_cls, stat, df.columns)
+        mask = filter_mask(df, model_cls, minimums={"PA": min_pa, "IP": min_ip})
+    except ValueError as e:
+        return {"error": str(e)}
+    if not pd.api.types.is_numeric_dtype(df[column]):
+        return {"error": f"Field is not numeric: {stat}"}
+
+    values = df[column].reset_index(drop=True)
+    if mask is not None:
+        values = values[mask]
+    values = values.dropna()
+
+    # Partial selection: O(n log k) instead of sorting every row
+    if ascending:
+        leaders = values.nsmallest(k, keep="first")
+    else:
+        leaders = values.nlargest(k, keep="first")
+
+    attribute = field_attribute(model_cls, stat)
+    leader_fields = ",".join(["Name", "Team", attribute] + ([fields] if fields else []))
+    plan = field_plan(model_cls, leader_fields)
+    rows = df.iloc[leaders.index.to_numpy()]
+    data = convert_records(plan.model, rows[plan.columns(rows.columns)])
+
+    response = {**header, "total_qualified": len(values), "data": data}
+    if fields:
+        response.update(_unknown_fields(model_cls, fields))
+    return response
+
+
+@mcp.tool()
+@metrics.tool
+async def team_aggregate(
+    year: int,
+    stat_type: Literal["batting", "pitching"] = "batting",
+    team: Optional[str] = None,
+    min_age: Optional[int] = None,
+    max_age: Optional[int] = None,
+    min_pa: Optional[int] = None,
+    min_ip: Optional[float] = None,
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+) -> dict:
+    """
+    Aggregate player-level statistics into team totals for a subset of players.
+
+    Covers splits the team stats tools cannot, e.g. each team's production
+    from players under 27. Player rows matching the filters are summed by
+    team, and rate stats are recomputed from the summed components (AVG as
+    total H / total AB, ERA from total ER and innings), so they are weighted
+    correctly rather than averaged across players.
+
+    Parameters:
+        year (int):
+            Four-digit MLB season year (e.g., 2023).
+
+        stat_type (str, default="batting"):
+            "batting" or "pitching".
+
+        team (str, optional):
+            Only aggregate this team (e.g., "NYY"). Case-insensitive.
+
+        min_age (int, optional):
+            Only include players at least this old (season age).
+
+        max_age (int, optional):
+            Only include players at most this old, e.g. 26 for "under 27".
+
+        min_pa (int, optional):
+            Only include batters with at least this many plate appearances.
+
+        min_ip (float, optional):
+            Only include pitchers with at least this many innings pitched.
+
+        sort_by (str, optional):
+            Aggregate field to sort teams by (e.g., "HR", "OPS", "ERA", "K/9").
+            Teams are listed alphabetically by default.
+
+        ascending (bool, default=False):
+            Sort direction for sort_by.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "year": int,
+            "stat_type": str,
+            "as_of": str,             # when the data was fetched (ISO 8601, UTC)
+            "total_teams": int,
+            "data": List[dict]        # per team: Team, Players, summed counting
+                                      # stats, rate stats and WAR
+        }
+
+    Notes:
+        - Batting rates: AVG, OBP, SLG, OPS, ISO, BB%, K%.
+          Pitching rates: ERA, WHIP, K/9, BB/9, HR/9.
+        - Players traded mid-season are listed by FanGraphs under "- - -" with
+          no per-team split, so they are not included in any team's totals.
+    """
+    try:
+        stats_func, model_cls = _stats_source(stat_type)
+        with metrics.stage("load"):
+            season = await _load_season(stats_func, year, model_cls.__name__)
+    except Exception as e:
+        return {"error": str(e)}
+
+    header = {"year": year, "stat_type": stat_type, "as_of": _as_of(season)}
+    df = season.frame
+    if df.empty:
+        return {**header, "total_teams": 0, "data": []}
+
+    try:
+        with metrics.stage("filter_sort"):
+            mask = filter_mask(
+                df,
+                model_cls,
+                equals={"Team": team},
+                minimums={"Age": min_age, "PA": min_pa, "IP": min_ip},
+                maximums={"Age": max_age},
+            )
+    except ValueError as e:
+        return {"error": str(e)}
+    if mask is not None:
+        df = df[mask]
+
+    # One groupby over the filtered players, then column-wise rates
+    aggregate_model: Type[BaseModel]
+    with metrics.stage("aggregate"):
+        if stat_type == "pitching":
+            aggregate_model = TeamPitchingAggregate
+            totals = pitching_rates(team_totals(df, PITCHING_TOTALS))
+        else:
+            aggregate_model = TeamBattingAggregate
+            totals = batting_rates(team_totals(df, BATTING_TOTALS))
+
+    if sort_by is not None:
+        try:
+            column = field_column(aggregate_model, sort_by, totals.columns)
+        except ValueError as e:
+            return {"error": str(e)}
+        totals = totals.sort_values(
+            column, ascending=ascending, kind="stable", na_position="last"
+        )
+
+    with metrics.stage("convert"):
+        data = convert_records(aggregate_model, totals)
+
+    return {**header, "total_teams": len(data), "data": data}
+
+
+@mcp.tool()
+@metrics.tool
 async def standings_by_year(year: int) -> dict:
     """
     Retrieve MLB standings for a specific season year.
@@ -353,6 +1850,7 @@ async def standings_by_year(year: int) -> dict:
 
         {
             "year": int,
+            "as_of": str,  # when the data was fetched (ISO 8601, UTC)
             "total_teams": int,
             "data": List[dict]  # each dict has: Tm, W, L, W-L%, GB, Division
         }
@@ -362,29 +1860,309 @@ async def standings_by_year(year: int) -> dict:
         - GB (Games Back) is relative to the division leader and returned as a string.
     """
     try:
-        division_dfs = await asyncio.to_thread(standings, year)
+        with metrics.stage("load"):
+            season = await _load_season(_standings_frame, year, "StandingsRecord")
     except Exception as e:
         return {"error": str(e)}
 
-    all_teams = []
-    for division_name, df in zip(DIVISION_NAMES, division_dfs):
-        df = df.copy()
-        df["Division"] = division_name
-        all_teams.append(df)
-
-    combined = pd.concat(all_teams, ignore_index=True)
-    records = combined.to_dict("records")
+    records = season.frame.to_dict("records")
 
     models = [StandingsRecord.model_validate(row) for row in records]
     data = [m.model_dump(mode="json") for m in models]
 
     return {
         "year": year,
+        "as_of": _as_of(season),
         "total_teams": len(data),
         "data": data,
     }
 
 
+@mcp.tool()
+@metrics.tool
+async def team_report(
+    year: int,
+    team: Optional[str] = None,
+    batting_fields: str = TEAM_REPORT_BATTING_FIELDS,
+    pitching_fields: str = TEAM_REPORT_PITCHING_FIELDS,
+) -> dict:
+    """
+    Summarize how teams are doing: standings, batting and pitching in one record.
+
+    Answers "how is team X doing" in a single call. Standings, team batting
+    and team pitching are loaded concurrently and joined per team, so this is
+    faster than calling standings_by_year, team_batting_stats_by_year and
+    team_pitching_stats_by_year in turn.
+
+    Parameters:
+        year (int):
+            Four-digit MLB season year (e.g., 2023).
+
+        team (str, optional):
+            Only report this team, given as a FanGraphs abbreviation (e.g., "NYY")
+            or a full name (e.g., "New York Yankees"). Case-insensitive.
+
+        batting_fields (str, default="R,HR,AVG,OBP,SLG,wRC+,WAR"):
+            Comma-separated team batting fields (see team_batting_stats_by_year).
+
+        pitching_fields (str, default="ERA,FIP,WHIP,K/9,BB/9,WAR"):
+            Comma-separated team pitching fields (see team_pitching_stats_by_year).
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "year": int,
+            "as_of": str,             # when the oldest source was fetched (ISO 8601, UTC)
+            "total_teams": int,
+            "data": List[dict],       # per team: Team, teamIDfg, Tm, W, L, W_L_pct,
+                                      # GB, Division, batting (dict), pitching (dict)
+            "unknown_fields": List[str],  # requested fields that do not exist, if any
+        }
+
+    Notes:
+        - Teams are ordered as in standings_by_year: by division, then record.
+        - batting or pitching is null if FanGraphs has no row for the team.
+    """
+    try:
+        with metrics.stage("load"):
+            standings_season, batting, pitching = await asyncio.gather(
+                _load_season(_standings_frame, year, "StandingsRecord"),
+                _load_season(team_batting, year, TeamBattingStats.__name__),
+                _load_season(team_pitching, year, TeamPitchingStats.__name__),
+            )
+    except Exception as e:
+        return {"error": str(e)}
+
+    batting_plan = field_plan(TeamBattingStats, batting_fields)
+    pitching_plan = field_plan(TeamPitchingStats, pitching_fields)
+
+    with metrics.stage("convert"):
+        batting_by_id = _team_records(batting, batting_plan)
+        pitching_by_id = _team_records(pitching, pitching_plan)
+        abbreviations = _team_abbreviations(batting, pitching)
+
+        data = []
+        for row in standings_season.frame.to_dict("records"):
+            team_id = BREF_TEAM_IDS.get(str(row["Tm"]).strip())
+            abbreviation = abbreviations.get(team_id) if team_id else None
+            if team is not None and team.casefold() not in (
+                str(row["Tm"]).casefold(),
+                str(abbreviation).casefold(),
+            ):
+                continue
+            data.append(
+                {
+                    "Team": abbreviation,
+                    "teamIDfg": team_id,
+                    **StandingsRecord.model_validate(row).model_dump(mode="json"),
+                    "batting": batting_by_id.get(team_id) if team_id else None,
+                    "pitching": pitching_by_id.get(team_id) if team_id else None,
+                }
+            )
+
+    response = {
+        "year": year,
+        "as_of": _as_of(standings_season, batting, pitching),
+        "total_teams": len(data),
+        "data": data,
+    }
+    unknown = batting_plan.unknown + pitching_plan.unknown
+    if unknown:
+        response["unknown_fields"] = list(unknown)
+    return response
+
+
+def _team_records(season: Season, plan: FieldPlan) -> Dict[int, dict]:
+    """Convert a team stats season to records keyed by teamIDfg."""
+    df = season.frame
+    if df.empty:
+        return {}
+    records = convert_records(plan.model, df[plan.columns(df.columns)])
+    by_id = {}
+    for record in records:
+        # Identity is reported once at the top of the team_report record
+        team_id = record.pop("teamIDfg")
+        record.pop("Season", None)
+        by_id[team_id] = record
+    return by_id
+
+
+def _team_abbreviations(*seasons: Season) -> Dict[int, str]:
+    """Map teamIDfg to the FanGraphs Team abbreviation used in the seasons."""
+    abbreviations: Dict[int, str] = {}
+    for season in seasons:
+        df = season.frame
+        if not df.empty:
+            abbreviations.update(zip(df["teamIDfg"].tolist(), df["Team"].tolist()))
+    return abbreviations
+
+
+# Tools batch_query may call; everything that reads stats, nothing that
+# reports on the server itself
+BATCH_TOOLS: Dict[str, Callable[..., Awaitable[dict]]] = {
+    func.__name__: func
+    for func in (
+        batting_stats_by_year,
+        pitching_stats_by_year,
+        team_batting_stats_by_year,
+        team_pitching_stats_by_year,
+        batting_stats_by_range,
+        pitching_stats_by_range,
+        team_batting_stats_by_range,
+        team_pitching_stats_by_range,
+        player_career,
+        search_players,
+        leaderboard,
+        team_aggregate,
+        standings_by_year,
+        team_report,
+    )
+}
+
+
+@mcp.tool()
+@metrics.tool
+async def batch_query(queries: List[Dict[str, Any]]) -> dict:
+    """
+    Run several stats tool calls in one request.
+
+    Use this instead of calling tools one after another when you already know
+    the queries you need (e.g., batting and pitching for three seasons). The
+    queries run concurrently, and queries that need the same season share a
+    single fetch of it.
+
+    Parameters:
+        queries (List[dict]):
+            Up to 50 queries, each of the form
+            {"tool": "<tool name>", "arguments": {...}}, where arguments are
+            exactly what you would pass to that tool. For example:
+
+            [
+                {"tool": "batting_stats_by_year",
+                 "arguments": {"year": 2023, "fields": "basic", "page_size": 10}},
+                {"tool": "standings_by_year", "arguments": {"year": 2023}}
+            ]
+
+            Any stats tool can be used: batting_stats_by_year,
+            pitching_stats_by_year, team_batting_stats_by_year,
+            team_pitching_stats_by_year, the *_by_range variants,
+            player_career, search_players, leaderboard, team_aggregate,
+            standings_by_year and team_report.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "total_queries": int,
+            "executed": int,        # distinct queries run; repeats share a result
+            "results": List[dict]   # one per query, in order: the tool's response,
+                                    # or {"error": str} if that query failed
+        }
+
+    Notes:
+        - A failing query does not affect the others; check each result for "error".
+        - Identical queries (same tool and arguments) are run once.
+        - At most 8 queries run at the same time; the rest wait their turn.
+        - Results are full tool responses, so keep page_size or max_bytes small
+          when batching many paginated queries.
+    """
+    if len(queries) > BATCH_MAX_QUERIES:
+        return {
+            "error": f"Too many queries: {len(queries)} (at most {BATCH_MAX_QUERIES})"
+        }
+
+    limit = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def run(tool: Callable[..., Awaitable[dict]], arguments: dict) -> dict:
+        async with limit:
+            try:
+                return await tool(**arguments)
+            except Exception as e:
+                return {"error": str(e)}
+
+    # One task per distinct query, told apart by the validated arguments so
+    # that spelling out a default does not make a query distinct; repeats
+    # await the same task
+    tasks: Dict[Tuple[str, str], "asyncio.Task[dict]"] = {}
+    pending: List[Any] = []
+    for query in queries:
+        try:
+            name, arguments = _batch_call(query)
+            key = (name, json.dumps(arguments, sort_keys=True, default=str))
+        except ValueError as e:
+            pending.append({"error": str(e)})
+            continue
+        if key not in tasks:
+            tasks[key] = asyncio.create_task(run(BATCH_TOOLS[name], arguments))
+        pending.append(tasks[key])
+
+    if tasks:
+        await asyncio.gather(*tasks.values())
+    results = [
+        item.result() if isinstance(item, asyncio.Task) else item for item in pending
+    ]
+    return {"total_queries": len(queries), "executed": len(tasks), "results": results}
+
+
+def _batch_call(query: Any) -> Tuple[str, dict]:
+    """Validate one batch_query entry and return its tool name and arguments."""
+    if not isinstance(query, dict) or not isinstance(query.get("tool"), str):
+        raise ValueError("Each query must be an object with 'tool' and 'arguments'")
+    name: str = query["tool"]
+    tool = mcp._tool_manager.get_tool(name) if name in BATCH_TOOLS else None
+    if tool is None:
+        raise ValueError(
+            f"Unknown tool: {name!r}. Valid tools: {', '.join(BATCH_TOOLS)}"
+        )
+    arguments = query.get("arguments") or {}
+    if not isinstance(arguments, dict):
+        raise ValueError("'arguments' must be an object")
+    # Validate and convert the arguments with the tool's registered argument
+    # model, exactly as FastMCP does for a direct call, before running anything
+    metadata = tool.fn_metadata
+    try:
+        parsed = metadata.arg_model.model_validate(metadata.pre_parse_json(arguments))
+    except ValidationError as e:
+        raise ValueError(f"{name}: {e}") from None
+    return name, parsed.model_dump_one_level()
+
+
+@mcp.tool()
+async def server_metrics() -> dict:
+    """
+    Report the server's own latency, error and payload-size metrics.
+
+    Use this to see where request time goes: loading seasons (cache, disk
+    store or upstream), filtering and sorting, field projection and record
+    conversion, plus how often pybaseball was called and failed.
+
+    Returns:
+        dict with the following structure:
+
+        {
+            "uptime_seconds": float,
+            "stages": List[dict],         # per tool and stage: count, p50_ms,
+                                          # p95_ms, p99_ms, total_ms
+            "payload_bytes": List[dict],  # per tool: count, p50, p95, p99, total
+            "tool_errors": dict,          # tool name -> calls that returned an error
+                                          # or raised
+            "upstream": List[dict]        # per site: source, calls, errors
+        }
+
+    Notes:
+        - Stages are "total", "load", "filter_sort", "project", "aggregate",
+          "convert", "upstream_wait" (queued for an upstream slot) and
+          "upstream".
+        - Work done by the background warm-up is reported under the tool
+          "background".
+        - Percentiles cover the most recent observations of each series.
+    """
+    return metrics.snapshot()
+
+
+startup_timer.mark("server module imported")
+
 # Run the server
 if __name__ == "__main__":  # pragma: no cover
     mcp.run()
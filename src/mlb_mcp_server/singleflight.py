@@ -0,0 +1,53 @@
+"""Coalescing of concurrent identical upstream fetches."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    In-flight registry that shares one running fetch between concurrent callers.
+
+    The first caller for a key starts the fetch as a task; callers arriving
+    while it is still running await the same task. Each caller awaits through
+    asyncio.shield, so cancelling one caller does not cancel the fetch for the
+    others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def start(
+        self, key: Hashable, fetch: Callable[[], Awaitable[T]]
+    ) -> asyncio.Future[T]:
+        """
+        Start fetch() for key unless it is already running, without waiting.
+
+        Returns:
+            The in-flight future for key, shared with any concurrent callers.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return future
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of fetch(), sharing it with concurrent callers of key."""
+        return await asyncio.shield(self.start(key, fetch))
+
+    def _finish(self, key: Hashable, future: asyncio.Future[T]) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,53 @@
+"""
+pybaseball data sources, imported on first use.
+
+Importing pybaseball also loads matplotlib, requests, lxml and more, which
+takes about a second. The wrappers below defer that cost from server startup
+to the first fetch (or to preload, run in the background at startup), so the
+MCP handshake is answered without waiting for it.
+"""
+
+import importlib
+import time
+from types import ModuleType
+from typing import Any, List
+
+import pandas as pd
+
+from mlb_mcp_server.startup import startup_timer
+
+
+def _pybaseball() -> ModuleType:
+    return importlib.import_module("pybaseball")
+
+
+def preload() -> None:
+    """Import pybaseball now, so the first fetch does not pay for it."""
+    start = time.perf_counter()
+    _pybaseball()
+    startup_timer.mark("pybaseball imported", time.perf_counter() - start)
+
+
+def batting_stats(*args: Any, **kwargs: Any) -> pd.DataFrame:
+    """pybaseball.batting_stats."""
+    return _pybaseball().batting_stats(*args, **kwargs)
+
+
+def pitching_stats(*args: Any, **kwargs: Any) -> pd.DataFrame:
+    """pybaseball.pitching_stats."""
+    return _pybaseball().pitching_stats(*args, **kwargs)
+
+
+def team_batting(*args: Any, **kwargs: Any) -> pd.DataFrame:
+    """pybaseball.team_batting."""
+    return _pybaseball().team_batting(*args, **kwargs)
+
+
+def team_pitching(*args: Any, **kwargs: Any) -> pd.DataFrame:
+    """pybaseball.team_pitching."""
+    return _pybaseball().team_pitching(*args, **kwargs)
+
+
+def standings(*args: Any, **kwargs: Any) -> List[pd.DataFrame]:
+    """pybaseball.standings: one DataFrame per division."""
+    return _pybaseball().standings(*args, **kwargs)
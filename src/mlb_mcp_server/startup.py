@@ -0,0 +1,52 @@
+"""Optional report of startup and first-call latency, written to stderr."""
+
+import sys
+import time
+from typing import Callable, Optional, Set, TextIO
+
+import mlb_mcp_server
+from mlb_mcp_server.constants import STARTUP_TIMING
+
+
+class StartupTimer:
+    """
+    Report startup milestones and the first call of each tool.
+
+    Each line gives the time since started_at (the package import) and, when
+    known, how long the step itself took. A disabled timer reports nothing.
+    Lines go to stderr by default, which is free to use under the stdio
+    transport.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        started_at: float,
+        stream: Optional[TextIO] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.enabled = enabled
+        self.started_at = started_at
+        self._stream = stream
+        self._clock = clock
+        self._called: Set[str] = set()
+
+    def mark(self, event: str, seconds: Optional[float] = None) -> None:
+        """Report that event happened, optionally with its own duration."""
+        if not self.enabled:
+            return
+        line = f"startup: {event} at {self._clock() - self.started_at:.3f}s"
+        if seconds is not None:
+            line += f" (took {seconds:.3f}s)"
+        print(line, file=self._stream or sys.stderr, flush=True)
+
+    def tool_call(self, tool: str, seconds: float) -> None:
+        """Report a finished tool call if it was the tool's first."""
+        if not self.enabled or tool in self._called:
+            return
+        self._called.add(tool)
+        self.mark(f"first {tool} call finished", seconds)
+
+
+# Shared timer, enabled with MLB_MCP_STARTUP_TIMING=1
+startup_timer = StartupTimer(STARTUP_TIMING, mlb_mcp_server.IMPORTED_AT)
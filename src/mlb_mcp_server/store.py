@@ -0,0 +1,91 @@
+"""Persistent on-disk store for completed season DataFrames."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from mlb_mcp_server.constants import SEASON_STORE_DIR
+
+
+class SeasonStore:
+    """
+    Columnar store of raw pybaseball DataFrames, one Arrow IPC file per season.
+
+    Files are laid out as <root>/<dataset>/<year>.arrow and are read through a
+    memory map, so only the seasons actually queried are paged into memory.
+    A store without a root directory is disabled and never touches the disk.
+    """
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = root
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    def path(self, dataset: str, year: int) -> Path:
+        """Return the file path for a dataset's season."""
+        if self.root is None:
+            raise RuntimeError("Season store is disabled")
+        return self.root / dataset / f"{year}.arrow"
+
+    def load(self, dataset: str, year: int) -> Optional[pd.DataFrame]:
+        """Return the stored season DataFrame, or None if it was never saved."""
+        if self.root is None:
+            return None
+        path = self.path(dataset, year)
+        if not path.exists():
+            return None
+
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (pa.ArrowException, OSError):
+            # Treat unreadable files as a miss; they are rewritten on next save
+            return None
+        return table.to_pandas(split_blocks=True)
+
+    def save(self, dataset: str, year: int, df: pd.DataFrame) -> bool:
+        """
+        Persist a season DataFrame.
+
+        The file is written to a temporary name and atomically renamed so
+        concurrent readers never observe a partial file.
+
+        Returns:
+            True if the frame was written, False if the store is disabled, the
+            frame cannot be represented in Arrow (e.g. mixed-type columns) or
+            the write failed.
+        """
+        if self.root is None:
+            return False
+        path = self.path(dataset, year)
+
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, ValueError):
+            return False
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return False
+        os.close(fd)
+        try:
+            with pa.OSFile(tmp_name, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_name, path)
+        except (pa.ArrowException, OSError):
+            Path(tmp_name).unlink(missing_ok=True)
+            return False
+        return True
+
+
+# Shared store used by the MCP tools
+season_store = SeasonStore(Path(SEASON_STORE_DIR) if SEASON_STORE_DIR else None)
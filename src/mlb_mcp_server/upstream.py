@@ -0,0 +1,168 @@
+"""Bounded executor with admission control for upstream pybaseball calls."""
+
+import asyncio
+import heapq
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from mlb_mcp_server.constants import UPSTREAM_CONCURRENCY, UPSTREAM_MAX_QUEUE
+from mlb_mcp_server.metrics import metrics
+
+T = TypeVar("T")
+
+# Lower values are served first
+INTERACTIVE = 0
+BACKGROUND = 1
+
+_priority: ContextVar[int] = ContextVar("upstream_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """
+    Run upstream calls made in this context at background priority.
+
+    Tasks created inside the block copy the context, so a fetch started here
+    keeps background priority after the block exits.
+    """
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class UpstreamBusyError(RuntimeError):
+    """Raised when too many calls are already waiting for an upstream site."""
+
+
+class PrioritySlots:
+    """
+    Counting semaphore whose waiters are admitted by priority, then arrival.
+
+    At most max_waiting callers may wait at once; acquire raises
+    UpstreamBusyError beyond that instead of queueing without bound.
+    """
+
+    def __init__(self, limit: int, max_waiting: int) -> None:
+        self.limit = limit
+        self.max_waiting = max_waiting
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int = INTERACTIVE) -> None:
+        """Wait for a free slot, ahead of any waiter with a higher priority value."""
+        if self.active < self.limit and not self.waiting:
+            self.active += 1
+            return
+        if self.waiting >= self.max_waiting:
+            raise UpstreamBusyError("too many pending requests")
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the caller was cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot, handing it straight to the highest-priority waiter."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+class UpstreamExecutor:
+    """
+    Dedicated thread pool for blocking pybaseball calls.
+
+    Each upstream site has its own concurrency limit, so a burst against one
+    site neither exceeds what that site tolerates nor starves the other. The
+    pool has exactly one thread per slot, so admitted calls never queue
+    inside it, and a slot is held until the thread finishes even if the
+    awaiting caller is cancelled.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        max_waiting: int = UPSTREAM_MAX_QUEUE,
+    ) -> None:
+        self.limits = dict(limits or UPSTREAM_CONCURRENCY)
+        self.max_waiting = max_waiting
+        self._slots: Dict[str, PrioritySlots] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def slots(self, source: str) -> PrioritySlots:
+        """Return the admission slots for an upstream site."""
+        if source not in self._slots:
+            self._slots[source] = PrioritySlots(
+                self.limits.get(source, 1), self.max_waiting
+            )
+        return self._slots[source]
+
+    async def run(self, source: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Call func(*args) on the upstream pool once source has a free slot.
+
+        Calls made inside background_priority() wait behind interactive ones.
+
+        Raises:
+            UpstreamBusyError: If the wait queue for source is full.
+        """
+        slots = self.slots(source)
+        try:
+            with metrics.stage("upstream_wait"):
+                await slots.acquire(_priority.get())
+        except UpstreamBusyError:
+            raise UpstreamBusyError(
+                f"Too many pending requests to {source}; try again shortly"
+            ) from None
+
+        loop = asyncio.get_running_loop()
+        try:
+            work: Future[T] = self._executor().submit(func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        work.add_done_callback(lambda _: loop.call_soon_threadsafe(slots.release))
+        try:
+            with metrics.stage("upstream"):
+                result = await asyncio.wrap_future(work)
+        except Exception:
+            metrics.record_upstream(source, failed=True)
+            raise
+        metrics.record_upstream(source, failed=False)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; a later run() starts a fresh pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=sum(self.limits.values()),
+                thread_name_prefix="pybaseball",
+            )
+        return self._pool
+
+
+# Shared executor used for every pybaseball call
+upstream = UpstreamExecutor()
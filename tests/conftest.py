@@ -4,6 +4,11 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from mlb_mcp_server.cache import season_cache
+from mlb_mcp_server.cursors import page_cursors
+from mlb_mcp_server.metrics import metrics
+from mlb_mcp_server.store import season_store
+
 
 @pytest.fixture
 def batting_stats_fixture():
@@ -49,3 +54,38 @@ def standings_fixture():
         data = json.load(f)
     # Convert each division's list of dicts into a DataFrame (matches pybaseball output)
     return [pd.DataFrame(division) for division in data]
+
+
+@pytest.fixture(autouse=True)
+def clear_season_cache():
+    """Start every test with an empty season cache"""
+    season_cache.clear()
+    yield
+    season_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cursors():
+    """Start every test without pinned cursor snapshots"""
+    page_cursors.clear()
+    yield
+    page_cursors.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Start every test with empty metrics"""
+    metrics.reset()
+
+
+@pytest.fixture(autouse=True)
+def disable_season_store(monkeypatch):
+    """Keep tests off the real on-disk season store"""
+    monkeypatch.setattr(season_store, "root", None)
+
+
+@pytest.fixture
+def tmp_season_store(monkeypatch, tmp_path):
+    """Point the shared season store at a temporary directory"""
+    monkeypatch.setattr(season_store, "root", tmp_path)
+    return season_store
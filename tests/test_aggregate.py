@@ -0,0 +1,90 @@
+import math
+
+import pandas as pd
+
+from mlb_mcp_server.aggregate import (
+    BATTING_TOTALS,
+    PITCHING_TOTALS,
+    batting_rates,
+    innings_to_outs,
+    outs_to_innings,
+    pitching_rates,
+    team_totals,
+)
+
+
+def _batters():
+    return pd.DataFrame(
+        {
+            "Team": ["NYY", "NYY", "BOS", "- - -"],
+            "PA": [600, 100, 500, 300],
+            "AB": [500, 90, 450, 270],
+            "H": [150, 18, 120, 80],
+            "2B": [30, 2, 25, 10],
+            "3B": [2, 0, 1, 0],
+            "HR": [40, 1, 20, 5],
+            "BB": [80, 8, 40, 25],
+            "HBP": [10, 1, 5, 2],
+            "SF": [5, 1, 5, 3],
+            "SO": [120, 30, 90, 60],
+            "WAR": [5.1, -0.2, 2.0, 1.0],
+        }
+    )
+
+
+class TestInnings:
+    def test_round_trip_partial_innings(self):
+        ip = pd.Series([6.1, 0.2, 177.2, 9.0])
+
+        outs = innings_to_outs(ip)
+
+        assert outs.tolist() == [19, 2, 533, 27]
+        assert outs_to_innings(outs).round(1).tolist() == ip.tolist()
+
+
+class TestTeamTotals:
+    def test_sums_by_team_and_skips_multi_team_rows(self):
+        totals = team_totals(_batters(), BATTING_TOTALS)
+
+        assert totals["Team"].tolist() == ["BOS", "NYY"]
+        assert totals["Players"].tolist() == [1, 2]
+        assert totals["AB"].tolist() == [450, 590]
+
+    def test_sums_innings_as_outs(self):
+        pitchers = pd.DataFrame(
+            {
+                "Team": ["NYY", "NYY"],
+                "IP": [6.1, 2.2],
+                "H": [5, 2],
+                "ER": [2, 1],
+                "HR": [1, 0],
+                "BB": [2, 1],
+                "SO": [5, 3],
+            }
+        )
+
+        totals = pitching_rates(team_totals(pitchers, PITCHING_TOTALS))
+
+        assert totals["IP"].tolist() == [9.0]
+        assert totals["ERA"].tolist() == [3.0]
+        assert totals["WHIP"].tolist() == [1.11]
+
+
+class TestBattingRates:
+    def test_rates_are_weighted_by_components(self):
+        totals = batting_rates(team_totals(_batters(), BATTING_TOTALS))
+        nyy = totals.set_index("Team").loc["NYY"]
+
+        assert nyy["AVG"] == round(168 / 590, 3)
+        assert nyy["OBP"] == round((168 + 88 + 11) / (590 + 88 + 11 + 6), 3)
+        assert nyy["SLG"] == round((168 + 32 + 2 * 2 + 3 * 41) / 590, 3)
+        # Not the mean of the players' averages
+        assert nyy["AVG"] != round((150 / 500 + 18 / 90) / 2, 3)
+
+    def test_zero_denominator_is_missing(self):
+        df = _batters().iloc[:1].assign(AB=0, PA=0)
+
+        totals = batting_rates(team_totals(df, BATTING_TOTALS))
+
+        assert math.isnan(totals["AVG"].iloc[0])
+        assert math.isnan(totals["K%"].iloc[0])
@@ -0,0 +1,46 @@
+import pydantic_core
+
+from mlb_mcp_server.budget import (
+    estimate_rows,
+    row_size,
+    rows_within_budget,
+    serialized_size,
+)
+
+
+class TestSerializedSize:
+    def test_matches_indented_json(self):
+        value = {"Team": "NYY", "HR": 250}
+
+        assert serialized_size(value) == len(pydantic_core.to_json(value, indent=2))
+
+    def test_row_size_matches_growth_of_page(self):
+        rows = [{"Team": "NYY", "HR": 250}, {"Team": "LAD", "HR": 249}]
+        one = len(pydantic_core.to_json({"data": rows[:1]}, indent=2))
+        two = len(pydantic_core.to_json({"data": rows}, indent=2))
+
+        assert row_size(rows[1]) == two - one
+
+
+class TestEstimateRows:
+    def test_divides_budget_by_average_row_size(self):
+        sample = [{"Team": "NYY"}] * 4
+
+        assert estimate_rows(sample, row_size(sample[0]) * 10, 100) == 10
+
+    def test_capped_at_limit(self):
+        assert estimate_rows([{"Team": "NYY"}], 10_000, 5) == 5
+
+    def test_at_least_one_row(self):
+        assert estimate_rows([{"Team": "NYY"}], 1, 5) == 1
+
+
+class TestRowsWithinBudget:
+    def test_keeps_rows_that_fit(self):
+        rows = [{"Team": "NYY"}] * 5
+
+        assert rows_within_budget(rows, row_size(rows[0]) * 3) == 3
+        assert rows_within_budget(rows, row_size(rows[0]) * 3 - 1) == 2
+
+    def test_keeps_first_row_over_budget(self):
+        assert rows_within_budget([{"Team": "NYY"}], 1) == 1
@@ -0,0 +1,113 @@
+from datetime import date
+
+import pandas as pd
+
+from mlb_mcp_server.cache import (
+    SeasonCache,
+    is_current_season,
+    season_max_stale,
+    season_ttl,
+)
+from mlb_mcp_server.constants import (
+    COMPLETED_SEASON_TTL_SECONDS,
+    CURRENT_SEASON_MAX_STALE_SECONDS,
+    CURRENT_SEASON_TTL_SECONDS,
+)
+from mlb_mcp_server.season import Season
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _season(rows=3):
+    return Season(pd.DataFrame({"IDfg": range(rows), "HR": range(rows)}))
+
+
+class TestSeasonCache:
+    def test_get_returns_cached_season(self):
+        cache = SeasonCache()
+        season = _season()
+
+        cache.put(("batting", 2023), season, ttl=60)
+
+        assert cache.get(("batting", 2023)) is season
+        assert cache.get(("batting", 2022)) is None
+
+    def test_entry_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = SeasonCache(clock=clock)
+        cache.put(("batting", 2023), _season(), ttl=60)
+
+        clock.now = 59
+        assert cache.get(("batting", 2023)) is not None
+
+        clock.now = 60
+        assert cache.get(("batting", 2023)) is None
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    def test_stale_entry_only_served_by_get_stale(self):
+        clock = FakeClock()
+        cache = SeasonCache(clock=clock)
+        season = _season()
+        cache.put(("batting", 2023), season, ttl=60, max_stale=30)
+
+        clock.now = 70
+        assert cache.get(("batting", 2023)) is None
+        assert cache.get_stale(("batting", 2023)) is season
+
+        clock.now = 90
+        assert cache.get_stale(("batting", 2023)) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_by_count(self):
+        cache = SeasonCache(max_entries=2)
+        cache.put("a", _season(), ttl=60)
+        cache.put("b", _season(), ttl=60)
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.put("c", _season(), ttl=60)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_evicts_by_memory_budget(self):
+        size = _season(100).nbytes
+        cache = SeasonCache(max_bytes=size * 2)
+        cache.put("a", _season(100), ttl=60)
+        cache.put("b", _season(100), ttl=60)
+        cache.put("c", _season(100), ttl=60)
+
+        assert len(cache) == 2
+        assert "a" not in cache
+        assert cache.nbytes <= size * 2
+
+    def test_skips_season_larger_than_budget(self):
+        cache = SeasonCache(max_bytes=10)
+
+        cache.put("a", _season(100), ttl=60)
+
+        assert len(cache) == 0
+
+
+class TestSeasonTtl:
+    def test_current_season_uses_short_ttl(self):
+        year = date.today().year
+
+        assert is_current_season(year)
+        assert season_ttl(year) == CURRENT_SEASON_TTL_SECONDS
+        assert season_max_stale(year) == CURRENT_SEASON_MAX_STALE_SECONDS
+
+    def test_completed_season_uses_long_ttl(self):
+        year = date.today().year - 1
+
+        assert not is_current_season(year)
+        assert season_ttl(year) == COMPLETED_SEASON_TTL_SECONDS
+        assert season_max_stale(year) == 0
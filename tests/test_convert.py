@@ -0,0 +1,97 @@
+import json
+
+import pandas as pd
+
+from mlb_mcp_server.convert import (
+    column_records,
+    columnar_records,
+    convert_records,
+    records_adapter,
+)
+from mlb_mcp_server.fields import field_plan
+from mlb_mcp_server.models import BattingStats, PitchingStats
+
+
+class TestColumnRecords:
+    def test_matches_to_dict(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+
+        assert json.dumps(column_records(df)) == json.dumps(df.to_dict("records"))
+
+    def test_values_are_native_python(self):
+        df = pd.DataFrame({"IDfg": [1, 2], "AVG": [0.3, 0.25]})
+
+        records = column_records(df)
+
+        assert records == [{"IDfg": 1, "AVG": 0.3}, {"IDfg": 2, "AVG": 0.25}]
+        assert type(records[0]["IDfg"]) is int
+
+    def test_empty_frame(self):
+        assert column_records(pd.DataFrame({"IDfg": []})) == []
+
+
+class TestConvertRecords:
+    def test_matches_per_row_validation(self, pitching_stats_fixture):
+        df = pd.DataFrame(pitching_stats_fixture)
+        for fields in ("all", "basic", "Name,ERA"):
+            plan = field_plan(PitchingStats, fields)
+            model = plan.model
+            page_df = df[plan.columns(df.columns)]
+
+            expected = [
+                model.model_validate(row).model_dump(mode="json", exclude_none=True)
+                for row in page_df.to_dict("records")
+            ]
+
+            assert json.dumps(convert_records(model, page_df)) == json.dumps(expected)
+
+    def test_adapter_is_cached(self):
+        assert records_adapter(BattingStats) is records_adapter(BattingStats)
+
+
+class TestColumnarRecords:
+    def test_matches_records(self, batting_stats_fixture, pitching_stats_fixture):
+        for model_cls, fixture in (
+            (BattingStats, batting_stats_fixture),
+            (PitchingStats, pitching_stats_fixture),
+        ):
+            df = pd.DataFrame(fixture)
+            df = df[field_plan(model_cls, "all").columns(df.columns)]
+
+            columnar = columnar_records(model_cls, df)
+            records = convert_records(model_cls, df)
+
+            rebuilt = [
+                {k: v for k, v in zip(columnar["columns"], row) if v is not None}
+                for row in columnar["rows"]
+            ]
+            # Columnar rows carry null where records keep NaN
+            expected = [
+                {k: v for k, v in record.items() if v == v} for record in records
+            ]
+            assert json.dumps(rebuilt) == json.dumps(expected)
+
+    def test_columns_follow_model_fields(self, batting_stats_fixture):
+        plan = field_plan(BattingStats, "HR,WAR,Name")
+        df = pd.DataFrame(batting_stats_fixture)
+
+        columnar = columnar_records(plan.model, df[plan.columns(df.columns)])
+
+        assert columnar["columns"] == ["IDfg", "Season", "Name", "HR", "WAR"]
+        assert len(columnar["rows"]) == len(batting_stats_fixture)
+
+    def test_missing_values_and_integer_gaps(self):
+        model = field_plan(BattingStats, "IBB,ISO").model
+        df = pd.DataFrame(
+            {
+                "IDfg": [1, 2],
+                "Season": [2023, 2023],
+                "IBB": [3.0, float("nan")],
+                "ISO": [float("inf"), 0.25],
+            }
+        )
+
+        columnar = columnar_records(model, df)
+
+        assert columnar["rows"] == [[1, 2023, 3, None], [2, 2023, None, 0.25]]
+        assert type(columnar["rows"][0][2]) is int
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+from mlb_mcp_server.cursors import CursorRegistry, PageView
+from mlb_mcp_server.models import TeamPitchingStats
+from mlb_mcp_server.season import Season
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _view(rows=10, positions=None):
+    season = Season(pd.DataFrame({"Team": [f"T{i}" for i in range(rows)]}))
+    return PageView(season, positions, TeamPitchingStats, "all", 3, {"year": 2023})
+
+
+class TestPageView:
+    def test_rows_follow_positions(self):
+        view = _view(positions=np.array([4, 2, 0]))
+
+        assert view.total_rows == 3
+        assert view.rows(1, 3)["Team"].tolist() == ["T2", "T0"]
+
+    def test_rows_without_positions(self):
+        view = _view(rows=5)
+
+        assert view.total_rows == 5
+        assert view.rows(3, 10)["Team"].tolist() == ["T3", "T4"]
+
+
+class TestCursorRegistry:
+    def test_resolve_returns_view_and_offset(self):
+        registry = CursorRegistry()
+        view = _view()
+
+        token = registry.issue(view, 3)
+
+        assert registry.resolve(token) == (view, 3, 2)
+
+    def test_tokens_share_one_snapshot_per_view(self):
+        registry = CursorRegistry()
+        view = _view()
+
+        first = registry.issue(view, 3)
+        second = registry.issue(view, 5, page=3)
+
+        assert first != second
+        assert len(registry) == 1
+        assert registry.resolve(second) == (view, 5, 3)
+
+    def test_invalid_tokens(self):
+        registry = CursorRegistry()
+        registry.issue(_view(), 3)
+
+        assert registry.resolve("not-a-cursor") is None
+        assert registry.resolve("") is None
+        assert registry.resolve("!!!") is None
+
+    def test_snapshot_expires_without_use(self):
+        clock = FakeClock()
+        registry = CursorRegistry(ttl=60, clock=clock)
+        token = registry.issue(_view(), 3)
+
+        # Each resolve extends the snapshot's lifetime
+        clock.now = 50
+        assert registry.resolve(token) is not None
+        clock.now = 100
+        assert registry.resolve(token) is not None
+
+        clock.now = 160
+        assert registry.resolve(token) is None
+        assert len(registry) == 0
+
+    def test_evicts_least_recently_used_snapshot(self):
+        registry = CursorRegistry(max_snapshots=2)
+        a = registry.issue(_view(), 3)
+        b = registry.issue(_view(), 3)
+
+        # Touch "a" so "b" becomes least recently used
+        registry.resolve(a)
+        c = registry.issue(_view(), 3)
+
+        assert registry.resolve(a) is not None
+        assert registry.resolve(b) is None
+        assert registry.resolve(c) is not None
+
+    def test_find_returns_view_pinned_for_key(self):
+        registry = CursorRegistry()
+        view = _view()
+        view.key = ("request", 1)
+
+        registry.issue(view, 3)
+
+        assert registry.find(("request", 1)) is view
+        assert registry.find(("request", 2)) is None
+
+    def test_evicts_by_pinned_bytes(self):
+        size = _view(100).season.nbytes
+        registry = CursorRegistry(max_bytes=size * 2)
+        a = registry.issue(_view(100), 3)
+        registry.issue(_view(100), 3)
+        c = registry.issue(_view(100), 3)
+
+        assert len(registry) == 2
+        assert registry.resolve(a) is None
+        assert registry.resolve(c) is not None
+        assert registry.nbytes <= size * 2
+
+    def test_shared_season_counts_once(self):
+        registry = CursorRegistry()
+        view = _view()
+        other = PageView(view.season, np.array([1, 0]), TeamPitchingStats, "all", 3, {})
+
+        registry.issue(view, 3)
+        registry.issue(other, 1)
+
+        assert registry.nbytes == view.season.nbytes + other.positions.nbytes
+        registry.clear()
+        assert registry.nbytes == 0
+
+    def test_keeps_snapshot_larger_than_budget(self):
+        registry = CursorRegistry(max_bytes=1)
+
+        token = registry.issue(_view(), 3)
+
+        assert registry.resolve(token) is not None
@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+
+from mlb_mcp_server.constants import BATTING_PRESETS
+from mlb_mcp_server.fields import field_attribute, field_plan
+from mlb_mcp_server.models import BattingStats, TeamPitchingStats
+
+
+class TestFieldPlan:
+    def test_all_returns_full_model(self):
+        plan = field_plan(BattingStats, "all")
+
+        assert plan.model is BattingStats
+        assert plan.unknown == ()
+
+    def test_preset_keeps_preset_and_identity_fields(self):
+        model = field_plan(BattingStats, "basic").model
+
+        assert set(model.model_fields) <= {
+            field_attribute(BattingStats, name) for name in BATTING_PRESETS["basic"]
+        } | {"IDfg", "Season"}
+        assert {"IDfg", "Season", "Name", "HR", "AVG"} <= set(model.model_fields)
+
+    def test_preset_aliases_resolve(self):
+        model = field_plan(BattingStats, "advanced").model
+
+        assert {"wRC_plus", "BB_pct", "K_pct"} <= set(model.model_fields)
+
+    def test_custom_fields_use_team_identity(self):
+        model = field_plan(TeamPitchingStats, "ERA, WHIP").model
+
+        assert list(model.model_fields) == ["teamIDfg", "Season", "ERA", "WHIP"]
+
+    def test_alias_and_attribute_names_match(self):
+        by_alias = field_plan(BattingStats, "wRC+")
+        by_attribute = field_plan(BattingStats, "wRC_plus")
+
+        assert "wRC_plus" in by_alias.model.model_fields
+        assert "wRC_plus" in by_attribute.model.model_fields
+
+    def test_reports_unknown_fields(self):
+        plan = field_plan(BattingStats, "HR,Homers,HR,wrc+,Homers,")
+
+        assert plan.unknown == ("Homers", "wrc+")
+        assert list(plan.model.model_fields) == ["IDfg", "Season", "HR"]
+
+    def test_plan_is_cached(self):
+        assert field_plan(BattingStats, "basic") is field_plan(BattingStats, "basic")
+
+    def test_reduced_model_keeps_field_definitions(self):
+        model = field_plan(BattingStats, "Name,BABIP").model
+        record = model.model_validate(
+            {"IDfg": 1, "Season": 2023, "Name": "A", "BABIP": 0.3}
+        )
+
+        assert record.model_dump() == {
+            "IDfg": 1,
+            "Season": 2023,
+            "Name": "A",
+            "BABIP": 0.3,
+        }
+
+
+class TestPlanColumns:
+    def test_selects_alias_columns(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+        plan = field_plan(BattingStats, "Name,wRC_plus")
+
+        assert plan.columns(df.columns) == ["IDfg", "Season", "Name", "wRC+"]
+
+    def test_accepts_attribute_named_columns(self):
+        columns = pd.Index(["IDfg", "Season", "wRC_plus"])
+
+        assert field_plan(BattingStats, "wRC+").columns(columns) == [
+            "IDfg",
+            "Season",
+            "wRC_plus",
+        ]
+
+    def test_skips_missing_and_unknown_columns(self):
+        columns = pd.Index(["IDfg", "Season", "Name", "Unknown"])
+
+        assert field_plan(BattingStats, "all").columns(columns) == [
+            "IDfg",
+            "Season",
+            "Name",
+        ]
+
+
+class TestFieldAttribute:
+    def test_resolves_alias_and_attribute(self):
+        assert field_attribute(BattingStats, "wRC+") == "wRC_plus"
+        assert field_attribute(BattingStats, "wRC_plus") == "wRC_plus"
+        assert field_attribute(BattingStats, "HR") == "HR"
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="Unknown field for BattingStats: xyz"):
+            field_attribute(BattingStats, "xyz")
@@ -0,0 +1,151 @@
+import asyncio
+import io
+
+import pytest
+
+from mlb_mcp_server.metrics import Metrics, Summary
+from mlb_mcp_server.startup import StartupTimer
+
+
+class TestSummary:
+    def test_quantiles_over_recent_window(self):
+        summary = Summary(window=100)
+        for value in range(1, 201):
+            summary.observe(value)
+
+        assert summary.count == 200
+        assert summary.total == sum(range(1, 201))
+        assert summary.quantiles() == [151, 196, 200]
+
+    def test_empty_quantiles(self):
+        assert Summary().quantiles() == [0.0, 0.0, 0.0]
+
+
+class TestMetrics:
+    async def test_stages_attributed_to_tool(self):
+        metrics = Metrics()
+
+        @metrics.tool
+        async def my_tool(year: int) -> dict:
+            with metrics.stage("load"):
+                pass
+            return {"year": year}
+
+        assert await my_tool(2023) == {"year": 2023}
+        with metrics.stage("load"):
+            pass
+
+        assert set(metrics.stage_seconds) == {
+            ("my_tool", "total"),
+            ("my_tool", "load"),
+            ("background", "load"),
+        }
+        assert metrics.payload_bytes["my_tool"].total == len('{"year":2023}')
+
+    async def test_tool_context_reaches_tasks(self):
+        metrics = Metrics()
+
+        async def fetch():
+            with metrics.stage("upstream"):
+                await asyncio.sleep(0)
+
+        @metrics.tool
+        async def my_tool() -> dict:
+            await asyncio.create_task(fetch())
+            return {}
+
+        await my_tool()
+
+        assert ("my_tool", "upstream") in metrics.stage_seconds
+
+    async def test_error_responses_counted(self):
+        metrics = Metrics()
+
+        @metrics.tool
+        async def my_tool() -> dict:
+            return {"error": "nope"}
+
+        await my_tool()
+
+        assert metrics.tool_errors == {"my_tool": 1}
+
+    async def test_counts_raised_exceptions_as_errors(self):
+        metrics = Metrics()
+
+        @metrics.tool
+        async def my_tool() -> dict:
+            raise ZeroDivisionError("division by zero")
+
+        with pytest.raises(ZeroDivisionError):
+            await my_tool()
+
+        assert metrics.tool_errors == {"my_tool": 1}
+        assert "my_tool" not in metrics.payload_bytes
+
+    async def test_first_call_reported_to_startup_timer(self, monkeypatch):
+        metrics = Metrics()
+        stream = io.StringIO()
+        monkeypatch.setattr(
+            "mlb_mcp_server.metrics.startup_timer", StartupTimer(True, 0.0, stream)
+        )
+
+        @metrics.tool
+        async def my_tool() -> dict:
+            return {}
+
+        await my_tool()
+        await my_tool()
+
+        assert stream.getvalue().count("first my_tool call finished") == 1
+
+    def test_snapshot(self):
+        metrics = Metrics()
+        metrics.observe_stage("load", 0.25)
+        metrics.record_upstream("fangraphs", failed=True)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["stages"] == [
+            {
+                "tool": "background",
+                "stage": "load",
+                "count": 1,
+                "p50_ms": 250.0,
+                "p95_ms": 250.0,
+                "p99_ms": 250.0,
+                "total_ms": 250.0,
+            }
+        ]
+        assert snapshot["upstream"] == [
+            {"source": "fangraphs", "calls": 1, "errors": 1}
+        ]
+
+    def test_prometheus_text(self):
+        metrics = Metrics()
+        metrics.observe_stage("load", 0.5)
+        metrics.record_upstream("fangraphs", failed=False)
+
+        text = metrics.prometheus()
+
+        assert "# TYPE mlb_mcp_stage_seconds summary" in text
+        assert (
+            'mlb_mcp_stage_seconds{tool="background",stage="load",quantile="0.99"} 0.5'
+            in text
+        )
+        assert 'mlb_mcp_stage_seconds_count{tool="background",stage="load"} 1' in text
+        assert 'mlb_mcp_upstream_calls_total{source="fangraphs"} 1' in text
+        assert text.endswith("\n")
+
+    async def test_periodic_dump(self, tmp_path):
+        metrics = Metrics()
+        path = tmp_path / "metrics" / "mlb.prom"
+
+        task = asyncio.create_task(metrics.dump_periodically(path, interval=60))
+        await asyncio.sleep(0.05)
+        metrics.record_upstream("fangraphs", failed=False)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        # The final dump on shutdown includes the latest observations
+        assert 'mlb_mcp_upstream_calls_total{source="fangraphs"} 1' in path.read_text()
+        assert [p.name for p in path.parent.iterdir()] == ["mlb.prom"]
@@ -0,0 +1,52 @@
+import json
+from unittest.mock import patch
+
+import pandas as pd
+
+from mlb_mcp_server.convert import convert_records
+from mlb_mcp_server.fields import field_plan
+from mlb_mcp_server.models import BattingStats
+from mlb_mcp_server.offload import ConversionPool, convert_projection
+
+
+class TestConvertProjection:
+    def test_matches_convert_records(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+        plan = field_plan(BattingStats, "basic")
+        expected = convert_records(plan.model, df[plan.columns(df.columns)])
+
+        assert convert_projection(BattingStats, "basic", df) == expected
+
+
+class TestConversionPool:
+    def test_offload_threshold(self):
+        pool = ConversionPool(processes=2, min_cells=6)
+
+        assert pool.should_offload(pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}))
+        assert not pool.should_offload(pd.DataFrame({"a": [1, 2, 3]}))
+        assert not ConversionPool(processes=0, min_cells=0).should_offload(
+            pd.DataFrame({"a": [1]})
+        )
+
+    async def test_small_page_converted_inline(self, batting_stats_fixture):
+        pool = ConversionPool(processes=2, min_cells=10**9)
+        df = pd.DataFrame(batting_stats_fixture)
+
+        with patch.object(pool, "_executor") as executor:
+            data = await pool.convert(BattingStats, "all", df)
+
+        executor.assert_not_called()
+        expected = convert_projection(BattingStats, "all", df)
+        assert json.dumps(data) == json.dumps(expected)
+
+    async def test_large_page_converted_in_worker(self, batting_stats_fixture):
+        pool = ConversionPool(processes=1, min_cells=1)
+        df = pd.DataFrame(batting_stats_fixture)
+
+        try:
+            data = await pool.convert(BattingStats, "all", df)
+        finally:
+            pool.shutdown()
+
+        expected = convert_projection(BattingStats, "all", df)
+        assert json.dumps(data) == json.dumps(expected)
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import date
+
+from mlb_mcp_server.prefetch import Prefetcher, warm_years
+
+
+class TestWarmYears:
+    def test_current_and_previous_seasons(self):
+        assert warm_years(3, today=date(2024, 5, 1)) == [2024, 2023, 2022]
+
+    def test_zero_disables(self):
+        assert warm_years(0) == []
+
+
+class TestPrefetcher:
+    async def test_warms_at_start_then_on_schedule(self):
+        calls = []
+        scheduled = asyncio.Event()
+
+        async def warm(refresh):
+            calls.append(refresh)
+            if len(calls) == 3:
+                scheduled.set()
+
+        prefetcher = Prefetcher(warm, interval=0.01)
+        prefetcher.start()
+        await asyncio.wait_for(scheduled.wait(), timeout=1)
+        await prefetcher.stop()
+
+        assert calls[:3] == [False, True, True]
+        assert not prefetcher.running
+
+    async def test_start_does_not_block(self):
+        release = asyncio.Event()
+
+        async def warm(refresh):
+            await release.wait()
+
+        prefetcher = Prefetcher(warm, interval=0)
+        prefetcher.start()
+
+        assert prefetcher.running
+        release.set()
+        await asyncio.sleep(0.01)
+        assert not prefetcher.running
+
+    async def test_failed_warm_keeps_schedule_running(self):
+        calls = 0
+        retried = asyncio.Event()
+
+        async def warm(refresh):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("upstream down")
+            retried.set()
+
+        prefetcher = Prefetcher(warm, interval=0.01)
+        prefetcher.start()
+        await asyncio.wait_for(retried.wait(), timeout=1)
+        await prefetcher.stop()
+
+        assert calls >= 2
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from mlb_mcp_server.models import BattingStats, TeamBattingStats
+from mlb_mcp_server.query import filter_mask, view_positions
+from mlb_mcp_server.season import Season
+
+
+class TestFilterMask:
+    def test_no_predicates(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+
+        assert filter_mask(df, BattingStats, {"Team": None}, {"PA": None}) is None
+
+    def test_equals_is_case_insensitive(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+
+        mask = filter_mask(df, BattingStats, equals={"Team": "lad"})
+
+        assert list(mask) == [False, True, True]
+
+    def test_minimums_combine_with_equals(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+
+        mask = filter_mask(
+            df, BattingStats, equals={"Team": "LAD"}, minimums={"PA": 700}
+        )
+
+        assert list(df[mask]["Name"]) == ["Freddie Freeman"]
+
+    def test_maximums(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+
+        mask = filter_mask(df, BattingStats, minimums={"Age": 26}, maximums={"Age": 33})
+        expected = (df["Age"] >= 26) & (df["Age"] <= 33)
+
+        assert list(mask) == list(expected)
+
+    def test_unknown_field_raises(self, batting_stats_fixture):
+        df = pd.DataFrame(batting_stats_fixture)
+
+        with pytest.raises(ValueError, match="Unknown field"):
+            filter_mask(df, BattingStats, minimums={"Bogus": 1})
+
+
+class TestViewPositions:
+    def test_unsorted_unfiltered_view_is_none(self, batting_stats_fixture):
+        season = Season(pd.DataFrame(batting_stats_fixture))
+
+        assert view_positions(season, BattingStats) is None
+
+    def test_filter_keeps_upstream_order(self, batting_stats_fixture):
+        season = Season(pd.DataFrame(batting_stats_fixture))
+
+        positions = view_positions(season, BattingStats, equals={"Team": "LAD"})
+
+        assert list(positions) == [1, 2]
+
+    def test_sort_descending_by_default(self, team_batting_stats_fixture):
+        season = Season(pd.DataFrame(team_batting_stats_fixture))
+
+        positions = view_positions(season, TeamBattingStats, sort_by="HR")
+
+        home_runs = list(season.frame["HR"].iloc[positions])
+        assert home_runs == sorted(season.frame["HR"], reverse=True)
+
+    def test_sort_accepts_attribute_name_for_alias(self, team_batting_stats_fixture):
+        season = Season(pd.DataFrame(team_batting_stats_fixture))
+
+        by_alias = view_positions(season, TeamBattingStats, "wRC+", ascending=True)
+        by_attribute = view_positions(
+            season, TeamBattingStats, "wRC_plus", ascending=True
+        )
+
+        assert list(by_alias) == list(by_attribute)
+
+    def test_sort_then_filter_preserves_order(self, batting_stats_fixture):
+        season = Season(pd.DataFrame(batting_stats_fixture))
+
+        positions = view_positions(
+            season, BattingStats, sort_by="HR", equals={"Team": "LAD"}
+        )
+
+        assert list(season.frame["Name"].iloc[positions]) == [
+            "Mookie Betts",
+            "Freddie Freeman",
+        ]
@@ -0,0 +1,61 @@
+from mlb_mcp_server.search import NameIndex, name_trigrams, normalize_name
+
+NAMES = [
+    "Ronald Acuña Jr.",
+    "Freddie Freeman",
+    "Mookie Betts",
+    "José Ramírez",
+    "Freddy Peralta",
+]
+
+
+class TestNormalizeName:
+    def test_strips_accents_case_and_punctuation(self):
+        assert normalize_name("Ronald Acuña Jr.") == "ronald acuna jr"
+        assert normalize_name("  JOSÉ  Ramírez ") == "jose ramirez"
+
+    def test_trigrams_padded_per_word(self):
+        assert name_trigrams("ab cd") == {"  a", " ab", "ab ", "  c", " cd", "cd "}
+
+
+class TestNameIndex:
+    def test_exact_match_ranks_first(self):
+        index = NameIndex(NAMES)
+
+        results = index.search("jose ramirez")
+
+        assert results[0][0] == 3
+        assert results[0][1] == 2.0
+
+    def test_partial_name(self):
+        index = NameIndex(NAMES)
+
+        assert index.search("acuna")[0][0] == 0
+
+    def test_prefix_matches_several_names(self):
+        index = NameIndex(NAMES)
+
+        positions = [position for position, _ in index.search("fred")]
+
+        assert set(positions) == {1, 4}
+
+    def test_tolerates_typos(self):
+        index = NameIndex(NAMES)
+
+        assert index.search("Mooky Betts")[0][0] == 2
+
+    def test_no_match(self):
+        index = NameIndex(NAMES)
+
+        assert index.search("zzzz") == []
+        assert index.search("...") == []
+
+    def test_limit(self):
+        index = NameIndex(NAMES)
+
+        assert len(index.search("fred", limit=1)) == 1
+
+    def test_missing_names_are_ignored(self):
+        index = NameIndex(["Mookie Betts", None, float("nan")])
+
+        assert index.search("betts") == [(0, 1.5)]
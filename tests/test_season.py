@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from mlb_mcp_server.season import Season
+
+
+class TestOrdering:
+    def test_missing_values_last_in_both_directions(self):
+        season = Season(pd.DataFrame({"WAR": [1.0, None, 3.0, 2.0]}))
+
+        assert list(season.ordering("WAR", ascending=True)) == [0, 3, 2, 1]
+        assert list(season.ordering("WAR", ascending=False)) == [2, 3, 0, 1]
+
+    def test_ties_keep_upstream_order(self):
+        season = Season(pd.DataFrame({"HR": [10, 20, 10, 20]}))
+
+        assert list(season.ordering("HR")) == [1, 3, 0, 2]
+        assert list(season.ordering("HR", ascending=True)) == [0, 2, 1, 3]
+
+    def test_positions_ignore_frame_index(self):
+        season = Season(pd.DataFrame({"HR": [5, 7, 6]}, index=[10, 20, 30]))
+
+        assert list(season.ordering("HR")) == [1, 2, 0]
+
+    def test_ordering_built_once(self):
+        season = Season(pd.DataFrame({"HR": [5, 7, 6]}))
+
+        assert season.ordering("HR") is season.ordering("HR")
+        assert season.ordering("HR") is not season.ordering("HR", ascending=True)
+
+
+class TestRowsFor:
+    def test_returns_matching_positions(self):
+        season = Season(pd.DataFrame({"IDfg": [7, 3, 7, 5]}))
+
+        assert list(season.rows_for("IDfg", 7)) == [0, 2]
+        assert list(season.rows_for("IDfg", 5)) == [3]
+
+    def test_unknown_value_returns_no_rows(self):
+        season = Season(pd.DataFrame({"IDfg": [7, 3]}))
+
+        assert len(season.rows_for("IDfg", 99)) == 0
+
+    def test_index_built_once(self):
+        season = Season(pd.DataFrame({"IDfg": [7, 3]}))
+        season.rows_for("IDfg", 7)
+
+        season.frame = season.frame.iloc[0:0]
+
+        assert list(season.rows_for("IDfg", 3)) == [1]
+
+
+class TestNameIndex:
+    def test_index_built_once(self):
+        season = Season(pd.DataFrame({"Name": ["Mookie Betts", "Aaron Judge"]}))
+
+        assert season.name_index() is season.name_index()
+        assert season.name_index().search("judge")[0][0] == 1
+
+
+class TestAsOf:
+    def test_defaults_to_now(self):
+        before = datetime.now(timezone.utc)
+        season = Season(pd.DataFrame())
+
+        assert before <= season.as_of <= datetime.now(timezone.utc)
+
+    def test_explicit_as_of(self):
+        as_of = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+        assert Season(pd.DataFrame(), as_of=as_of).as_of == as_of
@@ -1,16 +1,44 @@
+import asyncio
+import json
+import threading
 from collections import Counter
+from datetime import date, datetime, timezone
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
+import pydantic_core
 
-from mlb_mcp_server.constants import DIVISION_NAMES
+from mlb_mcp_server.cache import season_cache
+from mlb_mcp_server.constants import (
+    BATCH_MAX_QUERIES,
+    CURSOR_MAX_SNAPSHOTS,
+    DIVISION_NAMES,
+)
+from mlb_mcp_server.cursors import page_cursors
+from mlb_mcp_server.season import Season
 from mlb_mcp_server.server import (
+    BATCH_TOOLS,
+    _lifespan,
+    _warm_seasons,
+    batch_query,
+    batting_stats_by_range,
     batting_stats_by_year,
+    leaderboard,
+    pitching_stats_by_range,
     pitching_stats_by_year,
+    player_career,
+    search_players,
+    season_fetches,
+    server_metrics,
     standings_by_year,
+    team_aggregate,
     team_batting_stats_by_year,
+    team_pitching_stats_by_range,
     team_pitching_stats_by_year,
+    team_report,
 )
+from mlb_mcp_server.upstream import PrioritySlots, upstream
 
 
 class TestBattingStats:
@@ -145,6 +173,30 @@ class TestBattingStats:
         assert "HR" in first_player
         assert len(first_player) <= 7
 
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_field_filtering_by_alias(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batting_stats_by_year(2023, fields="Name,wRC+,K%")
+
+        first_player = result["data"][0]
+        assert "wRC_plus" in first_player
+        assert "K_pct" in first_player
+        assert "unknown_fields" not in result
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_unknown_fields_reported(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batting_stats_by_year(2023, fields="Name,Homers,HR")
+
+        assert result["unknown_fields"] == ["Homers"]
+        assert set(result["data"][0]) == {"IDfg", "Season", "Name", "HR"}
+
     @patch("mlb_mcp_server.server.batting_stats")
     async def test_field_filtering_all(self, mock_batting_stats, batting_stats_fixture):
         mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
@@ -182,6 +234,133 @@ class TestBattingStats:
             assert custom_fields < basic_fields
             assert custom_fields <= 5
 
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_pages_served_from_cache(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        page_1 = await batting_stats_by_year(2023, page=1, page_size=1)
+        page_2 = await batting_stats_by_year(2023, page=2, page_size=1)
+
+        assert page_1["data"][0]["IDfg"] != page_2["data"][0]["IDfg"]
+        mock_batting_stats.assert_called_once_with(2023)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_cache_keyed_by_year(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        await batting_stats_by_year(2022)
+        await batting_stats_by_year(2023)
+
+        assert mock_batting_stats.call_count == 2
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_errors_not_cached(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.side_effect = [
+            Exception("Data fetch error"),
+            pd.DataFrame(batting_stats_fixture),
+        ]
+
+        failed = await batting_stats_by_year(2023)
+        result = await batting_stats_by_year(2023)
+
+        assert failed == {"error": "Data fetch error"}
+        assert result["total_rows"] == len(batting_stats_fixture)
+        assert mock_batting_stats.call_count == 2
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_concurrent_pages_share_one_fetch(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(year):
+            started.set()
+            release.wait(timeout=5)
+            return pd.DataFrame(batting_stats_fixture)
+
+        mock_batting_stats.side_effect = slow_fetch
+
+        tasks = [
+            asyncio.create_task(batting_stats_by_year(2023, page=page, page_size=1))
+            for page in (1, 2, 3)
+        ]
+        await asyncio.to_thread(started.wait, 5)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert [len(r["data"]) for r in results] == [1, 1, 1]
+        mock_batting_stats.assert_called_once_with(2023)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_completed_season_served_from_store(
+        self, mock_batting_stats, batting_stats_fixture, tmp_season_store
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+        first = await batting_stats_by_year(2023)
+
+        # Simulate a restart: empty memory cache and an unreachable upstream
+        season_cache.clear()
+        mock_batting_stats.side_effect = Exception("Network down")
+        second = await batting_stats_by_year(2023)
+
+        assert second == first
+        mock_batting_stats.assert_called_once_with(2023)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_current_season_not_persisted(
+        self, mock_batting_stats, batting_stats_fixture, tmp_season_store
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        await batting_stats_by_year(date.today().year)
+
+        assert list(tmp_season_store.root.rglob("*.arrow")) == []
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_sort_and_filter_before_pagination(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batting_stats_by_year(
+            2023, page_size=1, sort_by="HR", team="LAD", min_pa=600
+        )
+
+        assert result["total_rows"] == 2
+        assert result["total_pages"] == 2
+        assert [p["Name"] for p in result["data"]] == ["Mookie Betts"]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_sorted_pages_slice_one_ordering(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        with patch.object(Season, "ordering", autospec=True) as ordering:
+            ordering.return_value = np.array([2, 0, 1])
+            pages = [
+                await batting_stats_by_year(2023, page=page, page_size=1, sort_by="WAR")
+                for page in (1, 2, 3)
+            ]
+
+        assert [p["data"][0]["Name"] for p in pages] == [
+            "Mookie Betts",
+            "Ronald Acuna Jr.",
+            "Freddie Freeman",
+        ]
+        assert all(call.args[1:] == ("WAR", False) for call in ordering.mock_calls)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_unknown_sort_field(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batting_stats_by_year(2023, sort_by="Bogus")
+
+        assert result == {"error": "Unknown field for BattingStats: Bogus"}
+
 
 class TestPitchingStats:
     @patch("mlb_mcp_server.server.pitching_stats")
@@ -262,6 +441,19 @@ class TestPitchingStats:
         assert "WHIP" in first_player
         assert len(first_player) <= 6
 
+    @patch("mlb_mcp_server.server.pitching_stats")
+    async def test_sort_ascending_with_min_ip(
+        self, mock_pitching_stats, pitching_stats_fixture
+    ):
+        mock_pitching_stats.return_value = pd.DataFrame(pitching_stats_fixture)
+
+        result = await pitching_stats_by_year(
+            2023, sort_by="ERA", ascending=True, min_ip=180
+        )
+
+        assert result["total_rows"] == 2
+        assert [p["Name"] for p in result["data"]] == ["Tarik Skubal", "Zack Wheeler"]
+
 
 class TestTeamBattingStats:
     @patch("mlb_mcp_server.server.team_batting")
@@ -307,6 +499,17 @@ class TestTeamBattingStats:
         assert "W" not in first_team
         assert "WHIP" not in first_team
 
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_sort_by(self, mock_team_batting, team_batting_stats_fixture):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(
+            2023, page_size=30, sort_by="HR", ascending=True
+        )
+
+        home_runs = [team["HR"] for team in result["data"]]
+        assert home_runs == sorted(home_runs)
+
 
 class TestTeamPitchingStats:
     @patch("mlb_mcp_server.server.team_pitching")
@@ -354,52 +557,1135 @@ class TestTeamPitchingStats:
         assert "RBI" not in first_team
 
 
-class TestStandings:
-    @patch("mlb_mcp_server.server.standings")
-    async def test_basic_response(self, mock_standings, standings_fixture):
-        mock_standings.return_value = standings_fixture
+def _multi_season(fixture, years):
+    """Repeat a single-season fixture once per year, as a range call returns it"""
+    frames = [pd.DataFrame(fixture).assign(Season=year) for year in years]
+    return pd.concat(frames, ignore_index=True)
 
-        result = await standings_by_year(2024)
 
-        assert result["year"] == 2024
-        assert result["total_teams"] == 30
-        assert len(result["data"]) == 30
+class TestStatsByRange:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_single_pushed_down_call(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = _multi_season(
+            batting_stats_fixture, [2021, 2022, 2023]
+        )
 
-        first_team = result["data"][0]
-        assert "Tm" in first_team
-        assert "W" in first_team
-        assert "L" in first_team
-        assert "W_L_pct" in first_team
-        assert "GB" in first_team
-        assert "Division" in first_team
+        result = await batting_stats_by_range(2021, 2023, page_size=5)
 
-        mock_standings.assert_called_once_with(2024)
+        assert result["start_year"] == 2021
+        assert result["end_year"] == 2023
+        assert result["total_rows"] == 3 * len(batting_stats_fixture)
+        assert result["total_pages"] == 2
+        assert [r["Season"] for r in result["data"]] == [2021] * 3 + [2022] * 2
+        mock_batting_stats.assert_called_once_with(2021, 2023)
 
-    @patch("mlb_mcp_server.server.standings")
-    async def test_divisions_present(self, mock_standings, standings_fixture):
-        mock_standings.return_value = standings_fixture
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_range_fills_per_year_cache(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = _multi_season(
+            batting_stats_fixture, [2021, 2022]
+        )
+        await batting_stats_by_range(2021, 2022)
 
-        result = await standings_by_year(2024)
+        result = await batting_stats_by_year(2022)
 
-        divisions = {team["Division"] for team in result["data"]}
-        assert divisions == set(DIVISION_NAMES)
+        assert result["total_rows"] == len(batting_stats_fixture)
+        assert {r["Season"] for r in result["data"]} == {2022}
+        mock_batting_stats.assert_called_once_with(2021, 2022)
 
-    @patch("mlb_mcp_server.server.standings")
-    async def test_five_teams_per_division(self, mock_standings, standings_fixture):
-        mock_standings.return_value = standings_fixture
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_only_missing_season_fetched(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.side_effect = lambda year: _multi_season(
+            batting_stats_fixture, [year]
+        )
+        await batting_stats_by_year(2022)
 
-        result = await standings_by_year(2024)
+        result = await batting_stats_by_range(2022, 2023, sort_by="HR", page_size=2)
 
-        division_counts = Counter(team["Division"] for team in result["data"])
-        for division, count in division_counts.items():
-            assert count == 5, f"{division} has {count} teams, expected 5"
+        assert result["total_rows"] == 2 * len(batting_stats_fixture)
+        assert [r["HR"] for r in result["data"]] == [41, 41]
+        assert mock_batting_stats.call_args_list == [((2022,),), ((2023,),)]
 
-    @patch("mlb_mcp_server.server.standings")
-    async def test_exception(self, mock_standings):
-        mock_standings.side_effect = Exception("Data fetch error")
+    @patch("mlb_mcp_server.server.team_pitching")
+    async def test_team_range(self, mock_team_pitching, team_pitching_stats_fixture):
+        mock_team_pitching.return_value = _multi_season(
+            team_pitching_stats_fixture, [2022, 2023]
+        )
 
-        result = await standings_by_year(2024)
+        result = await team_pitching_stats_by_range(
+            2022, 2023, sort_by="ERA", ascending=True, page_size=1
+        )
 
-        assert "error" in result
-        assert result["error"] == "Data fetch error"
-        mock_standings.assert_called_once_with(2024)
+        assert result["total_rows"] == 60
+        best_era = min(team["ERA"] for team in team_pitching_stats_fixture)
+        assert result["data"][0]["ERA"] == best_era
+
+    async def test_invalid_range(self):
+        result = await pitching_stats_by_range(2024, 2023)
+
+        assert result == {
+            "error": "end_year must be greater than or equal to start_year"
+        }
+
+
+class TestStaleWhileRevalidate:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_stale_current_season_served_while_refreshing(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        year = date.today().year
+        old = datetime(year, 4, 1, tzinfo=timezone.utc)
+        stale = Season(pd.DataFrame(batting_stats_fixture[:1]), as_of=old)
+        season_cache.put((mock_batting_stats, year), stale, ttl=0, max_stale=60)
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        results = await asyncio.gather(*(batting_stats_by_year(year) for _ in range(3)))
+
+        assert all(r["total_rows"] == 1 for r in results)
+        assert all(r["as_of"] == old.isoformat(timespec="seconds") for r in results)
+
+        while (mock_batting_stats, year) in season_fetches:
+            await asyncio.sleep(0.01)
+        refreshed = await batting_stats_by_year(year)
+
+        assert refreshed["total_rows"] == len(batting_stats_fixture)
+        assert refreshed["as_of"] > results[0]["as_of"]
+        mock_batting_stats.assert_called_once_with(year)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_failed_refresh_keeps_stale_season(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        year = date.today().year
+        stale = Season(pd.DataFrame(batting_stats_fixture))
+        season_cache.put((mock_batting_stats, year), stale, ttl=0, max_stale=60)
+        mock_batting_stats.side_effect = Exception("FanGraphs is down")
+
+        await batting_stats_by_year(year)
+        while (mock_batting_stats, year) in season_fetches:
+            await asyncio.sleep(0.01)
+        result = await batting_stats_by_year(year)
+
+        assert result["total_rows"] == len(batting_stats_fixture)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_range_as_of_is_oldest_season(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        old = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        season_cache.put(
+            (mock_batting_stats, 2022),
+            Season(pd.DataFrame(batting_stats_fixture), as_of=old),
+            ttl=60,
+        )
+        mock_batting_stats.return_value = _multi_season(batting_stats_fixture, [2023])
+
+        result = await batting_stats_by_range(2022, 2023)
+
+        assert result["as_of"] == "2024-01-01T00:00:00+00:00"
+
+
+class TestColumnarFormat:
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_columnar_page(self, mock_team_batting, team_batting_stats_fixture):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        records = await team_batting_stats_by_year(
+            2023, page_size=30, fields="all", sort_by="HR"
+        )
+        columnar = await team_batting_stats_by_year(
+            2023, page_size=30, fields="all", sort_by="HR", format="columnar"
+        )
+
+        assert "data" not in columnar
+        assert columnar["total_rows"] == records["total_rows"]
+        teams = [
+            dict(zip(columnar["columns"], row))["Team"] for row in columnar["rows"]
+        ]
+        assert teams == [r["Team"] for r in records["data"]]
+        assert len(json.dumps(columnar)) < len(json.dumps(records)) / 2
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_precision(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batting_stats_by_year(2023, fields="WAR,AVG", precision=1)
+
+        for record in result["data"]:
+            assert record["WAR"] == round(record["WAR"], 1)
+            assert record["AVG"] == round(record["AVG"], 1)
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_precision_leaves_integer_fields(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+        expected = {p["IDfg"]: p for p in batting_stats_fixture}
+
+        records = await batting_stats_by_year(2023, fields="HR,WAR", precision=0)
+        columnar = await batting_stats_by_year(
+            2023, fields="HR,WAR", precision=0, format="columnar"
+        )
+
+        rows = records["data"] + [
+            dict(zip(columnar["columns"], row)) for row in columnar["rows"]
+        ]
+        for row in rows:
+            player = expected[row["IDfg"]]
+            assert row["Season"] == player["Season"]
+            assert row["HR"] == player["HR"]
+            assert row["WAR"] == round(player["WAR"])
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_negative_precision(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batting_stats_by_year(2023, precision=-1)
+
+        assert result == {"error": "precision must be non-negative"}
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    async def test_cursor_keeps_format(
+        self, mock_team_pitching, team_pitching_stats_fixture
+    ):
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+
+        first = await team_pitching_stats_by_year(
+            2023, page_size=20, format="columnar", precision=2
+        )
+        second = await team_pitching_stats_by_year(2023, cursor=first["next_cursor"])
+
+        assert second["columns"] == first["columns"]
+        assert len(second["rows"]) == 10
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_empty_columnar_page(self, mock_batting_stats):
+        mock_batting_stats.return_value = pd.DataFrame()
+
+        result = await batting_stats_by_year(2023, format="columnar")
+
+        assert result["columns"] == []
+        assert result["rows"] == []
+
+
+class TestByteBudget:
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_page_fits_budget(
+        self, mock_team_batting, team_batting_stats_fixture
+    ):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(
+            2023, page_size=30, fields="all", max_bytes=8000
+        )
+
+        assert 1 < result["page_size"] < 30
+        assert len(result["data"]) == result["page_size"]
+        assert len(pydantic_core.to_json(result, indent=2)) <= 8000
+        assert "next_cursor" in result
+
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_cursor_walks_every_row(
+        self, mock_team_batting, team_batting_stats_fixture
+    ):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(
+            2023, page_size=30, fields="all", format="columnar", max_bytes=5000
+        )
+        rows = list(result["rows"])
+        while "next_cursor" in result:
+            result = await team_batting_stats_by_year(
+                2023, cursor=result["next_cursor"]
+            )
+            assert len(pydantic_core.to_json(result, indent=2)) <= 5000
+            rows.extend(result["rows"])
+
+        assert len(rows) == 30
+
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_cursor_pages_are_numbered_consecutively(
+        self, mock_team_batting, team_batting_stats_fixture
+    ):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(
+            2023, page_size=30, fields="all", max_bytes=9000
+        )
+        pages = [result]
+        while "next_cursor" in result:
+            result = await team_batting_stats_by_year(
+                2023, cursor=result["next_cursor"]
+            )
+            pages.append(result)
+
+        assert [r["page"] for r in pages] == list(range(1, len(pages) + 1))
+        assert len({r["page_size"] for r in pages}) > 1
+        assert all("total_pages" not in r for r in pages)
+
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_budget_counts_unknown_fields(
+        self, mock_team_batting, team_batting_stats_fixture
+    ):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+        fields = ",".join(["HR"] + [f"unknown_field_{i}" for i in range(20)])
+
+        for max_bytes in (1000, 2000):
+            result = await team_batting_stats_by_year(
+                2023, page_size=30, fields=fields, max_bytes=max_bytes
+            )
+
+            assert len(result["unknown_fields"]) == 20
+            assert len(pydantic_core.to_json(result, indent=2)) <= max_bytes
+
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_returns_one_row_when_none_fit(
+        self, mock_team_batting, team_batting_stats_fixture
+    ):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(2023, fields="all", max_bytes=100)
+
+        assert len(result["data"]) == 1
+        assert result["page_size"] == 1
+
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_page_size_caps_rows(
+        self, mock_team_batting, team_batting_stats_fixture
+    ):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(
+            2023, page_size=5, fields="Team", max_bytes=100_000
+        )
+
+        assert result["page_size"] == 5
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_invalid_page(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        zero_page = await batting_stats_by_year(
+            2023, page=0, page_size=1, max_bytes=500
+        )
+        zero_size = await batting_stats_by_year(2023, page_size=0)
+
+        assert zero_page == {"error": "page must be >= 1"}
+        assert zero_size == {"error": "page_size must be >= 1"}
+
+    @patch("mlb_mcp_server.server.team_batting")
+    async def test_invalid_budget(self, mock_team_batting, team_batting_stats_fixture):
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+
+        result = await team_batting_stats_by_year(2023, max_bytes=0)
+
+        assert "error" in result
+
+
+class TestCursorPagination:
+    @patch("mlb_mcp_server.server.team_pitching")
+    async def test_cursor_walks_pages(
+        self, mock_team_pitching, team_pitching_stats_fixture
+    ):
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+
+        first = await team_pitching_stats_by_year(
+            2023, page_size=12, sort_by="ERA", ascending=True
+        )
+        second = await team_pitching_stats_by_year(2023, cursor=first["next_cursor"])
+        third = await team_pitching_stats_by_year(2023, cursor=second["next_cursor"])
+
+        assert [r["page"] for r in (first, second, third)] == [1, 2, 3]
+        assert len(third["data"]) == 6
+        assert "next_cursor" not in third
+        eras = [team["ERA"] for r in (first, second, third) for team in r["data"]]
+        assert eras == sorted(team["ERA"] for team in team_pitching_stats_fixture)
+        mock_team_pitching.assert_called_once_with(2023)
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    async def test_cursor_pins_snapshot(
+        self, mock_team_pitching, team_pitching_stats_fixture
+    ):
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+        first = await team_pitching_stats_by_year(2023, page_size=15, sort_by="W")
+        expected = await team_pitching_stats_by_year(
+            2023, page=2, page_size=15, sort_by="W"
+        )
+
+        # Upstream data changes and the cached season is refetched
+        season_cache.clear()
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture[:10])
+        second = await team_pitching_stats_by_year(2023, cursor=first["next_cursor"])
+
+        assert second["total_rows"] == 30
+        assert second["data"] == expected["data"]
+        assert mock_team_pitching.call_count == 1
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_cursor_over_range(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = _multi_season(
+            batting_stats_fixture, [2021, 2022, 2023]
+        )
+
+        first = await batting_stats_by_range(2021, 2023, page_size=5)
+        second = await batting_stats_by_range(2021, 2023, cursor=first["next_cursor"])
+
+        assert second["start_year"] == 2021
+        assert second["page"] == 2
+        assert [r["Season"] for r in second["data"]] == [2022] + [2023] * 3
+        assert "next_cursor" not in second
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    async def test_repeated_requests_share_one_snapshot(
+        self, mock_team_pitching, team_pitching_stats_fixture
+    ):
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+        live = await team_pitching_stats_by_year(2023, page_size=10, sort_by="W")
+
+        for _ in range(CURSOR_MAX_SNAPSHOTS + 2):
+            await team_pitching_stats_by_year(2023, page_size=10)
+
+        assert len(page_cursors) == 2
+        resumed = await team_pitching_stats_by_year(2023, cursor=live["next_cursor"])
+        assert resumed["page"] == 2
+
+    async def test_invalid_cursor(self):
+        result = await batting_stats_by_year(2023, cursor="not-a-cursor")
+
+        assert result == {
+            "error": "Cursor is invalid or expired; request the first page again"
+        }
+
+
+class TestPlayerCareer:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_season_lines_across_range(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = _multi_season(
+            batting_stats_fixture, [2021, 2022, 2023]
+        )
+
+        result = await player_career(18401, 2021, 2023)
+
+        assert result["player_id"] == 18401
+        assert result["total_seasons"] == 3
+        assert [r["Season"] for r in result["data"]] == [2021, 2022, 2023]
+        assert {r["Name"] for r in result["data"]} == {"Ronald Acuna Jr."}
+        assert "HR" in result["data"][0]
+        mock_batting_stats.assert_called_once_with(2021, 2023)
+
+    @patch("mlb_mcp_server.server.pitching_stats")
+    async def test_pitching_custom_fields(
+        self, mock_pitching_stats, pitching_stats_fixture
+    ):
+        mock_pitching_stats.return_value = pd.DataFrame(pitching_stats_fixture)
+        player_id = pitching_stats_fixture[1]["IDfg"]
+
+        season = pitching_stats_fixture[1]["Season"]
+
+        result = await player_career(
+            player_id, season, season, stat_type="pitching", fields="ERA"
+        )
+
+        assert result["data"] == [
+            {
+                "IDfg": player_id,
+                "Season": season,
+                "ERA": pitching_stats_fixture[1]["ERA"],
+            }
+        ]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_unknown_player(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await player_career(1, 2023, 2023)
+
+        assert result["total_seasons"] == 0
+        assert result["data"] == []
+
+
+class TestSearchPlayers:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_invalid_stat_type(self, mock_batting_stats):
+        result = await search_players("Judge", 2023, stat_type="pitchng")
+
+        assert result == {"error": "Invalid stat_type: 'pitchng'"}
+        mock_batting_stats.assert_not_called()
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_accent_insensitive_match(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await search_players("ACUÑA", 2023)
+
+        assert result["data"][0] == {
+            "IDfg": 18401,
+            "Name": "Ronald Acuna Jr.",
+            "Team": "ATL",
+            "Season": 2023,
+            "score": 1.5,
+        }
+        mock_batting_stats.assert_called_once_with(2023)
+
+    @patch("mlb_mcp_server.server.pitching_stats")
+    async def test_pitching_search(self, mock_pitching_stats, pitching_stats_fixture):
+        mock_pitching_stats.return_value = pd.DataFrame(pitching_stats_fixture)
+
+        result = await search_players("skubal", 2023, stat_type="pitching")
+
+        assert [r["Name"] for r in result["data"]] == ["Tarik Skubal"]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_no_matches(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await search_players("Babe Ruth", 2023)
+
+        assert result["data"] == []
+
+
+class TestLeaderboard:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_top_k(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await leaderboard("HR", 2023, k=2)
+
+        assert result["stat"] == "HR"
+        assert result["total_qualified"] == 3
+        assert result["data"] == [
+            {
+                "IDfg": 18401,
+                "Season": 2023,
+                "Name": "Ronald Acuna Jr.",
+                "Team": "ATL",
+                "HR": 41,
+            },
+            {
+                "IDfg": batting_stats_fixture[2]["IDfg"],
+                "Season": 2023,
+                "Name": "Mookie Betts",
+                "Team": "LAD",
+                "HR": 39,
+            },
+        ]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_alias_stat_and_qualification(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await leaderboard("wRC+", 2023, k=5, min_pa=700, fields="PA")
+
+        assert result["total_qualified"] == 2
+        assert [r["Name"] for r in result["data"]] == [
+            "Ronald Acuna Jr.",
+            "Freddie Freeman",
+        ]
+        assert "wRC_plus" in result["data"][0]
+        assert "PA" in result["data"][0]
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    async def test_team_ascending(
+        self, mock_team_pitching, team_pitching_stats_fixture
+    ):
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+
+        result = await leaderboard(
+            "ERA", 2023, stat_type="team_pitching", k=3, ascending=True
+        )
+
+        eras = sorted(team["ERA"] for team in team_pitching_stats_fixture)[:3]
+        assert [team["ERA"] for team in result["data"]] == eras
+        assert "teamIDfg" in result["data"][0]
+
+    @patch("mlb_mcp_server.server.pitching_stats")
+    async def test_multi_season(self, mock_pitching_stats, pitching_stats_fixture):
+        mock_pitching_stats.return_value = _multi_season(
+            pitching_stats_fixture, [2022, 2023]
+        )
+
+        result = await leaderboard("SO", 2022, end_year=2023, stat_type="pitching", k=2)
+
+        assert result["end_year"] == 2023
+        assert result["total_qualified"] == 6
+        assert {r["Season"] for r in result["data"]} == {2022, 2023}
+        assert result["data"][0]["SO"] == result["data"][1]["SO"]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_invalid_stat(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        unknown = await leaderboard("Bogus", 2023)
+        not_numeric = await leaderboard("Name", 2023)
+        wrong_threshold = await leaderboard("HR", 2023, min_ip=50)
+
+        assert unknown == {"error": "Unknown field for BattingStats: Bogus"}
+        assert not_numeric == {"error": "Field is not numeric: Name"}
+        assert wrong_threshold == {"error": "Unknown field for BattingStats: IP"}
+
+
+class TestTeamAggregate:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_batting_totals_by_team(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await team_aggregate(2023)
+
+        assert result["total_teams"] == 2
+        lad = next(row for row in result["data"] if row["Team"] == "LAD")
+        players = [p for p in batting_stats_fixture if p["Team"] == "LAD"]
+        assert lad["Players"] == 2
+        assert lad["HR"] == sum(p["HR"] for p in players)
+        assert lad["AVG"] == round(
+            sum(p["H"] for p in players) / sum(p["AB"] for p in players), 3
+        )
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_age_filter(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await team_aggregate(2023, max_age=30)
+
+        lad = next(row for row in result["data"] if row["Team"] == "LAD")
+        assert lad["Players"] == 1
+
+    @patch("mlb_mcp_server.server.pitching_stats")
+    async def test_pitching_sorted_by_rate(
+        self, mock_pitching_stats, pitching_stats_fixture
+    ):
+        mock_pitching_stats.return_value = pd.DataFrame(pitching_stats_fixture)
+
+        result = await team_aggregate(2023, "pitching", sort_by="K/9")
+
+        k_9 = [row["K_9"] for row in result["data"]]
+        assert k_9 == sorted(k_9, reverse=True)
+        assert "ERA" in result["data"][0]
+        assert "WHIP" in result["data"][0]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_unknown_sort_field(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await team_aggregate(2023, sort_by="wRC+")
+
+        assert "Unknown field" in result["error"]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_error_handling(self, mock_batting_stats):
+        mock_batting_stats.side_effect = Exception("API Error")
+
+        result = await team_aggregate(2023)
+
+        assert result == {"error": "API Error"}
+
+
+class TestTeamReport:
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.standings")
+    async def test_joins_all_teams(
+        self,
+        mock_standings,
+        mock_team_batting,
+        mock_team_pitching,
+        standings_fixture,
+        team_batting_stats_fixture,
+        team_pitching_stats_fixture,
+    ):
+        mock_standings.return_value = standings_fixture
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+
+        result = await team_report(2023)
+
+        assert result["total_teams"] == 30
+        assert "unknown_fields" not in result
+        teams = {row["Tm"]: row for row in result["data"]}
+        yankees = teams["New York Yankees"]
+        assert yankees["Team"] == "NYY"
+        assert yankees["teamIDfg"] == 9
+        assert yankees["Division"] == "AL East"
+        assert set(yankees["batting"]) == {
+            "R",
+            "HR",
+            "AVG",
+            "OBP",
+            "SLG",
+            "wRC_plus",
+            "WAR",
+        }
+        assert set(yankees["pitching"]) == {"ERA", "FIP", "WHIP", "K_9", "BB_9", "WAR"}
+        assert all(row["batting"] and row["pitching"] for row in result["data"])
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.standings")
+    async def test_team_filter_and_fields(
+        self,
+        mock_standings,
+        mock_team_batting,
+        mock_team_pitching,
+        standings_fixture,
+        team_batting_stats_fixture,
+        team_pitching_stats_fixture,
+    ):
+        mock_standings.return_value = standings_fixture
+        mock_team_batting.return_value = pd.DataFrame(team_batting_stats_fixture)
+        mock_team_pitching.return_value = pd.DataFrame(team_pitching_stats_fixture)
+
+        by_abbreviation = await team_report(2023, team="lad", batting_fields="HR,nope")
+        by_name = await team_report(2023, team="Los Angeles Dodgers")
+
+        assert by_abbreviation["total_teams"] == 1
+        assert by_abbreviation["data"][0]["Tm"] == "Los Angeles Dodgers"
+        assert by_abbreviation["data"][0]["batting"] == {
+            "HR": next(
+                t["HR"] for t in team_batting_stats_fixture if t["Team"] == "LAD"
+            )
+        }
+        assert by_abbreviation["unknown_fields"] == ["nope"]
+        assert by_name["data"][0]["Team"] == "LAD"
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.standings")
+    async def test_fetches_run_concurrently(
+        self,
+        mock_standings,
+        mock_team_batting,
+        mock_team_pitching,
+        standings_fixture,
+        team_batting_stats_fixture,
+        team_pitching_stats_fixture,
+    ):
+        # Each fetch waits for the other two, so a sequential load would fail
+        barrier = threading.Barrier(3, timeout=5)
+
+        def meet(value):
+            def fetch(year):
+                barrier.wait()
+                return value
+
+            return fetch
+
+        mock_standings.side_effect = meet(standings_fixture)
+        mock_team_batting.side_effect = meet(pd.DataFrame(team_batting_stats_fixture))
+        mock_team_pitching.side_effect = meet(pd.DataFrame(team_pitching_stats_fixture))
+
+        result = await team_report(2023)
+
+        assert result["total_teams"] == 30
+
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.standings")
+    async def test_error_handling(
+        self, mock_standings, mock_team_batting, mock_team_pitching, standings_fixture
+    ):
+        mock_standings.return_value = standings_fixture
+        mock_team_batting.side_effect = Exception("API Error")
+
+        result = await team_report(2023)
+
+        assert result == {"error": "API Error"}
+
+
+class TestBatchQuery:
+    @patch("mlb_mcp_server.server.standings")
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_results_in_order_with_shared_fetch(
+        self,
+        mock_batting_stats,
+        mock_standings,
+        batting_stats_fixture,
+        standings_fixture,
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+        mock_standings.return_value = standings_fixture
+
+        result = await batch_query(
+            [
+                {"tool": "batting_stats_by_year", "arguments": {"year": 2023}},
+                {"tool": "standings_by_year", "arguments": {"year": 2023}},
+                {
+                    "tool": "batting_stats_by_year",
+                    "arguments": {"year": 2023, "page_size": 1, "sort_by": "HR"},
+                },
+            ]
+        )
+
+        assert result["total_queries"] == 3
+        assert result["executed"] == 3
+        first, second, third = result["results"]
+        assert first["total_rows"] == len(batting_stats_fixture)
+        assert second["total_teams"] == 30
+        assert len(third["data"]) == 1
+        # Both batting queries read the one 2023 season
+        mock_batting_stats.assert_called_once()
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_identical_queries_run_once(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+        query = {"tool": "leaderboard", "arguments": {"year": 2023, "stat": "HR"}}
+
+        result = await batch_query([query, dict(query)])
+
+        assert result["executed"] == 1
+        assert result["results"][0] == result["results"][1]
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_per_item_errors(self, mock_batting_stats, batting_stats_fixture):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batch_query(
+            [
+                {"tool": "server_metrics"},
+                {"tool": "batting_stats_by_year", "arguments": {"page": 2}},
+                "batting_stats_by_year",
+                {"tool": "batting_stats_by_year", "arguments": {"year": 2023}},
+            ]
+        )
+
+        unknown, bad_arguments, malformed, ok = result["results"]
+        assert "Unknown tool" in unknown["error"]
+        assert bad_arguments["error"].startswith("batting_stats_by_year: ")
+        assert "year" in bad_arguments["error"]
+        assert "error" in malformed
+        assert "error" not in ok
+        assert result["executed"] == 1
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_arguments_validated_like_a_direct_call(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+
+        result = await batch_query(
+            [
+                {
+                    "tool": "leaderboard",
+                    "arguments": {"stat": "HR", "year": 2023, "stat_type": "pitchingg"},
+                },
+                {"tool": "batting_stats_by_year", "arguments": {"year": 2023}},
+                {
+                    "tool": "batting_stats_by_year",
+                    "arguments": {"year": "2023", "page": 1, "format": "records"},
+                },
+            ]
+        )
+
+        bad_literal, by_int, by_string = result["results"]
+        assert bad_literal["error"].startswith("leaderboard: ")
+        assert "stat_type" in bad_literal["error"]
+        # "2023" is converted to 2023, and spelled-out defaults change nothing
+        assert by_string == by_int
+        assert by_int["year"] == 2023
+        assert result["executed"] == 1
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_failing_query_does_not_affect_others(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        def fetch(year, *args, **kwargs):
+            if year == 2022:
+                raise Exception("API Error")
+            return pd.DataFrame(batting_stats_fixture)
+
+        mock_batting_stats.side_effect = fetch
+
+        result = await batch_query(
+            [
+                {"tool": "batting_stats_by_year", "arguments": {"year": 2022}},
+                {"tool": "batting_stats_by_year", "arguments": {"year": 2023}},
+            ]
+        )
+
+        assert result["results"][0] == {"error": "API Error"}
+        assert result["results"][1]["year"] == 2023
+
+    async def test_concurrency_is_capped(self, monkeypatch):
+        running = 0
+        peak = 0
+
+        async def slow(year):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"year": year}
+
+        monkeypatch.setitem(BATCH_TOOLS, "standings_by_year", slow)
+        monkeypatch.setattr("mlb_mcp_server.server.BATCH_CONCURRENCY", 2)
+
+        result = await batch_query(
+            [
+                {"tool": "standings_by_year", "arguments": {"year": year}}
+                for year in range(2010, 2016)
+            ]
+        )
+
+        assert [r["year"] for r in result["results"]] == list(range(2010, 2016))
+        assert peak == 2
+
+    async def test_too_many_queries(self):
+        query = {"tool": "standings_by_year", "arguments": {"year": 2023}}
+
+        result = await batch_query([query] * (BATCH_MAX_QUERIES + 1))
+
+        assert "Too many queries" in result["error"]
+
+
+class TestWarmSeasons:
+    @patch("mlb_mcp_server.server.standings")
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.pitching_stats")
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_warms_every_source(
+        self,
+        mock_batting_stats,
+        mock_pitching_stats,
+        mock_team_batting,
+        mock_team_pitching,
+        mock_standings,
+        batting_stats_fixture,
+        standings_fixture,
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+        for mock in (mock_pitching_stats, mock_team_batting, mock_team_pitching):
+            mock.return_value = pd.DataFrame()
+        mock_standings.return_value = standings_fixture
+
+        loaded = await _warm_seasons([2022, 2023])
+
+        assert loaded == 10
+        assert len(season_cache) == 10
+        await batting_stats_by_year(2023)
+        await standings_by_year(2022)
+        assert mock_batting_stats.call_count == 2
+        assert mock_standings.call_count == 2
+
+    @patch("mlb_mcp_server.server.standings")
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.pitching_stats")
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_failing_source_is_skipped(
+        self,
+        mock_batting_stats,
+        mock_pitching_stats,
+        mock_team_batting,
+        mock_team_pitching,
+        mock_standings,
+        standings_fixture,
+    ):
+        for mock in (mock_batting_stats, mock_team_batting, mock_team_pitching):
+            mock.return_value = pd.DataFrame()
+        mock_pitching_stats.side_effect = Exception("FanGraphs is down")
+        mock_standings.return_value = standings_fixture
+
+        loaded = await _warm_seasons([2023])
+
+        assert loaded == 4
+
+    @patch("mlb_mcp_server.server.standings")
+    @patch("mlb_mcp_server.server.team_pitching")
+    @patch("mlb_mcp_server.server.team_batting")
+    @patch("mlb_mcp_server.server.pitching_stats")
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_refresh_refetches_only_current_season(
+        self,
+        mock_batting_stats,
+        mock_pitching_stats,
+        mock_team_batting,
+        mock_team_pitching,
+        mock_standings,
+        standings_fixture,
+    ):
+        for mock in (mock_pitching_stats, mock_team_batting, mock_team_pitching):
+            mock.return_value = pd.DataFrame()
+        mock_batting_stats.return_value = pd.DataFrame()
+        mock_standings.return_value = standings_fixture
+        current = date.today().year
+        await _warm_seasons([current, current - 1])
+
+        await _warm_seasons([current, current - 1], refresh=True)
+
+        assert mock_batting_stats.call_args_list == [
+            ((current,),),
+            ((current - 1,),),
+            ((current,),),
+        ]
+
+
+class TestUpstreamAdmission:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_full_queue_returns_error(self, mock_batting_stats, monkeypatch):
+        monkeypatch.setattr(upstream, "_slots", {"fangraphs": PrioritySlots(0, 0)})
+
+        result = await batting_stats_by_year(2023)
+
+        assert result == {
+            "error": "Too many pending requests to fangraphs; try again shortly"
+        }
+        mock_batting_stats.assert_not_called()
+
+
+class TestServerMetrics:
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_reports_stages_and_upstream_calls(
+        self, mock_batting_stats, batting_stats_fixture
+    ):
+        mock_batting_stats.return_value = pd.DataFrame(batting_stats_fixture)
+        await batting_stats_by_year(2023, sort_by="HR")
+        await batting_stats_by_year(2023, sort_by="HR")
+
+        result = await server_metrics()
+
+        stages = {
+            s["stage"]: s["count"]
+            for s in result["stages"]
+            if s["tool"] == "batting_stats_by_year"
+        }
+        assert stages == {
+            "total": 2,
+            "load": 2,
+            "filter_sort": 2,
+            "project": 2,
+            "convert": 2,
+            "upstream_wait": 1,
+            "upstream": 1,
+        }
+        assert result["upstream"] == [{"source": "fangraphs", "calls": 1, "errors": 0}]
+        assert result["payload_bytes"][0]["tool"] == "batting_stats_by_year"
+        assert result["payload_bytes"][0]["count"] == 2
+
+    @patch("mlb_mcp_server.server.batting_stats")
+    async def test_counts_upstream_and_tool_errors(self, mock_batting_stats):
+        mock_batting_stats.side_effect = Exception("FanGraphs is down")
+
+        await batting_stats_by_year(2023)
+        result = await server_metrics()
+
+        assert result["tool_errors"] == {"batting_stats_by_year": 1}
+        assert result["upstream"] == [{"source": "fangraphs", "calls": 1, "errors": 1}]
+
+
+class TestLifespan:
+    async def test_startup_does_not_wait_for_warm_up(self, monkeypatch):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_warm(years, refresh=False):
+            started.set()
+            await release.wait()
+
+        monkeypatch.setattr("mlb_mcp_server.server.WARMUP_SEASONS", 2)
+        monkeypatch.setattr("mlb_mcp_server.server._warm_seasons", slow_warm)
+
+        async with _lifespan(None):
+            await asyncio.wait_for(started.wait(), timeout=1)
+        # Leaving the lifespan cancels the still-running warm-up
+
+    async def test_preloads_pybaseball_in_background(self, monkeypatch):
+        preloaded = threading.Event()
+        monkeypatch.setattr("mlb_mcp_server.server.WARMUP_SEASONS", 0)
+        monkeypatch.setattr("mlb_mcp_server.server.preload", preloaded.set)
+
+        async with _lifespan(None):
+            assert await asyncio.to_thread(preloaded.wait, 1)
+
+    async def test_warm_up_disabled(self, monkeypatch):
+        calls = []
+
+        async def warm(years, refresh=False):
+            calls.append(years)
+
+        monkeypatch.setattr("mlb_mcp_server.server.WARMUP_SEASONS", 0)
+        monkeypatch.setattr("mlb_mcp_server.server._warm_seasons", warm)
+
+        async with _lifespan(None):
+            await asyncio.sleep(0.01)
+
+        assert calls == []
+
+
+class TestStandings:
+    @patch("mlb_mcp_server.server.standings")
+    async def test_basic_response(self, mock_standings, standings_fixture):
+        mock_standings.return_value = standings_fixture
+
+        result = await standings_by_year(2024)
+
+        assert result["year"] == 2024
+        assert result["total_teams"] == 30
+        assert len(result["data"]) == 30
+
+        first_team = result["data"][0]
+        assert "Tm" in first_team
+        assert "W" in first_team
+        assert "L" in first_team
+        assert "W_L_pct" in first_team
+        assert "GB" in first_team
+        assert "Division" in first_team
+
+        mock_standings.assert_called_once_with(2024)
+
+    @patch("mlb_mcp_server.server.standings")
+    async def test_divisions_present(self, mock_standings, standings_fixture):
+        mock_standings.return_value = standings_fixture
+
+        result = await standings_by_year(2024)
+
+        divisions = {team["Division"] for team in result["data"]}
+        assert divisions == set(DIVISION_NAMES)
+
+    @patch("mlb_mcp_server.server.standings")
+    async def test_five_teams_per_division(self, mock_standings, standings_fixture):
+        mock_standings.return_value = standings_fixture
+
+        result = await standings_by_year(2024)
+
+        division_counts = Counter(team["Division"] for team in result["data"])
+        for division, count in division_counts.items():
+            assert count == 5, f"{division} has {count} teams, expected 5"
+
+    @patch("mlb_mcp_server.server.standings")
+    async def test_exception(self, mock_standings):
+        mock_standings.side_effect = Exception("Data fetch error")
+
+        result = await standings_by_year(2024)
+
+        assert "error" in result
+        assert result["error"] == "Data fetch error"
+        mock_standings.assert_called_once_with(2024)
+
+    @patch("mlb_mcp_server.server.standings")
+    async def test_completed_season_served_from_store(
+        self, mock_standings, standings_fixture, tmp_season_store
+    ):
+        mock_standings.return_value = standings_fixture
+        first = await standings_by_year(2024)
+
+        season_cache.clear()
+        mock_standings.side_effect = Exception("Network down")
+        second = await standings_by_year(2024)
+
+        assert second == first
+        mock_standings.assert_called_once()
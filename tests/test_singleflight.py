@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from mlb_mcp_server.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_fetch(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "season"
+
+        tasks = [asyncio.create_task(flight.run("key", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["season"] * 5
+        assert calls == 1
+        assert len(flight) == 0
+
+    async def test_distinct_keys_fetch_independently(self):
+        flight = SingleFlight()
+
+        async def fetch(value):
+            return value
+
+        results = await asyncio.gather(
+            flight.run("a", lambda: fetch(1)), flight.run("b", lambda: fetch(2))
+        )
+
+        assert results == [1, 2]
+
+    async def test_cancelled_caller_does_not_cancel_fetch(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "season"
+
+        first = asyncio.create_task(flight.run("key", fetch))
+        second = asyncio.create_task(flight.run("key", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "season"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_exception_shared_and_not_retained(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(
+            flight.run("key", fetch), flight.run("key", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert calls == 1
+
+        # A later call starts a fresh fetch
+        with pytest.raises(ValueError):
+            await flight.run("key", fetch)
+        assert calls == 2
+
+    async def test_start_does_not_wait(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "season"
+
+        future = flight.start("key", fetch)
+
+        assert "key" in flight
+        assert flight.start("key", fetch) is future
+        release.set()
+        assert await flight.run("key", fetch) == "season"
+        assert "key" not in flight
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from mlb_mcp_server.sources import batting_stats, standings
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+class TestSources:
+    @patch("pybaseball.batting_stats")
+    def test_wrapper_calls_pybaseball(self, mock_batting_stats):
+        frame = pd.DataFrame({"HR": [1]})
+        mock_batting_stats.return_value = frame
+
+        assert batting_stats(2023, qual=0) is frame
+        mock_batting_stats.assert_called_once_with(2023, qual=0)
+
+    @patch("pybaseball.standings")
+    def test_standings_wrapper(self, mock_standings):
+        mock_standings.return_value = []
+
+        assert standings(2023) == []
+
+    def test_server_import_defers_pybaseball(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, mlb_mcp_server.server; print('pybaseball' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
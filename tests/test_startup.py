@@ -0,0 +1,49 @@
+import io
+
+from mlb_mcp_server.startup import StartupTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupTimer:
+    def test_mark_reports_time_since_start(self):
+        clock = FakeClock()
+        stream = io.StringIO()
+        timer = StartupTimer(True, 1.0, stream, clock)
+
+        clock.now = 1.25
+        timer.mark("server started")
+        timer.mark("pybaseball imported", 0.5)
+
+        assert stream.getvalue().splitlines() == [
+            "startup: server started at 0.250s",
+            "startup: pybaseball imported at 0.250s (took 0.500s)",
+        ]
+
+    def test_only_first_call_of_each_tool(self):
+        stream = io.StringIO()
+        timer = StartupTimer(True, 0.0, stream, FakeClock())
+
+        timer.tool_call("batting_stats_by_year", 1.5)
+        timer.tool_call("batting_stats_by_year", 0.1)
+        timer.tool_call("standings_by_year", 0.2)
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("startup: first batting_stats_by_year call")
+        assert lines[0].endswith("(took 1.500s)")
+
+    def test_disabled_timer_is_silent(self):
+        stream = io.StringIO()
+        timer = StartupTimer(False, 0.0, stream)
+
+        timer.mark("server started")
+        timer.tool_call("standings_by_year", 0.2)
+
+        assert stream.getvalue() == ""
@@ -0,0 +1,43 @@
+import pandas as pd
+
+from mlb_mcp_server.store import SeasonStore
+
+
+class TestSeasonStore:
+    def test_round_trip(self, tmp_path, batting_stats_fixture):
+        store = SeasonStore(tmp_path)
+        df = pd.DataFrame(batting_stats_fixture)
+
+        assert store.save("BattingStats", 2023, df)
+        loaded = store.load("BattingStats", 2023)
+
+        assert (tmp_path / "BattingStats" / "2023.arrow").exists()
+        pd.testing.assert_frame_equal(loaded, df, check_dtype=False)
+
+    def test_missing_season_returns_none(self, tmp_path):
+        store = SeasonStore(tmp_path)
+
+        assert store.load("BattingStats", 2023) is None
+
+    def test_disabled_store(self, batting_stats_fixture):
+        store = SeasonStore(None)
+
+        assert not store.enabled
+        assert not store.save("BattingStats", 2023, pd.DataFrame(batting_stats_fixture))
+        assert store.load("BattingStats", 2023) is None
+
+    def test_unrepresentable_frame_not_saved(self, tmp_path):
+        store = SeasonStore(tmp_path)
+        df = pd.DataFrame({"Pos": ["SS", 1.5]}, dtype=object)
+
+        assert not store.save("BattingStats", 2023, df)
+        assert store.load("BattingStats", 2023) is None
+        assert list(tmp_path.rglob("*")) == []
+
+    def test_corrupt_file_treated_as_miss(self, tmp_path):
+        store = SeasonStore(tmp_path)
+        path = store.path("BattingStats", 2023)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not an arrow file")
+
+        assert store.load("BattingStats", 2023) is None
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+
+import pytest
+
+from mlb_mcp_server.upstream import (
+    BACKGROUND,
+    INTERACTIVE,
+    PrioritySlots,
+    UpstreamBusyError,
+    UpstreamExecutor,
+    background_priority,
+)
+
+
+class TestPrioritySlots:
+    async def test_interactive_waiter_jumps_background(self):
+        slots = PrioritySlots(limit=1, max_waiting=10)
+        await slots.acquire()
+        admitted = []
+
+        async def waiter(name, priority):
+            await slots.acquire(priority)
+            admitted.append(name)
+
+        tasks = [
+            asyncio.create_task(waiter("prefetch", BACKGROUND)),
+            asyncio.create_task(waiter("tool", INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        slots.release()
+        await asyncio.sleep(0)
+        slots.release()
+        await asyncio.gather(*tasks)
+
+        assert admitted == ["tool", "prefetch"]
+        assert slots.active == 1
+
+    async def test_rejects_when_queue_full(self):
+        slots = PrioritySlots(limit=1, max_waiting=1)
+        await slots.acquire()
+        waiting = asyncio.create_task(slots.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(UpstreamBusyError):
+            await slots.acquire()
+
+        waiting.cancel()
+
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        slots = PrioritySlots(limit=1, max_waiting=10)
+        await slots.acquire()
+        cancelled = asyncio.create_task(slots.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        assert slots.waiting == 0
+        slots.release()
+        assert slots.active == 0
+
+
+class TestUpstreamExecutor:
+    async def test_runs_on_dedicated_threads(self):
+        executor = UpstreamExecutor(limits={"fangraphs": 2})
+
+        name = await executor.run("fangraphs", lambda: threading.current_thread().name)
+
+        assert name.startswith("pybaseball")
+        executor.shutdown()
+
+    async def test_per_source_limit(self):
+        executor = UpstreamExecutor(limits={"fangraphs": 2, "baseball-reference": 1})
+        lock = threading.Lock()
+        running = {"fangraphs": 0}
+        peak = {"fangraphs": 0}
+
+        def fetch(source):
+            with lock:
+                running[source] += 1
+                peak[source] = max(peak[source], running[source])
+            threading.Event().wait(0.02)
+            with lock:
+                running[source] -= 1
+            return source
+
+        results = await asyncio.gather(
+            *(executor.run("fangraphs", fetch, "fangraphs") for _ in range(6))
+        )
+
+        assert results == ["fangraphs"] * 6
+        assert peak["fangraphs"] == 2
+        executor.shutdown()
+
+    async def test_busy_source_rejects_new_calls(self):
+        executor = UpstreamExecutor(limits={"fangraphs": 1}, max_waiting=0)
+        release = threading.Event()
+        first = asyncio.create_task(executor.run("fangraphs", release.wait))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(UpstreamBusyError, match="fangraphs"):
+            await executor.run("fangraphs", lambda: None)
+
+        release.set()
+        await first
+        executor.shutdown()
+
+    async def test_background_priority_context(self):
+        executor = UpstreamExecutor(limits={"fangraphs": 1})
+        release = threading.Event()
+        first = asyncio.create_task(executor.run("fangraphs", release.wait))
+        await asyncio.sleep(0.01)
+        order = []
+
+        def record(name):
+            order.append(name)
+
+        with background_priority():
+            prefetch = asyncio.create_task(
+                executor.run("fangraphs", record, "prefetch")
+            )
+        tool = asyncio.create_task(executor.run("fangraphs", record, "tool"))
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(first, prefetch, tool)
+
+        assert order == ["tool", "prefetch"]
+        executor.shutdown()